@@ -1,22 +1,39 @@
 """
 Unreal MCP Agent — Multi-Model CLI Launcher.
 
-Run with one of three LLM backends:
+Run with one of three LLM backends, or route across all of them:
 
     python agent.py groq                    ← Full demo prompt
     python agent.py gemini --test           ← Quick test (1 API call only)
     python agent.py groq --interactive      ← Chat mode (type commands)
+    python agent.py router                  ← Hedged across all backends
+    python agent.py ollama --startup-report ← Where startup time went
 
 Or run a backend directly:
 
     python -m agents.groq_agent
     python -m agents.ollama_agent --model qwen2.5:72b
     python -m agents.gemini_agent --model gemini-2.5-flash
+    python -m agents.router_agent --order groq,ollama --hedge-after 3
 """
 
 import asyncio
+import importlib
 import sys
 
+from unreal_mcp.utils.startup import StartupTimer
+
+timer = StartupTimer()
+
+# backend → (module providing create_llm(), label).  Only the chosen module
+# is imported, and each imports its provider SDK (slow) inside create_llm().
+BACKENDS = {
+    "groq":   ("agents.groq_agent", "Llama 3.1 8B via Groq (free tier)"),
+    "ollama": ("agents.ollama_agent", "llama3.3:70b via Ollama (local)"),
+    "gemini": ("agents.gemini_agent", "gemini-2.5-pro via Google Gemini"),
+    "router": ("agents.router_agent", None),
+}
+
 
 def print_usage():
     print("""
@@ -30,11 +47,16 @@ def print_usage():
 ║    groq     Groq Cloud  — Llama 3.3 70B (fast, free tier)    ║
 ║    ollama   Local       — 70B+ models on your GPU            ║
 ║    gemini   Google      — Gemini 2.5 Pro (100B+ estimated)   ║
+║    router   All three   — hedged, with failover              ║
 ║                                                              ║
 ║  Options:                                                    ║
 ║    --test          Quick test (1 API call, lists actors)      ║
 ║    --interactive   Chat mode (type commands one by one)       ║
 ║    --prompt "..."  Custom prompt                              ║
+║    --no-fast-path  Send simple commands to the LLM too        ║
+║    --stream        Live tokens + time-to-first-token          ║
+║    --memory-budget N  Chat memory size in tokens (0 = off)    ║
+║    --startup-report   Show where startup time went            ║
 ║                                                              ║
 ║  Examples:                                                   ║
 ║    python agent.py groq                                      ║
@@ -47,17 +69,25 @@ def print_usage():
 
 
 def parse_options():
-    """Parse --test, --interactive, and --prompt flags."""
+    """Parse --test, --interactive, --prompt, --no-fast-path, --stream and --memory-budget."""
     test_mode = "--test" in sys.argv
     interactive = "--interactive" in sys.argv or "-i" in sys.argv
+    fast_path = "--no-fast-path" not in sys.argv
+    stream = "--stream" in sys.argv
     prompt = None
+    memory_budget = None
 
     if "--prompt" in sys.argv:
         idx = sys.argv.index("--prompt")
         if idx + 1 < len(sys.argv):
             prompt = sys.argv[idx + 1]
 
-    return test_mode, interactive, prompt
+    if "--memory-budget" in sys.argv:
+        idx = sys.argv.index("--memory-budget")
+        if idx + 1 < len(sys.argv):
+            memory_budget = int(sys.argv[idx + 1])
+
+    return test_mode, interactive, prompt, fast_path, stream, memory_budget
 
 
 async def main():
@@ -66,37 +96,41 @@ async def main():
         sys.exit(1)
 
     backend = sys.argv[1].lower()
-    test_mode, interactive, custom_prompt = parse_options()
+    if backend not in BACKENDS:
+        print(f"❌ Unknown backend: '{backend}'")
+        print_usage()
+        sys.exit(1)
+    test_mode, interactive, custom_prompt, fast_path, stream, memory_budget = parse_options()
+
+    module_name, label = BACKENDS[backend]
+    with timer.phase(f"import {module_name}"):
+        module = importlib.import_module(module_name)
+    with timer.phase("import agent runtime"):
+        from agents.base import run_agent, TEST_PROMPT, MEMORY_TOKEN_BUDGET
+    with timer.phase(f"create {backend} LLM"):
+        llm = module.create_llm()
+
+    if label is None:  # the router names the backends it managed to build
+        label = f"router ({' → '.join(name for name, _ in llm.backends)})"
+    # Only hosted free tiers need client-side pacing
+    rate_limits = getattr(module, "RATE_LIMITS", None)
 
     # Determine prompt
-    from agents.base import run_agent, TEST_PROMPT
     if test_mode:
         prompt = TEST_PROMPT
         interactive = False
     else:
         prompt = custom_prompt  # None = use DEFAULT_PROMPT
 
-    if backend == "groq":
-        from agents.groq_agent import create_llm
-        llm = create_llm()
-        label = "Llama 3.1 8B via Groq (free tier)"
-
-    elif backend == "ollama":
-        from agents.ollama_agent import create_llm
-        llm = create_llm()
-        label = "llama3.3:70b via Ollama (local)"
-
-    elif backend == "gemini":
-        from agents.gemini_agent import create_llm
-        llm = create_llm()
-        label = "gemini-2.5-pro via Google Gemini"
+    if memory_budget is None:
+        memory_budget = MEMORY_TOKEN_BUDGET
 
-    else:
-        print(f"❌ Unknown backend: '{backend}'")
-        print_usage()
-        sys.exit(1)
+    if "--startup-report" in sys.argv:
+        print(timer.report())
 
-    await run_agent(llm, model_label=label, prompt=prompt, interactive=interactive)
+    await run_agent(llm, model_label=label, prompt=prompt, interactive=interactive,
+                    fast_path=fast_path, stream=stream, memory_budget=memory_budget,
+                    rate_limits=rate_limits)
 
 
 if __name__ == "__main__":
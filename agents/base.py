@@ -3,23 +3,60 @@ Base Agent Runner — shared MCP connection + agent execution logic.
 
 Every backend (Groq, Ollama, Gemini) calls `run_agent()` with its
 own LLM instance.  The MCP connection, tool loading, and execution
-loop are identical across backends.
+loop are identical across backends.  One MCP session per server is
+held open for the whole run (see `agents/session.py`).
 """
 
 import asyncio
+import os
 import sys
-from langchain_mcp_adapters.client import MultiServerMCPClient
+import time
 from langchain.agents import create_agent
 from langchain_core.messages import HumanMessage
 
+from agents.fastpath import FastPath
+from agents.memory import ConversationMemory
+from agents.ratelimit import RateLimitedChatModel, RateLimiter
+from agents.session import MCPSessionManager
+from agents.streaming import stream_turn
+from unreal_mcp.config import SERVER_HOST, SERVER_PORT, SERVER_TRANSPORT
+
 
 # ── MCP Server Configuration ─────────────────────────────────────────
-MCP_SERVER_CONFIG = {
-    "UnrealMCP": {
-        "transport": "sse",
-        "url": "http://localhost:8000/sse",
+# Follows the server's transport settings (UNREAL_MCP_TRANSPORT etc.)
+if SERVER_TRANSPORT == "sse":
+    MCP_SERVER_CONFIG = {
+        "UnrealMCP": {
+            "transport": "sse",
+            "url": f"http://{SERVER_HOST}:{SERVER_PORT}/sse",
+        }
+    }
+else:
+    MCP_SERVER_CONFIG = {
+        "UnrealMCP": {
+            "transport": "streamable_http",
+            "url": f"http://{SERVER_HOST}:{SERVER_PORT}/mcp",
+        }
     }
-}
+
+# With several Unreal editors behind the server, UNREAL_MCP_SHARD pins
+# this agent's calls to one of them (otherwise its MCP session decides).
+if os.getenv("UNREAL_MCP_SHARD"):
+    MCP_SERVER_CONFIG["UnrealMCP"]["headers"] = {"X-Unreal-Shard": os.environ["UNREAL_MCP_SHARD"]}
+
+# Independent tool calls from one model message run concurrently up to
+# this limit; calls that target the same actor still run in order.
+MAX_PARALLEL_TOOL_CALLS = 4
+
+# Results of read-only tools (readOnlyHint in their registration) are
+# reused for this many seconds; any mutating tool call clears them.
+TOOL_CACHE_TTL = 30.0
+TOOL_CACHE_SIZE = 128
+
+# Interactive mode remembers earlier turns up to this many (estimated)
+# tokens; the most recent turns are always kept verbatim.
+MEMORY_TOKEN_BUDGET = 4000
+MEMORY_RECENT_TURNS = 2
 
 # ── Default prompts ───────────────────────────────────────────────────
 DEFAULT_PROMPT = (
@@ -33,7 +70,17 @@ DEFAULT_PROMPT = (
 TEST_PROMPT = "List all actors currently in the Unreal level."
 
 
-async def run_agent(llm, model_label: str, prompt: str = None, interactive: bool = False):
+async def run_agent(
+    llm,
+    model_label: str,
+    prompt: str = None,
+    interactive: bool = False,
+    fast_path: bool = True,
+    stream: bool = False,
+    memory_budget: int = MEMORY_TOKEN_BUDGET,
+    rate_limits: dict = None,
+    mcp_config: dict = None,
+) -> dict:
     """
     Connect to the MCP server, load tools, create a LangChain agent,
     and execute the given prompt.
@@ -43,35 +90,101 @@ async def run_agent(llm, model_label: str, prompt: str = None, interactive: bool
         model_label:  Human-readable name for logging.
         prompt:       The instruction to send. Falls back to DEFAULT_PROMPT.
         interactive:  If True, enter a loop where the user types commands.
+        fast_path:    Answer simple commands ("spawn a cube at 0 0 200")
+                      by calling the tool directly, without the LLM.
+        stream:       Print tokens and tool events as they arrive and
+                      report time-to-first-token per turn.
+        memory_budget: Token budget for the interactive conversation
+                      memory (0 starts every turn fresh).
+        rate_limits:  `RateLimiter` arguments (e.g. requests_per_minute,
+                      tokens_per_minute); requests are paced to stay under
+                      them and 429s are retried with backoff.
+        mcp_config:   MCP servers to connect to (defaults to MCP_SERVER_CONFIG).
+
+    Returns:
+        The MCP session stats for the run (`MCPSessionManager.stats()`).
     """
     print(f"🤖 Booting up {model_label} and connecting to Unreal Engine...")
 
-    client = MultiServerMCPClient(MCP_SERVER_CONFIG)
-    tools = await client.get_tools()
-    print(f"🛠️  Loaded {len(tools)} tools from FastMCP.")
+    limiter = None
+    if rate_limits:
+        limiter = RateLimiter(**rate_limits)
+        llm = RateLimitedChatModel.wrap(llm, limiter)
+
+    sessions = MCPSessionManager(
+        mcp_config or MCP_SERVER_CONFIG,
+        max_concurrency=MAX_PARALLEL_TOOL_CALLS,
+        cache_ttl=TOOL_CACHE_TTL,
+        cache_size=TOOL_CACHE_SIZE,
+    )
+    connect_started = time.perf_counter()
+    async with sessions:
+        tools = await sessions.get_tools()
+        print(f"🛠️  Loaded {len(tools)} tools from FastMCP in {time.perf_counter() - connect_started:.2f}s.")
+
+        agent = create_agent(llm, tools)
+        fastpath = FastPath(tools) if fast_path else None
 
-    agent = create_agent(llm, tools)
+        try:
+            if interactive:
+                memory = ConversationMemory(memory_budget, MEMORY_RECENT_TURNS) if memory_budget > 0 else None
+                await _interactive_loop(agent, model_label, fastpath, stream, memory)
+            else:
+                prompt = prompt or DEFAULT_PROMPT
+                await _run_single(agent, prompt, fastpath, stream)
+        finally:
+            print(f"\n{sessions.summary()}")
+            if fastpath is not None:
+                print(fastpath.summary())
+            if limiter is not None:
+                print(limiter.summary())
+            if hasattr(llm, "summary"):
+                print(llm.summary())
+    return sessions.stats()
+
+
+async def _run_single(
+    agent,
+    prompt: str,
+    fastpath: FastPath = None,
+    stream: bool = False,
+    memory: ConversationMemory = None,
+):
+    """Execute a single prompt and print the result."""
+    print(f"\n🗣️ Prompt: {prompt}\n")
 
-    if interactive:
-        await _interactive_loop(agent, model_label)
-    else:
-        prompt = prompt or DEFAULT_PROMPT
-        await _run_single(agent, prompt)
+    if fastpath is not None:
+        result = await fastpath.try_handle(prompt)
+        if result is not None:
+            print("\n⚡ Fast path (no LLM):")
+            print(result)
+            if memory is not None:
+                memory.add_exchange(prompt, result, tool=fastpath.last_tool)
+            return
 
+    messages = memory.messages_for(prompt) if memory is not None else [HumanMessage(content=prompt)]
 
-async def _run_single(agent, prompt: str):
-    """Execute a single prompt and print the result."""
-    print(f"\n🗣️ Prompt: {prompt}\n")
+    if stream:
+        response, timing = await stream_turn(agent, {"messages": messages})
+        print(f"\n{timing.summary()}")
+    else:
+        response = await agent.ainvoke({"messages": messages})
 
-    response = await agent.ainvoke({
-        "messages": [HumanMessage(content=prompt)]
-    })
+        print("\n✅ Final Response:")
+        print(response["messages"][-1].content)
 
-    print("\n✅ Final Response:")
-    print(response["messages"][-1].content)
+    if memory is not None and response.get("messages"):
+        memory.record(response["messages"])
+        print(memory.report())
 
 
-async def _interactive_loop(agent, model_label: str):
+async def _interactive_loop(
+    agent,
+    model_label: str,
+    fastpath: FastPath = None,
+    stream: bool = False,
+    memory: ConversationMemory = None,
+):
     """Interactive REPL — type commands one at a time to save API quota."""
     print(f"\n{'='*60}")
     print(f"  🎮 Interactive Mode — {model_label}")
@@ -98,7 +211,7 @@ async def _interactive_loop(agent, model_label: str):
             break
 
         try:
-            await _run_single(agent, user_input)
+            await _run_single(agent, user_input, fastpath, stream, memory)
         except Exception as e:
             print(f"\n❌ Error: {e}")
         print()
@@ -0,0 +1,109 @@
+"""
+Tool Result Cache — memoize read-only MCP tools between agent turns.
+
+In interactive sessions the model re-runs `list_actors` again and again
+although nothing changed in between.  Results of tools registered with
+``annotations={"readOnlyHint": True}`` are cached by tool name and
+arguments for `ttl` seconds (LRU-bounded); any call to a tool that is
+not read-only clears the cache, since it may have changed the level.
+A call with ``refresh=True`` (e.g. `find_actors_near`) always reaches
+the server, and its result replaces the cached one for the same query.
+
+Usage:
+    cache = ToolResultCache(ttl=30, max_entries=128)
+    result = await cache.call(name, arguments, read_only, send)
+"""
+
+import json
+import time
+from collections import OrderedDict
+
+
+def is_read_only(tool) -> bool:
+    """
+    Whether an MCP tool listing entry is marked read-only.
+
+    Tools without annotations are treated as mutating, matching the
+    MCP default for ``readOnlyHint``.
+    """
+    annotations = getattr(tool, "annotations", None)
+    if annotations is None:
+        return False
+    hint = getattr(annotations, "read_only_hint", None)
+    if hint is None:
+        hint = getattr(annotations, "readOnlyHint", None)
+    return bool(hint)
+
+
+class ToolResultCache:
+    """
+    TTL + LRU cache for read-only tool results.
+
+    Args:
+        ttl:         Seconds a cached result stays valid (catches edits
+                     made directly in the editor).
+        max_entries: Most results kept; least recently used go first.
+    """
+
+    def __init__(self, ttl: float = 30.0, max_entries: int = 128):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, tuple[float, str]] = OrderedDict()
+        # Bumped by every mutating call so a read that overlapped a
+        # write never stores its (possibly stale) result.
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def key(name: str, arguments: dict) -> tuple:
+        # `refresh` asks for fresh data, not different data: share the entry
+        arguments = {k: v for k, v in arguments.items() if k != "refresh"}
+        return name, json.dumps(arguments, sort_keys=True, default=str)
+
+    async def call(self, name: str, arguments: dict, read_only: bool, send):
+        """
+        Return ``await send()`` for `name`, served from the cache when
+        the tool is read-only and a fresh result is stored.
+        """
+        if not read_only:
+            self.invalidate()
+            try:
+                return await send()
+            finally:
+                self.invalidate()
+
+        key = self.key(name, arguments)
+        entry = None if arguments.get("refresh") is True else self._entries.get(key)
+        if entry is not None and time.monotonic() - entry[0] < self.ttl:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        generation = self._generation
+        result = await send()
+        if generation == self._generation and not (isinstance(result, str) and result.startswith("Error:")):
+            self._entries[key] = (time.monotonic(), result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return result
+
+    def invalidate(self):
+        """Drop every cached result."""
+        self._generation += 1
+        if self._entries:
+            self._entries.clear()
+            self.invalidations += 1
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "cache_hits": self.hits,
+            "cache_misses": self.misses,
+            "cache_hit_rate": self.hits / lookups if lookups else 0.0,
+            "cache_invalidations": self.invalidations,
+            "cache_entries": len(self._entries),
+        }
@@ -0,0 +1,100 @@
+"""
+Tool Call Scheduler — bounded parallelism with per-actor ordering.
+
+When the model emits several tool calls in one message (e.g. "spawn a
+cube ... and a sphere ..."), the agent's tool node runs them
+concurrently.  `ToolCallScheduler` caps how many reach the MCP server
+at once and serializes calls that touch the same actor, so "move X"
+and "scale X" in one message cannot race while unrelated calls overlap.
+
+Usage:
+    scheduler = ToolCallScheduler(max_concurrency=4)
+    result = await scheduler.run("set_actor_scale", arguments, call)
+"""
+
+import asyncio
+from contextlib import AsyncExitStack
+
+
+# Argument names that identify the actor a tool call targets
+_ACTOR_KEYS = ("actor_path", "actor", "object_path")
+
+
+def actor_keys(arguments: dict) -> list[str]:
+    """
+    Actors a tool call touches, found in its arguments (including nested
+    lists such as ``set_actor_transforms(updates=[...])`` and
+    ``batch_call(calls=[...])``).  Keys compare actors by name, not
+    label.  Sorted so locks are always taken in the same order.
+    """
+    keys = set()
+
+    def visit(value):
+        if isinstance(value, dict):
+            for name, item in value.items():
+                if name in _ACTOR_KEYS and isinstance(item, str) and item:
+                    # A short name and the path ending in it share a key.
+                    # Labels are not resolved here (the actor index lives
+                    # in the server), so a call by label does not wait for
+                    # one by path on the same actor.
+                    keys.add(item.rsplit(".", 1)[-1].lower())
+                else:
+                    visit(item)
+        elif isinstance(value, list):
+            for item in value:
+                visit(item)
+
+    visit(arguments)
+    return sorted(keys)
+
+
+class ToolCallScheduler:
+    """
+    Runs tool calls with at most `max_concurrency` in flight, holding a
+    lock per targeted actor for the duration of each call.
+    """
+
+    def __init__(self, max_concurrency: int = 4):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
+        self._slots = asyncio.Semaphore(max_concurrency)
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._users: dict[str, int] = {}
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.serialized = 0
+
+    async def run(self, name: str, arguments: dict, call):
+        """Await ``call()`` once a slot and every actor lock it needs are free."""
+        keys = actor_keys(arguments)
+        for key in keys:
+            self._users[key] = self._users.get(key, 0) + 1
+        try:
+            async with AsyncExitStack() as stack:
+                for key in keys:
+                    lock = self._locks.setdefault(key, asyncio.Lock())
+                    if lock.locked():
+                        self.serialized += 1
+                    await stack.enter_async_context(lock)
+                async with self._slots:
+                    self.in_flight += 1
+                    self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+                    try:
+                        return await call()
+                    finally:
+                        self.in_flight -= 1
+        finally:
+            # Forget locks nobody is waiting on so the table stays small
+            for key in keys:
+                self._users[key] -= 1
+                if not self._users[key]:
+                    del self._users[key]
+                    self._locks.pop(key, None)
+
+    def stats(self) -> dict:
+        return {
+            "max_concurrency": self.max_concurrency,
+            "peak_in_flight": self.peak_in_flight,
+            "serialized": self.serialized,
+        }
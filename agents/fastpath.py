@@ -0,0 +1,147 @@
+"""
+Fast Path — answer simple commands without calling the LLM.
+
+Most interactive traffic is one of a few shapes ("spawn a cube at 0 0
+200", "list all actors", "scale Cube_2 to 2 2 2").  `parse_intent()`
+recognises those with strict patterns and the names in
+`ASSET_MAP` / `CLASS_MAP`; `FastPath` then calls the MCP tool directly.
+Anything that does not match exactly returns None and goes to the
+agent as before, so the fast path never guesses.
+
+Usage:
+    fastpath = FastPath(tools)
+    result = await fastpath.try_handle("spawn a sphere at 500 500 500")
+    if result is None:
+        ...  # fall through to the LLM
+"""
+
+import re
+import time
+
+from unreal_mcp.mappings import ASSET_MAP, CLASS_MAP
+
+
+# A whole number only: "100" must never be read as "1", "0", "0".
+_NUMBER = r"(?<![\d.])[-+]?(?:\d+(?:\.\d*)?|\.\d+)(?![\d.])"
+# Coordinates are separated by a comma or whitespace, never by nothing.
+_SEP = r"(?:\s*,\s*|\s+)"
+
+# "0 0 200", "0, 0, 200", "(0, 0, 200)", "x:0 y:0 z:200", "x=0, y=0, z=200"
+_XYZ = (
+    rf"\(?\s*(?:x\s*[:=]\s*)?(?P<x>{_NUMBER}){_SEP}"
+    rf"(?:y\s*[:=]\s*)?(?P<y>{_NUMBER}){_SEP}"
+    rf"(?:z\s*[:=]\s*)?(?P<z>{_NUMBER})\s*\)?"
+)
+
+# Matched case-insensitively; the text itself keeps its case because
+# actor paths are case-sensitive.
+_LIST = re.compile(r"^(?:list|show)(?: me)?(?: all)?(?: the)? actors(?: in (?:the )?level)?$", re.I)
+_SPAWN = re.compile(
+    rf"^(?:spawn|create|add|place)(?: (?:a|an|one))? (?P<name>[a-z_ ]+?)(?: (?:at|@) {_XYZ})?$", re.I
+)
+_SCALE = re.compile(
+    rf"^(?:scale|resize) (?P<actor>[\w./:-]+) to (?:{_XYZ}|(?P<uniform>{_NUMBER}))$", re.I
+)
+
+
+def _normalise(text: str) -> str:
+    text = text.strip()
+    text = re.sub(r"^(?:please|can you|could you)\s+", "", text, flags=re.I)
+    text = re.sub(r"[.!?]+$", "", text)
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def _spawnable(name: str) -> str | None:
+    """Map 'cube', 'point light', 'directional light' to a mapping key."""
+    name = name.strip().lower()
+    for candidate in (name, name.replace(" ", ""), name.replace(" ", "_")):
+        if candidate in ASSET_MAP or candidate in CLASS_MAP:
+            return candidate
+    return None
+
+
+def parse_intent(text: str) -> tuple[str, dict] | None:
+    """
+    Turn a simple command into a tool call.
+
+    Returns:
+        ``(tool_name, arguments)``, or None if the command is not one
+        of the recognised patterns.
+    """
+    text = _normalise(text)
+
+    if _LIST.match(text):
+        return "list_actors", {}
+
+    match = _SPAWN.match(text)
+    if match:
+        name = _spawnable(match["name"])
+        if name is None:
+            return None
+        arguments = {"actor_class_or_asset": name}
+        if match["x"] is not None:
+            arguments.update(x=float(match["x"]), y=float(match["y"]), z=float(match["z"]))
+        return "spawn_actor", arguments
+
+    match = _SCALE.match(text)
+    if match:
+        if match["uniform"] is not None:
+            x = y = z = float(match["uniform"])
+        else:
+            x, y, z = float(match["x"]), float(match["y"]), float(match["z"])
+        return "set_actor_scale", {"actor_path": match["actor"], "scale_x": x, "scale_y": y, "scale_z": z}
+
+    return None
+
+
+class FastPath:
+    """
+    Runs commands `parse_intent()` understands straight against the tools.
+
+    Args:
+        tools: The LangChain tools the agent was built with.
+    """
+
+    def __init__(self, tools: list):
+        self._tools = {tool.name: tool for tool in tools}
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self.seconds = 0.0
+        self.last_tool = None
+
+    async def try_handle(self, text: str) -> str | None:
+        """The tool result for `text`, or None to hand it to the LLM."""
+        intent = parse_intent(text)
+        if intent is None or intent[0] not in self._tools:
+            self.misses += 1
+            return None
+
+        name, arguments = intent
+        self.hits += 1
+        self.last_tool = name
+        started = time.perf_counter()
+        try:
+            return await self._tools[name].ainvoke(arguments)
+        except Exception as e:
+            self.errors += 1
+            return f"Error: {e}"
+        finally:
+            self.seconds += time.perf_counter() - started
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "hit_rate": self.hits / total if total else 0.0,
+            "mean_ms": self.seconds / self.hits * 1000 if self.hits else 0.0,
+        }
+
+    def summary(self) -> str:
+        stats = self.stats()
+        return (
+            f"⚡ Fast path: {stats['hits']}/{stats['hits'] + stats['misses']} commands"
+            f" ({stats['hit_rate']:.0%}) handled without the LLM, {stats['mean_ms']:.1f} ms avg"
+        )
@@ -24,8 +24,6 @@ import asyncio
 import argparse
 import os
 from dotenv import load_dotenv
-from langchain_google_genai import ChatGoogleGenerativeAI
-from agents.base import run_agent
 
 load_dotenv()
 
@@ -41,6 +39,7 @@ DEFAULT_MODEL = "gemini-2.5-pro"
 
 def create_llm(model: str = DEFAULT_MODEL):
     """Create and return the Gemini LLM instance."""
+    from langchain_google_genai import ChatGoogleGenerativeAI
     api_key = os.getenv("GOOGLE_API_KEY")
     if not api_key:
         raise ValueError(
@@ -82,6 +81,7 @@ async def main():
         return
 
     model = args.model
+    from agents.base import run_agent
     llm = create_llm(model)
     await run_agent(llm, model_label=f"{model} via Google Gemini")
 
@@ -13,16 +13,19 @@ Usage:
 import asyncio
 import argparse
 from dotenv import load_dotenv
-from langchain_groq import ChatGroq
-from agents.base import run_agent
 
 load_dotenv()
 
 DEFAULT_MODEL = "llama-3.1-8b-instant"
 
+# Free-tier caps for the default model; the x-ratelimit-* headers on a
+# 429 tighten these at runtime.
+RATE_LIMITS = {"requests_per_minute": 30, "tokens_per_minute": 6000}
+
 
 def create_llm(model: str = DEFAULT_MODEL):
     """Create and return the Groq LLM instance."""
+    from langchain_groq import ChatGroq
     return ChatGroq(
         model=model,
         temperature=0,
@@ -41,7 +44,7 @@ async def main():
     args = parse_args()
     llm = create_llm(args.model)
 
-    from agents.base import TEST_PROMPT
+    from agents.base import run_agent, TEST_PROMPT
     prompt = TEST_PROMPT if args.test else None
 
     await run_agent(
@@ -49,6 +52,7 @@ async def main():
         model_label=f"{args.model} via Groq",
         prompt=prompt,
         interactive=args.interactive,
+        rate_limits=RATE_LIMITS,
     )
 
 
@@ -0,0 +1,197 @@
+"""
+Conversation Memory — carry context across interactive turns on a budget.
+
+Without memory every interactive turn starts from scratch, so the
+model re-runs `list_actors` to rediscover paths it just saw; keeping
+the raw history instead lets long tool outputs grow the prompt without
+bound.  `ConversationMemory` keeps the last few turns verbatim,
+replaces older tool results — and answers that are tool output, such
+as fast-path replies — with short summaries (actor counts by class for
+actor listings), drops the oldest turns once the estimated
+prompt size exceeds the token budget, and reports prompt tokens per
+turn.
+
+Usage:
+    memory = ConversationMemory(token_budget=4000)
+    state = await agent.ainvoke({"messages": memory.messages_for(prompt)})
+    memory.record(state["messages"])
+    print(memory.report())
+"""
+
+import json
+import re
+from collections import Counter
+
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
+from unreal_mcp.scene import actor_class_name
+
+
+# Rough characters per token for English text and JSON (no tokenizer needed)
+_CHARS_PER_TOKEN = 4
+# Per-message overhead (role markers etc.)
+_MESSAGE_TOKENS = 4
+# Old tool results at or under this many characters are kept as they are
+_SUMMARY_CHARS = 240
+# Actor names listed in a summary before it falls back to counts only
+_SUMMARY_NAMES = 12
+
+_ACTOR_LINE = re.compile(r"^(\S+) \(Path: (.+)\)$", re.M)
+
+
+def estimate_tokens(messages: list) -> int:
+    """Approximate prompt tokens for `messages` (text + tool-call arguments)."""
+    total = 0
+    for message in messages:
+        content = message.content if isinstance(message.content, str) else json.dumps(message.content)
+        total += _MESSAGE_TOKENS + len(content) // _CHARS_PER_TOKEN
+        for call in getattr(message, "tool_calls", None) or []:
+            total += len(json.dumps(call.get("args", {}), default=str)) // _CHARS_PER_TOKEN
+    return total
+
+
+def summarize_tool_result(name: str, text: str) -> str:
+    """
+    A short stand-in for an old tool result.
+
+    Actor listings become counts by class (plus the names when there are
+    only a few); anything else keeps its first line.
+    """
+    if len(text) <= _SUMMARY_CHARS:
+        return text
+
+    actors = _ACTOR_LINE.findall(text)
+    if actors:
+        counts = Counter(actor_class_name(path) for _, path in actors)
+        by_class = ", ".join(f"{cls}×{n}" for cls, n in counts.most_common())
+        summary = f"[earlier {name}: {len(actors)} actors — {by_class}"
+        if len(actors) <= _SUMMARY_NAMES:
+            summary += f"; names: {', '.join(short for short, _ in actors)}"
+        return summary + "]"
+
+    first_line = text.strip().splitlines()[0][:_SUMMARY_CHARS // 2]
+    return f"[earlier {name}: {first_line} … ({len(text)} chars trimmed)]"
+
+
+class ConversationMemory:
+    """
+    Message history for the interactive runner, trimmed to a token budget.
+
+    Args:
+        token_budget: Target size (estimated tokens) of the history sent
+                      with each new prompt.
+        recent_turns: Most recent turns kept verbatim while they fit the
+                      budget (the latest one always is).
+    """
+
+    def __init__(self, token_budget: int = 4000, recent_turns: int = 2):
+        self.token_budget = token_budget
+        self.recent_turns = recent_turns
+        self._turns: list[list] = []
+        self.compressed = 0
+        self.dropped_turns = 0
+        self.last_prompt_tokens = 0
+        self.last_reported_tokens = None
+
+    # ── Turn I/O ─────────────────────────────────────────────────────
+    def messages_for(self, prompt: str) -> list:
+        """History plus the new prompt, ready for `agent.ainvoke()`."""
+        messages = [m for turn in self._turns for m in turn] + [HumanMessage(content=prompt)]
+        self.last_prompt_tokens = estimate_tokens(messages)
+        return messages
+
+    def record(self, messages: list):
+        """
+        Store the agent's final message list (history + this turn) and
+        trim it for the next prompt.
+        """
+        turns, current = [], []
+        for message in messages:
+            if isinstance(message, HumanMessage) and current:
+                turns.append(current)
+                current = []
+            current.append(message)
+        if current:
+            turns.append(current)
+
+        self._turns = turns
+        self.last_reported_tokens = self._reported_input_tokens(turns[-1] if turns else [])
+        self._trim()
+
+    def add_exchange(self, prompt: str, answer: str, tool: str | None = None):
+        """
+        Record a turn answered without the agent (e.g. the fast path).
+        When `answer` is the output of `tool`, it is summarized like a
+        tool result once the turn is old.
+        """
+        self.last_prompt_tokens = 0
+        self.last_reported_tokens = None
+        # The AIMessage name marks the answer as tool output for `_compress`
+        answer_message = AIMessage(content=answer, name=tool or "fast path")
+        self._turns.append([HumanMessage(content=prompt), answer_message])
+        self._trim()
+
+    # ── Trimming ─────────────────────────────────────────────────────
+    def _trim(self):
+        old = len(self._turns) - self.recent_turns
+        for i in range(max(old, 0)):
+            self._turns[i] = [self._compress(m) for m in self._turns[i]]
+
+        # Recent turns that alone blow the budget are summarized too —
+        # all but the latest, which the model is most likely to refer to.
+        if self.tokens() > self.token_budget:
+            for i in range(len(self._turns) - 1):
+                self._turns[i] = [self._compress(m) for m in self._turns[i]]
+
+        # Then drop whole turns, so tool calls never lose their results
+        while len(self._turns) > 1 and self.tokens() > self.token_budget:
+            self._turns.pop(0)
+            self.dropped_turns += 1
+
+    def _compress(self, message):
+        # Tool results, and model-free answers that carry the tool output
+        tool_output = isinstance(message, ToolMessage) or (
+            isinstance(message, AIMessage) and message.name and not message.tool_calls
+        )
+        if not tool_output or not isinstance(message.content, str):
+            return message
+        if message.content.startswith("[earlier "):
+            return message
+        summary = summarize_tool_result(message.name or "tool", message.content)
+        if summary == message.content:
+            return message
+        self.compressed += 1
+        return message.model_copy(update={"content": summary})
+
+    @staticmethod
+    def _reported_input_tokens(turn: list) -> int | None:
+        """Input tokens the provider reported for the turn's last model call."""
+        for message in reversed(turn):
+            usage = getattr(message, "usage_metadata", None)
+            if usage:
+                return usage.get("input_tokens")
+        return None
+
+    # ── Reporting ────────────────────────────────────────────────────
+    def tokens(self) -> int:
+        return estimate_tokens([m for turn in self._turns for m in turn])
+
+    def stats(self) -> dict:
+        return {
+            "turns": len(self._turns),
+            "history_tokens": self.tokens(),
+            "last_prompt_tokens": self.last_prompt_tokens,
+            "last_reported_tokens": self.last_reported_tokens,
+            "compressed_results": self.compressed,
+            "dropped_turns": self.dropped_turns,
+        }
+
+    def report(self) -> str:
+        line = (
+            f"🧠 Prompt ~{self.last_prompt_tokens} tokens"
+            f" (history {len(self._turns)} turns ≈ {self.tokens()}/{self.token_budget} tokens,"
+            f" {self.compressed} results summarized, {self.dropped_turns} turns dropped)"
+        )
+        if self.last_reported_tokens is not None:
+            line += f"; model reported {self.last_reported_tokens} input tokens"
+        return line
@@ -22,8 +22,6 @@ import asyncio
 import argparse
 import os
 from dotenv import load_dotenv
-from langchain_ollama import ChatOllama
-from agents.base import run_agent
 
 load_dotenv()
 
@@ -41,6 +39,7 @@ DEFAULT_MODEL = "llama3.3:70b"
 
 def create_llm(model: str = DEFAULT_MODEL):
     """Create and return the Ollama LLM instance."""
+    from langchain_ollama import ChatOllama
     base_url = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
 
     return ChatOllama(
@@ -77,6 +76,7 @@ async def main():
         return
 
     model = args.model
+    from agents.base import run_agent
     llm = create_llm(model)
     await run_agent(llm, model_label=f"{model} via Ollama (local)")
 
@@ -0,0 +1,315 @@
+"""
+Rate-Limit Scheduler — pace LLM requests under provider caps.
+
+Hosted free tiers (Groq especially) cap requests and tokens per
+minute; a long multi-step prompt used to die with a 429 halfway
+through.  `RateLimiter` keeps a sliding one-minute window of what was
+sent, estimates each request's token cost up front, and makes callers
+wait (in FIFO order) until the request fits.  A 429 that still slips
+through is retried with exponential backoff and jitter instead of
+failing the turn; the ``x-ratelimit-*`` and ``Retry-After`` headers on
+that error tighten the window.  Successful responses carry no headers
+(the LangChain integrations only keep the token usage), so between
+429s the window is settled from ``usage_metadata`` alone.
+
+`RateLimitedChatModel` wraps any LangChain chat model with a limiter:
+
+    llm = RateLimitedChatModel.wrap(ChatGroq(...), RateLimiter(30, 6000))
+    agent = create_agent(llm, tools)
+    ...
+    print(llm.limiter.summary())
+"""
+
+import asyncio
+import json
+import random
+import re
+import time
+from collections import deque
+from typing import Any
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.outputs import ChatResult
+
+from agents.memory import estimate_tokens
+
+
+# Tokens assumed for a reply when the request sets no max_tokens
+_DEFAULT_COMPLETION_TOKENS = 256
+
+_DURATION = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_UNIT_SECONDS = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+
+
+def parse_duration(value) -> float | None:
+    """Parse ``"7.66s"``, ``"2m59.56s"``, ``"120ms"`` or plain seconds."""
+    if value is None:
+        return None
+    value = str(value).strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parts = _DURATION.findall(value)
+    if not parts:
+        return None
+    return sum(float(amount) * _UNIT_SECONDS[unit] for amount, unit in parts)
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """Whether `error` is a provider's "too many requests" response."""
+    status = getattr(error, "status_code", None) or getattr(getattr(error, "response", None), "status_code", None)
+    if status == 429:
+        return True
+    name = type(error).__name__
+    return "RateLimit" in name or "ResourceExhausted" in name
+
+
+def error_headers(error: Exception) -> dict:
+    """HTTP headers attached to a provider error, if any."""
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    return dict(headers) if headers else {}
+
+
+class RateLimiter:
+    """
+    Client-side requests-per-minute / tokens-per-minute pacing.
+
+    Args:
+        requests_per_minute: Request cap (None = unlimited).
+        tokens_per_minute:   Token cap (None = unlimited).
+        max_retries:         Times a rate-limited request is retried.
+        base_delay:          First backoff delay in seconds (doubles per retry).
+        max_delay:           Longest single backoff.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int | None = None,
+        tokens_per_minute: int | None = None,
+        max_retries: int = 6,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+    ):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+        self._window: deque[list] = deque()   # [sent_at, tokens] per request
+        self._window_tokens = 0
+        self._blocked_until = 0.0
+        self._remaining_tokens = None
+        self._tokens_reset_at = 0.0
+        self._queue = asyncio.Lock()
+
+        self.queue_depth = 0
+        self.peak_queue_depth = 0
+        self.requests = 0
+        self.waited_requests = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.rate_limit_errors = 0
+        self.retries = 0
+
+    # ── Admission ────────────────────────────────────────────────────
+    async def acquire(self, tokens: int) -> list:
+        """
+        Wait until a request costing ~`tokens` fits under the caps, then
+        count it.  Returns a ticket for `settle()`.
+        """
+        started = time.monotonic()
+        self.queue_depth += 1
+        self.peak_queue_depth = max(self.peak_queue_depth, self.queue_depth)
+        try:
+            async with self._queue:
+                while True:
+                    delay = self._delay(tokens, time.monotonic())
+                    if delay <= 0:
+                        break
+                    await asyncio.sleep(delay)
+                ticket = [time.monotonic(), tokens]
+                self._window.append(ticket)
+                self._window_tokens += tokens
+                if self._remaining_tokens is not None:
+                    self._remaining_tokens -= tokens
+        finally:
+            self.queue_depth -= 1
+
+        waited = time.monotonic() - started
+        self.requests += 1
+        if waited > 0.001:
+            self.waited_requests += 1
+            self.total_wait += waited
+            self.max_wait = max(self.max_wait, waited)
+        return ticket
+
+    def settle(self, ticket: list, tokens: int):
+        """Replace a request's estimated cost with what it really used."""
+        self._window_tokens += tokens - ticket[1]
+        ticket[1] = tokens
+
+    def _delay(self, tokens: int, now: float) -> float:
+        while self._window and now - self._window[0][0] >= 60.0:
+            self._window_tokens -= self._window.popleft()[1]
+
+        delay = self._blocked_until - now
+        if self.requests_per_minute and len(self._window) >= self.requests_per_minute:
+            delay = max(delay, self._window[0][0] + 60.0 - now)
+
+        if self.tokens_per_minute and self._window and self._window_tokens + tokens > self.tokens_per_minute:
+            # Wait until enough of the window has aged out to fit this request
+            excess = self._window_tokens + tokens - self.tokens_per_minute
+            for sent_at, used in self._window:
+                excess -= used
+                if excess <= 0:
+                    delay = max(delay, sent_at + 60.0 - now)
+                    break
+
+        if self._remaining_tokens is not None and tokens > self._remaining_tokens and now < self._tokens_reset_at:
+            delay = max(delay, self._tokens_reset_at - now)
+        return delay
+
+    # ── Feedback from the provider ───────────────────────────────────
+    def observe_headers(self, headers: dict):
+        """Tighten the limits from ``x-ratelimit-*`` / ``retry-after`` headers."""
+        if not headers:
+            return
+        headers = {key.lower(): value for key, value in headers.items()}
+        now = time.monotonic()
+
+        limit = headers.get("x-ratelimit-limit-tokens")
+        if limit and str(limit).isdigit():
+            self.tokens_per_minute = int(limit)
+
+        remaining = headers.get("x-ratelimit-remaining-tokens")
+        reset = parse_duration(headers.get("x-ratelimit-reset-tokens"))
+        if remaining is not None and str(remaining).isdigit() and reset is not None:
+            self._remaining_tokens = int(remaining)
+            self._tokens_reset_at = now + reset
+
+        if str(headers.get("x-ratelimit-remaining-requests", "")) == "0":
+            reset = parse_duration(headers.get("x-ratelimit-reset-requests"))
+            if reset:
+                self._blocked_until = max(self._blocked_until, now + reset)
+
+        retry_after = parse_duration(headers.get("retry-after"))
+        if retry_after:
+            self._blocked_until = max(self._blocked_until, now + retry_after)
+
+    def backoff(self, attempt: int, headers: dict | None = None):
+        """
+        Pause every queued request after a 429: ``Retry-After`` when the
+        provider sent one, otherwise exponential backoff with jitter.
+        """
+        self.rate_limit_errors += 1
+        self.retries += 1
+        before = self._blocked_until
+        self.observe_headers(headers or {})
+        if self._blocked_until <= max(before, time.monotonic()):
+            cap = min(self.max_delay, self.base_delay * 2 ** attempt)
+            delay = cap / 2 + random.uniform(0, cap / 2)
+            self._blocked_until = time.monotonic() + delay
+
+    # ── Reporting ────────────────────────────────────────────────────
+    def stats(self) -> dict:
+        return {
+            "requests": self.requests,
+            "queue_depth": self.queue_depth,
+            "peak_queue_depth": self.peak_queue_depth,
+            "waited_requests": self.waited_requests,
+            "total_wait_s": self.total_wait,
+            "max_wait_s": self.max_wait,
+            "rate_limit_errors": self.rate_limit_errors,
+            "retries": self.retries,
+            "window_tokens": self._window_tokens,
+        }
+
+    def summary(self) -> str:
+        return (
+            f"🚦 Rate limiter: {self.requests} LLM requests, {self.waited_requests} waited"
+            f" ({self.total_wait:.1f}s total, {self.max_wait:.1f}s max), peak queue {self.peak_queue_depth},"
+            f" {self.rate_limit_errors} rate-limit errors retried"
+        )
+
+
+def _request_tokens(messages: list, kwargs: dict) -> int:
+    """Estimated cost of a chat request: prompt, tool schemas and reply."""
+    tokens = estimate_tokens(messages)
+    if kwargs.get("tools"):
+        tokens += len(json.dumps(kwargs["tools"], default=str)) // 4
+    return tokens + int(kwargs.get("max_tokens") or _DEFAULT_COMPLETION_TOKENS)
+
+
+def _used_tokens(message) -> int | None:
+    usage = getattr(message, "usage_metadata", None)
+    return usage.get("total_tokens") if usage else None
+
+
+class RateLimitedChatModel(BaseChatModel):
+    """
+    A chat model that admits every call to `inner` through `limiter`.
+
+    `bind_tools()` formats the tools with the inner model and binds the
+    result to this wrapper, so tool-calling agents stay rate limited.
+    """
+
+    inner: BaseChatModel
+    limiter: Any
+
+    @classmethod
+    def wrap(cls, llm: BaseChatModel, limiter: RateLimiter) -> "RateLimitedChatModel":
+        return cls(inner=llm, limiter=limiter)
+
+    @property
+    def _llm_type(self) -> str:
+        return f"rate-limited-{self.inner._llm_type}"
+
+    def bind_tools(self, tools, **kwargs):
+        bound = self.inner.bind_tools(tools, **kwargs)
+        return self.bind(**bound.kwargs)
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        # Synchronous callers bypass pacing; the agents only use the async path.
+        return self.inner._generate(messages, stop=stop, run_manager=run_manager, **kwargs)
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        estimate = _request_tokens(messages, kwargs)
+        for attempt in range(self.limiter.max_retries + 1):
+            ticket = await self.limiter.acquire(estimate)
+            try:
+                result = await self.inner._agenerate(messages, stop=stop, run_manager=run_manager, **kwargs)
+            except Exception as e:
+                self.limiter.settle(ticket, 0)
+                if not is_rate_limit_error(e) or attempt == self.limiter.max_retries:
+                    raise
+                self.limiter.backoff(attempt, error_headers(e))
+                continue
+
+            message = result.generations[0].message if result.generations else None
+            used = _used_tokens(message)
+            if used is not None:
+                self.limiter.settle(ticket, used)
+            return result
+
+    async def _astream(self, messages, stop=None, run_manager=None, **kwargs):
+        estimate = _request_tokens(messages, kwargs)
+        for attempt in range(self.limiter.max_retries + 1):
+            ticket = await self.limiter.acquire(estimate)
+            used, started = 0, False
+            try:
+                async for chunk in self.inner._astream(messages, stop=stop, run_manager=run_manager, **kwargs):
+                    started = True
+                    used += _used_tokens(chunk.message) or 0
+                    yield chunk
+            except Exception as e:
+                self.limiter.settle(ticket, used)
+                # Only retry if nothing reached the caller yet
+                if started or not is_rate_limit_error(e) or attempt == self.limiter.max_retries:
+                    raise
+                self.limiter.backoff(attempt, error_headers(e))
+                continue
+            if used:
+                self.limiter.settle(ticket, used)
+            return
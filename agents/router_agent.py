@@ -0,0 +1,354 @@
+"""
+Router Agent — hedged, failover routing across Groq, Gemini and Ollama.
+
+Instead of picking one backend per process, the router sends each LLM
+request to the first healthy backend in priority order.  If it has not
+answered after `hedge_after` seconds, the next backend is raced against
+it (first answer wins, the loser is cancelled); if it errors, the next
+backend takes over at once.  Each backend keeps health stats (latency
+EWMA, failures) and sits out a growing cooldown after repeated errors.
+
+Streaming (`--stream`) routes the same way up to the first chunk: the
+backend that streams first wins and the rest are cancelled.  Once
+chunks have reached the caller a failure is raised, not retried, so
+output is never duplicated.  Synchronous calls fail over in order
+without hedging.
+
+Usage:
+    python agent.py router
+    python -m agents.router_agent --order groq,ollama --hedge-after 3
+"""
+
+import asyncio
+import argparse
+import time
+
+from dotenv import load_dotenv
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+from agents.ratelimit import RateLimitedChatModel, RateLimiter
+
+load_dotenv()
+
+# ── Routing defaults ─────────────────────────────────────────────────
+DEFAULT_ORDER = ("groq", "gemini", "ollama")
+
+# Seconds the current backend gets before the next one is raced against it
+HEDGE_AFTER = 4.0
+
+# Longest a failing backend is benched (doubles per consecutive failure)
+MAX_COOLDOWN = 60.0
+
+
+def _create_backend(name: str):
+    """Build one backend with its own `create_llm()` (imported lazily)."""
+    if name == "groq":
+        from agents.groq_agent import create_llm, RATE_LIMITS
+        return RateLimitedChatModel.wrap(create_llm(), RateLimiter(**RATE_LIMITS))
+    if name == "gemini":
+        from agents.gemini_agent import create_llm
+        return create_llm()
+    if name == "ollama":
+        from agents.ollama_agent import create_llm
+        return create_llm()
+    raise ValueError(f"Unknown backend '{name}' (choose from {', '.join(DEFAULT_ORDER)})")
+
+
+class BackendHealth:
+    """Latency and error history for one backend."""
+
+    def __init__(self):
+        self.latency_ewma = None
+        self.successes = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.cooldown_until = 0.0
+        self.last_error = ""
+
+    @property
+    def available(self) -> bool:
+        return time.monotonic() >= self.cooldown_until
+
+    def success(self, seconds: float):
+        self.successes += 1
+        self.consecutive_failures = 0
+        self.latency_ewma = seconds if self.latency_ewma is None else 0.7 * self.latency_ewma + 0.3 * seconds
+
+    def failure(self, error: Exception):
+        self.failures += 1
+        self.consecutive_failures += 1
+        self.last_error = f"{type(error).__name__}: {error}"[:200]
+        cooldown = min(MAX_COOLDOWN, 2.0 ** self.consecutive_failures)
+        self.cooldown_until = time.monotonic() + cooldown
+
+
+class RouterChatModel(BaseChatModel):
+    """
+    A chat model that routes every request across several backends.
+
+    `backends` is a list of ``(name, model)`` in priority order;
+    `bind_tools()` binds the tools on each backend with its own
+    provider format and shares the health stats with the original.
+    """
+
+    backends: list
+    hedge_after: float = HEDGE_AFTER
+    health: dict
+    stats: dict
+    verbose_routing: bool = True
+
+    @classmethod
+    def from_backends(cls, backends: list, hedge_after: float = HEDGE_AFTER) -> "RouterChatModel":
+        return cls(
+            backends=backends,
+            hedge_after=hedge_after,
+            health={name: BackendHealth() for name, _ in backends},
+            stats={"requests": 0, "hedges": 0, "failovers": 0, "wins": {}},
+        )
+
+    @property
+    def _llm_type(self) -> str:
+        return "router"
+
+    def bind_tools(self, tools, **kwargs):
+        bound = [(name, model.bind_tools(tools, **kwargs)) for name, model in self.backends]
+        return self.model_copy(update={"backends": bound})
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        # No event loop to race on: try the backends one after another
+        candidates = self._candidates()
+        errors = []
+        self.stats["requests"] += 1
+        for i, (name, model) in enumerate(candidates):
+            started = time.perf_counter()
+            try:
+                message = model.invoke(messages, stop=stop, **kwargs)
+            except Exception as e:
+                self.health[name].failure(e)
+                errors.append(f"{name}: {e}")
+                if i + 1 < len(candidates):
+                    self.stats["failovers"] += 1
+                continue
+            seconds = time.perf_counter() - started
+            self._won(name, seconds)
+            return self._result(name, seconds, "after failover" if errors else "", message)
+        raise RuntimeError("All LLM backends failed — " + "; ".join(errors))
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        name, seconds, how, message = await self._route(messages, stop, kwargs)
+        return self._result(name, seconds, how, message)
+
+    async def _astream(self, messages, stop=None, run_manager=None, **kwargs):
+        name, seconds, how, stream, first = await self._route_stream(messages, stop, kwargs)
+        if self.verbose_routing:
+            note = f" ({how})" if how else ""
+            print(f"🔀 {name} streaming after {seconds:.2f}s{note}")
+        first.response_metadata = {**(first.response_metadata or {}), "router_backend": name}
+        yield ChatGenerationChunk(message=first)
+        try:
+            async for chunk in stream:
+                yield ChatGenerationChunk(message=chunk)
+        except Exception as e:
+            # Too late to fail over: part of the answer is already out
+            self.health[name].failure(e)
+            raise
+
+    def _result(self, name: str, seconds: float, how: str, message) -> ChatResult:
+        message.response_metadata = {**(message.response_metadata or {}), "router_backend": name}
+        if self.verbose_routing:
+            note = f" ({how})" if how else ""
+            print(f"🔀 {name} answered in {seconds:.2f}s{note}")
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _won(self, name: str, seconds: float):
+        self.health[name].success(seconds)
+        wins = self.stats["wins"]
+        wins[name] = wins.get(name, 0) + 1
+
+    # ── Routing ──────────────────────────────────────────────────────
+    def _candidates(self) -> list:
+        ready = [(n, m) for n, m in self.backends if self.health[n].available]
+        if ready:
+            return ready
+        # Everyone is benched: try whoever comes back soonest
+        return sorted(self.backends, key=lambda b: self.health[b[0]].cooldown_until)[:1]
+
+    async def _route(self, messages, stop, kwargs):
+        candidates = self._candidates()
+        pending: dict[asyncio.Task, tuple[str, float]] = {}
+        errors = []
+        launched = 0
+        how = ""
+        self.stats["requests"] += 1
+
+        def launch():
+            nonlocal launched
+            name, model = candidates[launched]
+            launched += 1
+            task = asyncio.ensure_future(model.ainvoke(messages, stop=stop, **kwargs))
+            pending[task] = (name, time.perf_counter())
+
+        launch()
+        try:
+            while pending:
+                hedge = self.hedge_after if launched < len(candidates) else None
+                done, _ = await asyncio.wait(pending, timeout=hedge, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    # Current backend is slow: race the next one against it
+                    self.stats["hedges"] += 1
+                    how = "hedged"
+                    launch()
+                    continue
+
+                failed = False
+                for task in done:
+                    name, started = pending.pop(task)
+                    seconds = time.perf_counter() - started
+                    error = task.exception()
+                    if error is None:
+                        self._won(name, seconds)
+                        return name, seconds, how, task.result()
+                    self.health[name].failure(error)
+                    errors.append(f"{name}: {error}")
+                    failed = True
+
+                if failed and launched < len(candidates):
+                    self.stats["failovers"] += 1
+                    how = "after failover"
+                    launch()
+        finally:
+            for task in pending:
+                task.cancel()
+
+        raise RuntimeError("All LLM backends failed — " + "; ".join(errors))
+
+    async def _route_stream(self, messages, stop, kwargs):
+        """
+        `_route` for streams, decided at the first chunk.  Returns the
+        winner's name, time to first chunk, how it won, its stream and
+        that first chunk.
+        """
+        candidates = self._candidates()
+        pending: dict[asyncio.Task, tuple[str, float, object]] = {}
+        errors = []
+        launched = 0
+        how = ""
+        winner = None
+        self.stats["requests"] += 1
+
+        def launch():
+            nonlocal launched
+            name, model = candidates[launched]
+            launched += 1
+            stream = model.astream(messages, stop=stop, **kwargs)
+            task = asyncio.ensure_future(stream.__anext__())
+            pending[task] = (name, time.perf_counter(), stream)
+
+        launch()
+        try:
+            while pending:
+                hedge = self.hedge_after if launched < len(candidates) else None
+                done, _ = await asyncio.wait(pending, timeout=hedge, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    self.stats["hedges"] += 1
+                    how = "hedged"
+                    launch()
+                    continue
+
+                failed = False
+                for task in done:
+                    name, started, stream = pending.pop(task)
+                    seconds = time.perf_counter() - started
+                    error = task.exception()
+                    if error is None:
+                        self._won(name, seconds)
+                        winner = stream
+                        return name, seconds, how, stream, task.result()
+                    if isinstance(error, StopAsyncIteration):
+                        error = RuntimeError("empty response")
+                    self.health[name].failure(error)
+                    errors.append(f"{name}: {error}")
+                    failed = True
+
+                if failed and launched < len(candidates):
+                    self.stats["failovers"] += 1
+                    how = "after failover"
+                    launch()
+        finally:
+            for task, (_, _, stream) in pending.items():
+                task.cancel()
+                if stream is not winner:
+                    asyncio.ensure_future(_close_quietly(task, stream))
+
+        raise RuntimeError("All LLM backends failed — " + "; ".join(errors))
+
+    # ── Reporting ────────────────────────────────────────────────────
+    def summary(self) -> str:
+        lines = [
+            f"🔀 Router: {self.stats['requests']} requests, {self.stats['hedges']} hedged,"
+            f" {self.stats['failovers']} failovers"
+        ]
+        for name, _ in self.backends:
+            health = self.health[name]
+            latency = f"{health.latency_ewma:.2f}s" if health.latency_ewma is not None else "n/a"
+            lines.append(
+                f"   • {name:7s} wins {self.stats['wins'].get(name, 0):3d}  ok {health.successes:3d}"
+                f"  failed {health.failures:3d}  latency≈{latency}"
+                + (f"  last error: {health.last_error}" if health.last_error else "")
+            )
+        return "\n".join(lines)
+
+
+async def _close_quietly(task: asyncio.Task, stream):
+    """Close a losing stream once its cancelled read has finished."""
+    try:
+        await task
+    except BaseException:
+        pass
+    try:
+        await stream.aclose()
+    except Exception:
+        pass
+
+
+def create_llm(order=DEFAULT_ORDER, hedge_after: float = HEDGE_AFTER) -> RouterChatModel:
+    """
+    Build a router over the backends in `order`.  Backends that cannot
+    be created (missing API key or provider package) are skipped.
+    """
+    backends = []
+    for name in order:
+        try:
+            backends.append((name, _create_backend(name)))
+        except Exception as e:
+            print(f"⚠️  Skipping {name}: {e}")
+    if not backends:
+        raise ValueError("No LLM backend could be created for the router.")
+    return RouterChatModel.from_backends(backends, hedge_after)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Run Unreal MCP agent with hedged multi-backend routing")
+    parser.add_argument("--order", default=",".join(DEFAULT_ORDER),
+                        help=f"Backend priority, comma separated (default: {','.join(DEFAULT_ORDER)})")
+    parser.add_argument("--hedge-after", type=float, default=HEDGE_AFTER,
+                        help=f"Seconds before racing the next backend (default: {HEDGE_AFTER})")
+    parser.add_argument("--interactive", "-i", action="store_true")
+    return parser.parse_args()
+
+
+async def main():
+    args = parse_args()
+    from agents.base import run_agent
+    order = [name.strip() for name in args.order.split(",") if name.strip()]
+    llm = create_llm(order, args.hedge_after)
+    await run_agent(
+        llm,
+        model_label=f"router ({' → '.join(name for name, _ in llm.backends)})",
+        interactive=args.interactive,
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,252 @@
+"""
+MCP Session Manager — one long-lived MCP session per server.
+
+The tools returned by `MultiServerMCPClient.get_tools()` open a fresh
+SSE session for every invocation, so each tool call pays a connect +
+initialize handshake before it reaches Unreal.  `MCPSessionManager`
+opens one session per configured server, keeps it for the whole run
+(including every turn of the interactive loop), reconnects when the
+transport breaks, and counts sessions opened against tool calls made.
+
+Usage:
+    async with MCPSessionManager(MCP_SERVER_CONFIG) as sessions:
+        tools = await sessions.get_tools()
+        agent = create_agent(llm, tools)
+        ...
+    print(sessions.summary())
+"""
+
+import asyncio
+import time
+
+import anyio
+from langchain_core.tools import StructuredTool, ToolException
+from langchain_mcp_adapters.client import MultiServerMCPClient
+
+from agents.cache import ToolResultCache, is_read_only
+from agents.concurrency import ToolCallScheduler
+
+
+# Errors that mean the session's transport is gone (not a tool failure)
+_TRANSPORT_ERRORS = (
+    OSError,
+    EOFError,
+    anyio.ClosedResourceError,
+    anyio.BrokenResourceError,
+    anyio.EndOfStream,
+)
+
+
+def _field(obj, snake: str, camel: str):
+    """Read an MCP model field across SDK versions (isError vs is_error)."""
+    return getattr(obj, snake, None) if hasattr(obj, snake) else getattr(obj, camel, None)
+
+
+class _ServerSession:
+    """
+    One server's session, owned by a dedicated task.
+
+    The SSE client enters anyio task groups that must be exited by the
+    task that entered them, while tool calls run in whatever task the
+    agent schedules them in — so the session lives in its own task and
+    callers just borrow `self.session`.
+    """
+
+    def __init__(self, client: MultiServerMCPClient, name: str):
+        self.client = client
+        self.name = name
+        self.session = None
+        self._task = None
+        self._ready = None
+        self._closing = None
+        self._error = None
+
+    @property
+    def is_open(self) -> bool:
+        return self.session is not None and self._task is not None and not self._task.done()
+
+    async def open(self):
+        self._ready = asyncio.Event()
+        self._closing = asyncio.Event()
+        self._error = None
+        self._task = asyncio.get_running_loop().create_task(self._own())
+        await self._ready.wait()
+        if self._error is not None:
+            raise self._error
+
+    async def _own(self):
+        try:
+            async with self.client.session(self.name) as session:
+                self.session = session
+                self._ready.set()
+                await self._closing.wait()
+        except Exception as e:
+            self._error = e
+        finally:
+            self.session = None
+            self._ready.set()
+
+    async def close(self):
+        if self._task is None:
+            return
+        self._closing.set()
+        try:
+            await asyncio.wait_for(self._task, timeout=5.0)
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            self._task.cancel()
+        self._task = None
+
+
+class MCPSessionManager:
+    """
+    Persistent MCP sessions for every server in a `MultiServerMCPClient` config.
+
+    Args:
+        config:          The same dict `MultiServerMCPClient` takes
+                         (server name → transport settings).
+        max_concurrency: Tool calls allowed in flight at once; calls to
+                         the same actor are always serialized.
+        cache_ttl:       Seconds read-only tool results are reused
+                         (0 disables the cache).
+        cache_size:      Most cached results kept.
+    """
+
+    def __init__(
+        self,
+        config: dict,
+        max_concurrency: int = 4,
+        cache_ttl: float = 30.0,
+        cache_size: int = 128,
+    ):
+        self.client = MultiServerMCPClient(config)
+        self.scheduler = ToolCallScheduler(max_concurrency)
+        self.cache = ToolResultCache(cache_ttl, cache_size)
+        self._read_only: dict[str, bool] = {}
+        self._servers = {name: _ServerSession(self.client, name) for name in config}
+        self._locks = {name: asyncio.Lock() for name in config}
+        self.sessions_opened = 0
+        self.reconnects = 0
+        self.tool_calls = 0
+        self.tool_errors = 0
+        self.tool_seconds = 0.0
+        self.result_bytes = 0
+
+    # ── Lifecycle ────────────────────────────────────────────────────
+    async def start(self):
+        """Open a session to every configured server."""
+        for name in self._servers:
+            await self._ensure(name)
+
+    async def close(self):
+        for server in self._servers.values():
+            await server.close()
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def _ensure(self, name: str, stale=None):
+        """
+        Return an open session for `name`, (re)connecting if it is closed
+        or is the `stale` session a caller just saw fail.  Concurrent
+        callers that hit the same failure reconnect only once.
+        """
+        server = self._servers[name]
+        async with self._locks[name]:
+            if not server.is_open or (stale is not None and server.session is stale):
+                if server._task is not None:
+                    await server.close()
+                    self.reconnects += 1
+                await server.open()
+                self.sessions_opened += 1
+            return server.session
+
+    # ── Tools ────────────────────────────────────────────────────────
+    async def get_tools(self) -> list[StructuredTool]:
+        """
+        LangChain tools for every server, all routed through the
+        persistent sessions instead of a session per call.
+        """
+        tools = []
+        for name in self._servers:
+            session = await self._ensure(name)
+            listing = await session.list_tools()
+            for tool in listing.tools:
+                tools.append(self._make_tool(name, tool))
+        return tools
+
+    def _make_tool(self, server: str, tool) -> StructuredTool:
+        async def call(**arguments):
+            return await self.call_tool(server, tool.name, arguments)
+
+        read_only = self._read_only[tool.name] = is_read_only(tool)
+        return StructuredTool(
+            name=tool.name,
+            description=tool.description or "",
+            args_schema=_field(tool, "input_schema", "inputSchema"),
+            coroutine=call,
+            response_format="content",
+            metadata={"readOnlyHint": read_only},
+        )
+
+    async def call_tool(self, server: str, name: str, arguments: dict) -> str:
+        """
+        Call `name` on `server` over the persistent session.
+
+        A broken transport is reconnected and the call retried once;
+        errors reported by the tool itself raise `ToolException` so the
+        agent sees them as tool output.  Read-only tools are answered
+        from the result cache when possible.
+        """
+        async def send():
+            session = await self._ensure(server)
+            try:
+                return await session.call_tool(name, arguments)
+            except _TRANSPORT_ERRORS:
+                session = await self._ensure(server, stale=session)
+                return await session.call_tool(name, arguments)
+
+        async def call():
+            result = await self.scheduler.run(name, arguments, send)
+            text = "\n".join(
+                getattr(block, "text", "") for block in (result.content or []) if getattr(block, "text", None)
+            )
+            if _field(result, "is_error", "isError"):
+                self.tool_errors += 1
+                raise ToolException(text or f"{name} failed")
+            return text
+
+        self.tool_calls += 1
+        started = time.perf_counter()
+        try:
+            if self.cache.ttl > 0:
+                text = await self.cache.call(name, arguments, self._read_only.get(name, False), call)
+            else:
+                text = await call()
+            self.result_bytes += len(text.encode())
+            return text
+        finally:
+            self.tool_seconds += time.perf_counter() - started
+
+    # ── Reporting ────────────────────────────────────────────────────
+    def stats(self) -> dict:
+        return {
+            "sessions_opened": self.sessions_opened,
+            "reconnects": self.reconnects,
+            "tool_calls": self.tool_calls,
+            "tool_errors": self.tool_errors,
+            "tool_seconds": self.tool_seconds,
+            "result_bytes": self.result_bytes,
+            **self.scheduler.stats(),
+            **self.cache.stats(),
+        }
+
+    def summary(self) -> str:
+        return (
+            f"🔌 MCP: {self.sessions_opened} session(s) opened for {self.tool_calls} tool call(s)"
+            f" ({self.reconnects} reconnect(s), {self.tool_seconds:.2f}s in tools,"
+            f" peak {self.scheduler.peak_in_flight} in parallel, {self.cache.hits} served from cache)"
+        )
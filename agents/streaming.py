@@ -0,0 +1,118 @@
+"""
+Streaming Turns — print model tokens and tool events as they arrive.
+
+`agent.ainvoke()` only returns once the whole turn is done, which with
+slow backends (Ollama 70B) means a long silent wait.  `stream_turn()`
+runs the same turn through the agent's async streaming API, prints
+tokens, tool calls and tool results live, and times the turn:
+time-to-first-token, wall time spent in tools, and total.
+
+Usage:
+    state, timing = await stream_turn(agent, {"messages": [...]})
+    print(timing.summary())
+"""
+
+import json
+import time
+from dataclasses import dataclass
+
+from langchain_core.messages import AIMessage, AIMessageChunk, ToolMessage
+
+
+# Longest tool result echoed while streaming (the model still sees all of it)
+_PREVIEW_CHARS = 300
+
+
+@dataclass
+class TurnTiming:
+    """Where one agent turn spent its time (seconds)."""
+
+    ttft: float | None = None
+    tool_seconds: float = 0.0
+    total: float = 0.0
+    tool_calls: int = 0
+
+    def summary(self) -> str:
+        ttft = f"{self.ttft:.2f}s" if self.ttft is not None else "n/a"
+        return (
+            f"⏱️  TTFT {ttft} · tools {self.tool_seconds:.2f}s ({self.tool_calls} calls)"
+            f" · total {self.total:.2f}s"
+        )
+
+
+def message_text(message) -> str:
+    """Plain text of a message whose content may be a list of blocks."""
+    content = message.content
+    if isinstance(content, str):
+        return content
+    return "".join(
+        block.get("text", "") if isinstance(block, dict) else str(block)
+        for block in content or []
+    )
+
+
+def _preview(text: str) -> str:
+    text = text.strip().replace("\n", " ⏎ ")
+    return text if len(text) <= _PREVIEW_CHARS else text[:_PREVIEW_CHARS] + " …"
+
+
+async def stream_turn(agent, inputs: dict) -> tuple[dict, TurnTiming]:
+    """
+    Run one agent turn in streaming mode.
+
+    Args:
+        agent:  An agent from `create_agent()`.
+        inputs: The agent input, e.g. ``{"messages": [HumanMessage(...)]}``.
+
+    Returns:
+        ``(state, timing)`` — the final agent state (as `ainvoke()` would
+        return it) and a `TurnTiming`.
+    """
+    timing = TurnTiming()
+    started = time.perf_counter()
+    tools_started = None
+    state = {}
+    printing_tokens = False
+
+    async for mode, chunk in agent.astream(inputs, stream_mode=["messages", "updates", "values"]):
+        if mode == "values":
+            state = chunk
+            continue
+
+        if mode == "messages":
+            message, _ = chunk
+            if not isinstance(message, AIMessageChunk):
+                continue
+            text = message_text(message)
+            if timing.ttft is None and (text or message.tool_call_chunks):
+                timing.ttft = time.perf_counter() - started
+            if text:
+                if not printing_tokens:
+                    print("💬 ", end="")
+                    printing_tokens = True
+                print(text, end="", flush=True)
+            continue
+
+        # mode == "updates": one entry per node that just finished
+        for update in chunk.values():
+            if not isinstance(update, dict):
+                continue
+            for message in update.get("messages", []):
+                if isinstance(message, AIMessage) and message.tool_calls:
+                    if printing_tokens:
+                        print()
+                        printing_tokens = False
+                    tools_started = time.perf_counter()
+                    for call in message.tool_calls:
+                        timing.tool_calls += 1
+                        print(f"🔧 {call['name']}({json.dumps(call['args'], default=str)})")
+                elif isinstance(message, ToolMessage):
+                    print(f"📦 {message.name}: {_preview(message_text(message))}")
+                    if tools_started is not None:
+                        timing.tool_seconds += time.perf_counter() - tools_started
+                        tools_started = None
+
+    if printing_tokens:
+        print()
+    timing.total = time.perf_counter() - started
+    return state, timing
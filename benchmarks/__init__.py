@@ -0,0 +1 @@
+# Benchmarks package — performance suites run against the local Unreal stand-in
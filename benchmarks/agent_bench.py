@@ -0,0 +1,280 @@
+"""
+Agent Benchmarks — end-to-end agent runs without spending API quota.
+
+Runs each scenario through the real agent path (`agents.base.run_agent`,
+the persistent MCP session, the FastMCP server over SSE and the Unreal
+connection pool) against the local Remote Control stand-in.  The LLM is
+a `ScriptedChatModel` that replays a fixed tool-call sequence per
+scenario, so runs are deterministic and free.  For each scenario it
+reports:
+
+    llm_calls / tool_calls / tool_errors
+    mcp_sessions        MCP sessions opened for the run
+    tool_result_bytes   bytes the tools returned to the agent
+    tool_result_tokens  the same, estimated as tokens (chars / 4)
+    seconds             wall time, split into llm, mcp and unreal
+
+Usage:
+    python -m benchmarks.agent_bench
+    python -m benchmarks.agent_bench --json --latency-ms 5 --llm-latency-ms 300
+    python -m benchmarks.agent_bench --scenario default --verbose
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import re
+import time
+
+import uvicorn
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+from agents.base import DEFAULT_PROMPT, TEST_PROMPT, run_agent
+from unreal_mcp import mcp
+from unreal_mcp.connection import configure_pool
+from unreal_mcp.standin import FakeUnrealServer
+from unreal_mcp.utils.metrics import metrics
+
+
+_PATH = re.compile(r"\(Path: (.+)\)$", re.M)
+
+
+def first_listed_actor(messages: list) -> str:
+    """Path of the first actor in the latest `list_actors` result."""
+    for message in reversed(messages):
+        if isinstance(message, ToolMessage) and message.name == "list_actors":
+            match = _PATH.search(message.content)
+            if match:
+                return match.group(1)
+    return "StaticMeshActor_0"
+
+
+# ── Scenarios ─────────────────────────────────────────────────────────
+# Each step is the model's reply for one round: a list of tool calls
+# ``(name, args)`` — args may be a function of the messages so far — or
+# the final answer text.
+SCENARIOS = {
+    "test": {
+        "prompt": TEST_PROMPT,
+        "steps": [
+            [("list_actors", {})],
+            "Here are the actors in the level.",
+        ],
+    },
+    "default": {
+        "prompt": DEFAULT_PROMPT,
+        "steps": [
+            [
+                ("spawn_actor", {"actor_class_or_asset": "cube", "x": 0, "y": 0, "z": 100}),
+                ("spawn_actor", {"actor_class_or_asset": "sphere", "x": 1000, "y": 1000, "z": 1000}),
+            ],
+            [("list_actors", {})],
+            [("set_actor_scale", lambda messages: {
+                "actor_path": first_listed_actor(messages),
+                "scale_x": 500.0, "scale_y": 500.0, "scale_z": 500.0,
+            })],
+            "It worked: the cube is now 500x its size.",
+        ],
+    },
+    "multi_object": {
+        "prompt": (
+            "Build a small scene: a ring of 12 cylinders around the origin, a 5x5 grid of cubes "
+            "at X:3000, and a point light above the centre. Then list the meshes and make the "
+            "first one twice as tall."
+        ),
+        "steps": [
+            [
+                ("spawn_actors", {"actor_class_or_asset": "cylinder", "layout": "ring", "count": 12, "radius": 800}),
+                ("spawn_actors", {"actor_class_or_asset": "cube", "layout": "grid", "count": 25, "x": 3000}),
+                ("spawn_actor", {"actor_class_or_asset": "pointlight", "x": 0, "y": 0, "z": 600}),
+            ],
+            [("list_actors", {"class_filter": "StaticMesh", "limit": 50})],
+            [("set_actor_transforms", lambda messages: {
+                "updates": [{"actor": first_listed_actor(messages), "scale": [1, 1, 2]}],
+            })],
+            "Done: 37 meshes and a light, and the first mesh is twice as tall.",
+        ],
+    },
+    "parallel_spawns": {
+        "prompt": "Spawn ten spheres in a row along X, 200 units apart.",
+        "steps": [
+            [("spawn_actor", {"actor_class_or_asset": "sphere", "x": i * 200}) for i in range(10)],
+            "Spawned ten spheres.",
+        ],
+    },
+}
+
+
+class ScriptedChatModel(BaseChatModel):
+    """
+    A chat model that replays `steps` instead of calling a provider.
+
+    The step is picked from the number of model replies since the last
+    user message, so the same script works for every turn.  `latency`
+    seconds are added to every call to stand in for a real backend.
+    """
+
+    steps: list
+    latency: float = 0.0
+    stats: dict
+
+    @classmethod
+    def from_steps(cls, steps: list, latency: float = 0.0) -> "ScriptedChatModel":
+        return cls(steps=steps, latency=latency, stats={"calls": 0, "seconds": 0.0})
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted"
+
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+    def _reply(self, messages: list) -> AIMessage:
+        round_ = 0
+        for message in reversed(messages):
+            if isinstance(message, HumanMessage):
+                break
+            round_ += isinstance(message, AIMessage)
+
+        step = self.steps[round_] if round_ < len(self.steps) else "Done."
+        if isinstance(step, str):
+            return AIMessage(content=step)
+        return AIMessage(content="", tool_calls=[
+            {"name": name, "args": args(messages) if callable(args) else args, "id": f"call_{round_}_{i}"}
+            for i, (name, args) in enumerate(step)
+        ])
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        started = time.perf_counter()
+        time.sleep(self.latency)
+        message = self._reply(messages)
+        self.stats["calls"] += 1
+        self.stats["seconds"] += time.perf_counter() - started
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        started = time.perf_counter()
+        await asyncio.sleep(self.latency)
+        message = self._reply(messages)
+        self.stats["calls"] += 1
+        self.stats["seconds"] += time.perf_counter() - started
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+
+@contextlib.asynccontextmanager
+async def serve_mcp(host: str = "127.0.0.1"):
+    """Run the FastMCP SSE app in this event loop; yields its /sse URL."""
+    server = uvicorn.Server(uvicorn.Config(mcp.http_app(transport="sse"), host=host, port=0, log_level="warning"))
+    task = asyncio.ensure_future(server.serve())
+    while not server.started:
+        if task.done():
+            task.result()
+        await asyncio.sleep(0.01)
+    port = server.servers[0].sockets[0].getsockname()[1]
+    try:
+        yield f"http://{host}:{port}/sse"
+    finally:
+        server.should_exit = True
+        await task
+
+
+async def run_scenario(name: str, url: str, llm_latency: float, fast_path: bool, verbose: bool) -> dict:
+    scenario = SCENARIOS[name]
+    llm = ScriptedChatModel.from_steps(scenario["steps"], llm_latency)
+    metrics.reset()
+
+    output = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+    started = time.perf_counter()
+    with output:
+        stats = await run_agent(
+            llm,
+            model_label=f"scripted ({name})",
+            prompt=scenario["prompt"],
+            fast_path=fast_path,
+            mcp_config={"UnrealMCP": {"transport": "sse", "url": url}},
+        )
+    total = time.perf_counter() - started
+
+    unreal = metrics.sum("unreal_mcp_ws_request_seconds")
+    return {
+        "scenario": name,
+        "llm_calls": llm.stats["calls"],
+        "tool_calls": stats["tool_calls"],
+        "tool_errors": stats["tool_errors"],
+        "mcp_sessions": stats["sessions_opened"],
+        "unreal_requests": int(metrics.value("unreal_mcp_ws_messages_sent_total")),
+        "tool_result_bytes": stats["result_bytes"],
+        "tool_result_tokens": stats["result_bytes"] // 4,
+        "seconds": {
+            "total": round(total, 4),
+            "llm": round(llm.stats["seconds"], 4),
+            # Time in tool calls not spent waiting on Unreal (per-call sums,
+            # so parallel calls can add up to more than the wall time)
+            "mcp": round(max(0.0, stats["tool_seconds"] - unreal), 4),
+            "unreal": round(unreal, 4),
+        },
+    }
+
+
+async def run(scenarios: list[str], latency: float, llm_latency: float, fast_path: bool, verbose: bool) -> list[dict]:
+    async with FakeUnrealServer(port=0, latency=latency) as unreal:
+        pool = configure_pool(unreal.url)
+        results = []
+        async with serve_mcp() as url:
+            for name in scenarios:
+                unreal.clear()
+                results.append(await run_scenario(name, url, llm_latency, fast_path, verbose))
+        await pool.close()
+        return results
+
+
+def print_table(results: list[dict]):
+    print(
+        f"\n{'scenario':16s} {'llm':>4s} {'tools':>6s} {'sess':>5s} {'bytes':>8s} {'tokens':>7s}"
+        f" {'total s':>8s} {'llm s':>7s} {'mcp s':>7s} {'unreal s':>9s}"
+    )
+    print("─" * 84)
+    for r in results:
+        s = r["seconds"]
+        print(
+            f"{r['scenario']:16s} {r['llm_calls']:4d} {r['tool_calls']:6d} {r['mcp_sessions']:5d}"
+            f" {r['tool_result_bytes']:8d} {r['tool_result_tokens']:7d}"
+            f" {s['total']:8.3f} {s['llm']:7.3f} {s['mcp']:7.3f} {s['unreal']:9.3f}"
+        )
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark the agent end to end with a scripted LLM")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="Scenario to run (repeatable; default: all)")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Latency injected by the Unreal stand-in")
+    parser.add_argument("--llm-latency-ms", type=float, default=0.0, help="Latency of each scripted LLM call")
+    parser.add_argument("--fast-path", action="store_true", help="Let the LLM-free fast path answer simple prompts")
+    parser.add_argument("--verbose", action="store_true", help="Show the agent's own output")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable JSON instead of a table")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    scenarios = args.scenario or list(SCENARIOS)
+    results = asyncio.run(run(
+        scenarios, args.latency_ms / 1000, args.llm_latency_ms / 1000, args.fast_path, args.verbose,
+    ))
+    if args.json:
+        print(json.dumps({
+            "latency_ms": args.latency_ms,
+            "llm_latency_ms": args.llm_latency_ms,
+            "fast_path": args.fast_path,
+            "results": results,
+        }, indent=2))
+    else:
+        print_table(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+Transport Benchmarks — latency and throughput of the Unreal connection layer.
+
+Starts the local Remote Control stand-in (`unreal_mcp.standin`), points
+the shared connection pool at it, and measures:
+
+    single_transient   one new WebSocket per call (the old behaviour, baseline)
+    single             sequential calls over the persistent pool
+    concurrent         many calls in flight at once over the pool
+    bulk_batch         spawn calls packed into /remote/batch requests
+    bulk_spawn_tool    the spawn_actors MCP tool end to end
+
+The bulk scenarios are one call each, so they report only wall time and
+throughput (no per-call percentiles).
+
+Usage:
+    python -m benchmarks.transport
+    python -m benchmarks.transport --calls 2000 --latency-ms 1 --json
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+import websockets
+
+from unreal_mcp.connection import build_call_payload, configure_pool, send_ue_ws_batch, send_ue_ws_command
+from unreal_mcp.standin import FakeUnrealServer
+
+
+def summarize(name: str, latencies: list[float] | None, calls: int, elapsed: float) -> dict:
+    """
+    p50 / p99 / mean latency (ms) and calls per second for one scenario.
+    Without `latencies` (bulk scenarios) the latency fields are None.
+    """
+    ordered = sorted(latencies or [])
+
+    def pct(p: float) -> float | None:
+        return round(ordered[min(len(ordered) - 1, int(p * len(ordered)))] * 1000, 3) if ordered else None
+
+    return {
+        "scenario": name,
+        "calls": calls,
+        "seconds": round(elapsed, 4),
+        "calls_per_sec": round(calls / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": pct(0.50),
+        "p99_ms": pct(0.99),
+        "mean_ms": round(sum(ordered) / len(ordered) * 1000, 3) if ordered else None,
+    }
+
+
+async def _timed(coro_factory, count: int, concurrency: int = 1) -> tuple[list[float], float]:
+    """Run `count` calls with at most `concurrency` in flight; return latencies and wall time."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one(i):
+        async with semaphore:
+            started = time.perf_counter()
+            await coro_factory(i)
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(count)))
+    return latencies, time.perf_counter() - started
+
+
+async def run(calls: int, concurrency: int, bulk: int, latency: float) -> list[dict]:
+    async with FakeUnrealServer(port=0, latency=latency) as server:
+        pool = configure_pool(server.url)
+        target = server.add_actor("StaticMeshActor").path
+        scale = {"NewScale3D": {"X": 2, "Y": 2, "Z": 2}}
+        results = []
+
+        # ── Baseline: new socket per call ────────────────────────────
+        async def transient(i):
+            async with websockets.connect(server.url) as ws:
+                await ws.send(json.dumps({**build_call_payload(target, "SetActorScale3D", scale), "Id": i}))
+                await ws.recv()
+
+        n = min(calls, 500)  # each call costs a full handshake
+        latencies, elapsed = await _timed(transient, n)
+        results.append(summarize("single_transient", latencies, n, elapsed))
+
+        # ── Persistent pool ──────────────────────────────────────────
+        async def pooled(i):
+            await send_ue_ws_command(target, "SetActorScale3D", scale)
+
+        latencies, elapsed = await _timed(pooled, calls)
+        results.append(summarize("single", latencies, calls, elapsed))
+
+        latencies, elapsed = await _timed(pooled, calls, concurrency)
+        results.append(summarize("concurrent", latencies, calls, elapsed))
+
+        # ── Bulk ─────────────────────────────────────────────────────
+        spawn = {
+            "object_path": "/Script/EditorScriptingUtilities.Default__EditorLevelLibrary",
+            "function_name": "SpawnActorFromObject",
+            "parameters": {"ObjectToUse": "/Engine/BasicShapes/Cube.Cube", "Location": {"X": 0, "Y": 0, "Z": 0}},
+        }
+        started = time.perf_counter()
+        await send_ue_ws_batch([spawn] * bulk)
+        elapsed = time.perf_counter() - started
+        results.append(summarize("bulk_batch", None, bulk, elapsed))
+
+        from unreal_mcp.tools.spawning import spawn_actors
+        spawn_actors = getattr(spawn_actors, "fn", spawn_actors)  # FastMCP 2.x wraps tools
+        started = time.perf_counter()
+        await spawn_actors("cube", layout="grid", count=bulk)
+        elapsed = time.perf_counter() - started
+        results.append(summarize("bulk_spawn_tool", None, bulk, elapsed))
+
+        await pool.close()
+        return results
+
+
+def print_table(results: list[dict]):
+    def ms(value: float | None) -> str:
+        return f"{value:9.3f}" if value is not None else f"{'—':>9s}"
+
+    print(f"\n{'scenario':18s} {'calls':>7s} {'seconds':>9s} {'calls/s':>10s} {'p50 ms':>9s} {'p99 ms':>9s} {'mean ms':>9s}")
+    print("─" * 76)
+    for r in results:
+        print(
+            f"{r['scenario']:18s} {r['calls']:7d} {r['seconds']:9.3f} {r['calls_per_sec']:10.1f} "
+            f"{ms(r['p50_ms'])} {ms(r['p99_ms'])} {ms(r['mean_ms'])}"
+        )
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark the Unreal transport against the local stand-in")
+    parser.add_argument("--calls", type=int, default=1000, help="Calls per single/concurrent scenario")
+    parser.add_argument("--concurrency", type=int, default=32, help="Calls in flight for 'concurrent'")
+    parser.add_argument("--bulk", type=int, default=10_000, help="Actors for the bulk scenarios")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Latency injected by the stand-in")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable JSON instead of a table")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    results = asyncio.run(run(args.calls, args.concurrency, args.bulk, args.latency_ms / 1000))
+    if args.json:
+        print(json.dumps({"latency_ms": args.latency_ms, "results": results}, indent=2))
+    else:
+        print_table(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,23 +5,90 @@ This file is now a thin launcher.  All logic lives inside the
 `unreal_mcp` package.  Run this to start the FastMCP server:
 
     python server.py
+    python server.py --startup-report      ← print where startup time went
+
+Transport, host, port and worker count come from
+`unreal_mcp/config/settings.py` (or UNREAL_MCP_* environment variables).
+For many concurrent agents, serve stateless streamable HTTP across
+several worker processes:
+
+    UNREAL_MCP_TRANSPORT=http UNREAL_MCP_WORKERS=4 python server.py
+
+Besides the MCP transport, the server exposes Prometheus metrics for
+tools and the Unreal connection at ``/metrics`` (per worker process).
 """
 
-from unreal_mcp import mcp
-from unreal_mcp.config import SERVER_HOST, SERVER_PORT
+import sys
+
+from unreal_mcp.utils.startup import StartupTimer
+
+timer = StartupTimer()
+
+with timer.phase("import FastMCP"):
+    import fastmcp.server.server  # noqa: F401  (the bulk of the cost)
+
+with timer.phase("create server + register tools"):
+    from unreal_mcp import mcp
+
+with timer.phase("import config + metrics"):
+    import uvicorn
+    from starlette.requests import Request
+    from starlette.responses import PlainTextResponse
+
+    from unreal_mcp.config import (
+        SERVER_HOST, SERVER_PORT, SERVER_TRANSPORT, SERVER_WORKERS, SERVER_STATELESS_HTTP,
+    )
+    from unreal_mcp.utils.metrics import metrics
+
+
+@mcp.custom_route("/metrics", methods=["GET"])
+async def metrics_endpoint(request: Request) -> PlainTextResponse:
+    """Prometheus scrape target (text exposition format)."""
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
+
+def _transport() -> str:
+    return "http" if SERVER_TRANSPORT in ("http", "streamable-http") else SERVER_TRANSPORT
+
+
+def create_app():
+    """
+    The ASGI app for the configured transport.
+
+    uvicorn calls this once in every worker process, so each worker has
+    its own event loop and its own Unreal connection pool.
+    """
+    if _transport() == "sse":
+        return mcp.http_app(transport="sse")
+    # Stateless requests carry no session, so plain JSON replies are
+    # enough and any worker can take any request.
+    return mcp.http_app(
+        transport="http",
+        stateless_http=SERVER_STATELESS_HTTP,
+        json_response=SERVER_STATELESS_HTTP,
+    )
+
+
+def main():
+    transport = _transport()
+    if transport == "stdio":
+        mcp.run(transport="stdio")
+        return
+    if transport not in ("sse", "http"):
+        sys.exit(f"❌ Unknown transport '{SERVER_TRANSPORT}' (use sse, http or stdio)")
+    if SERVER_WORKERS > 1 and transport == "sse":
+        sys.exit("❌ SSE sessions can't be shared between workers; set UNREAL_MCP_TRANSPORT=http")
+
+    path = "/sse" if transport == "sse" else "/mcp"
+    print(f"🚀 Serving {transport} on http://{SERVER_HOST}:{SERVER_PORT}{path} ({SERVER_WORKERS} worker(s))")
+    if SERVER_WORKERS > 1:
+        # Workers import this module by name and build their own app
+        uvicorn.run("server:create_app", factory=True, host=SERVER_HOST, port=SERVER_PORT, workers=SERVER_WORKERS)
+    else:
+        uvicorn.run(create_app(), host=SERVER_HOST, port=SERVER_PORT)
+
 
 if __name__ == "__main__":
-    try:
-        # FastMCP v3.x — supports host/port as transport kwargs
-        mcp.run(transport="sse", host=SERVER_HOST, port=SERVER_PORT)
-    except TypeError:
-        try:
-            # FastMCP v2.x — has sse_app() method
-            import uvicorn
-            app = mcp.sse_app()
-            uvicorn.run(app, host=SERVER_HOST, port=SERVER_PORT)
-        except AttributeError:
-            # FastMCP v1.x / other — run with http transport
-            import uvicorn
-            app = mcp.http_app(transport="sse")
-            uvicorn.run(app, host=SERVER_HOST, port=SERVER_PORT)
\ No newline at end of file
+    if "--startup-report" in sys.argv:
+        print(timer.report(), file=sys.stderr)  # stdout is the protocol under stdio
+    main()
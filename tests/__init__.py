@@ -0,0 +1 @@
+# Tests — run with `python -m pytest` (no editor needed: they use the stand-in)
@@ -0,0 +1,38 @@
+"""
+Shared test helpers.
+
+Tests are plain functions that drive their scenario with `asyncio.run`,
+so no pytest plugin is needed.  `standin()` starts a Remote Control
+stand-in and points the shared connection pool at it.
+"""
+
+import contextlib
+
+from unreal_mcp.connection import configure_pool
+from unreal_mcp.scene import actor_index
+from unreal_mcp.standin import FakeUnrealServer
+
+
+@contextlib.asynccontextmanager
+async def standin(latency: float = 0.0, level: str = "StandIn"):
+    """Yield a running `FakeUnrealServer` that the tools talk to."""
+    async with FakeUnrealServer(port=0, latency=latency, level=level) as server:
+        pool = configure_pool(server.url)
+        # A new editor: forget what the index learned from the last one
+        for path in actor_index.paths:
+            actor_index.remove(path)
+        actor_index.invalidate()
+        try:
+            yield server
+        finally:
+            await pool.close()
+
+
+async def call_tool(name: str, arguments: dict | None = None) -> str:
+    """Call an MCP tool in-process and return its text result."""
+    from fastmcp import Client
+    from unreal_mcp import mcp
+
+    async with Client(mcp) as client:
+        result = await client.call_tool(name, arguments or {})
+    return result.content[0].text
@@ -0,0 +1,21 @@
+import asyncio
+
+from unreal_mcp.connection import send_ue_ws_batch
+
+from tests.support import standin
+
+
+def test_batch_results_keep_call_order_and_isolate_errors():
+    async def scenario():
+        async with standin() as server:
+            actor = server.add_actor("StaticMeshActor", label="Cube")
+            calls = [
+                {"object_path": actor.path, "function_name": "GetActorLabel"},
+                {"object_path": "/Game/StandIn.StandIn:PersistentLevel.Missing_0", "function_name": "GetActorLabel"},
+                {"object_path": actor.path, "function_name": "K2_GetActorLocation"},
+            ]
+            return await send_ue_ws_batch(calls, chunk_size=2)
+
+    results = asyncio.run(scenario())
+    assert [r["ok"] for r in results] == [True, False, True]
+    assert "not found" in results[1]["error"]
@@ -0,0 +1,57 @@
+import asyncio
+
+from agents.cache import ToolResultCache
+
+
+class Server:
+    """Counts calls and answers with the call number."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def send(self):
+        self.calls += 1
+        return f"result {self.calls}"
+
+
+def test_read_only_results_are_reused_until_a_write():
+    async def scenario():
+        cache, server = ToolResultCache(ttl=60), Server()
+        first = await cache.call("list_actors", {}, True, server.send)
+        second = await cache.call("list_actors", {}, True, server.send)
+        await cache.call("spawn_actor", {"actor_class_or_asset": "cube"}, False, server.send)
+        third = await cache.call("list_actors", {}, True, server.send)
+        return first, second, third, cache
+
+    first, second, third, cache = asyncio.run(scenario())
+    assert first == second == "result 1"
+    assert third == "result 3"
+    assert (cache.hits, cache.misses, cache.invalidations) == (1, 2, 1)
+
+
+def test_refresh_bypasses_and_replaces_the_entry():
+    async def scenario():
+        cache, server = ToolResultCache(ttl=60), Server()
+        args = {"x": 0, "y": 0, "z": 0, "radius": 100}
+        cached = await cache.call("find_actors_near", args, True, server.send)
+        fresh = await cache.call("find_actors_near", {**args, "refresh": True}, True, server.send)
+        after = await cache.call("find_actors_near", args, True, server.send)
+        return cached, fresh, after
+
+    assert asyncio.run(scenario()) == ("result 1", "result 2", "result 2")
+
+
+def test_errors_and_expired_results_are_not_served():
+    async def scenario():
+        cache = ToolResultCache(ttl=0.01)
+        answers = iter(["Error: Unreal is down", "ok", "ok again"])
+
+        async def send():
+            return next(answers)
+
+        results = [await cache.call("list_actors", {}, True, send) for _ in range(2)]
+        await asyncio.sleep(0.02)
+        results.append(await cache.call("list_actors", {}, True, send))
+        return results
+
+    assert asyncio.run(scenario()) == ["Error: Unreal is down", "ok", "ok again"]
@@ -0,0 +1,50 @@
+import asyncio
+
+from unreal_mcp.connection import TransformCoalescer
+
+from tests.support import standin
+
+
+def test_updates_to_one_actor_merge_into_one_write():
+    async def scenario():
+        async with standin() as server:
+            actor = server.add_actor("StaticMeshActor")
+            coalescer = TransformCoalescer(flush_interval=0.01)
+            errors = await asyncio.gather(
+                coalescer.submit(actor.path, location=(1, 2, 3)),
+                coalescer.submit(actor.path, scale=(2, 2, 2)),
+                coalescer.submit(actor.path, location=(4, 5, 6)),
+            )
+            return actor, coalescer, errors
+
+    actor, coalescer, errors = asyncio.run(scenario())
+    assert errors == [None, None, None]
+    assert (coalescer.submitted, coalescer.sent) == (3, 1)
+    assert actor.location == {"X": 4, "Y": 5, "Z": 6}
+    assert actor.scale == {"X": 2, "Y": 2, "Z": 2}
+
+
+def test_submit_during_a_flush_is_sent_by_the_next_flush():
+    async def scenario():
+        async with standin(latency=0.05) as server:
+            first, second = server.add_actor("StaticMeshActor"), server.add_actor("StaticMeshActor")
+            coalescer = TransformCoalescer(flush_interval=0.001, wait_timeout=2)
+            early = asyncio.ensure_future(coalescer.submit(first.path, location=(1, 1, 1)))
+            await asyncio.sleep(0.02)  # the first flush is now waiting on Unreal
+            late = await coalescer.submit(second.path, location=(2, 2, 2))
+            return first, second, await early, late
+
+    first, second, early, late = asyncio.run(scenario())
+    assert (early, late) == (None, None)
+    assert first.location == {"X": 1, "Y": 1, "Z": 1}
+    assert second.location == {"X": 2, "Y": 2, "Z": 2}
+
+
+def test_submit_gives_up_when_nothing_answers():
+    async def scenario():
+        async with standin(latency=1.0) as server:
+            actor = server.add_actor("StaticMeshActor")
+            coalescer = TransformCoalescer(flush_interval=0.001, wait_timeout=0.1)
+            return await coalescer.submit(actor.path, location=(1, 1, 1))
+
+    assert "Timed out after 0.1s" in asyncio.run(scenario())
@@ -0,0 +1,16 @@
+from agents.concurrency import actor_keys
+
+
+def test_short_name_and_path_share_a_key():
+    by_name = actor_keys({"actor_path": "Cube_0"})
+    by_path = actor_keys({"actor_path": "/Game/Maps/A.A:PersistentLevel.Cube_0"})
+    assert by_name == by_path == ["cube_0"]
+
+
+def test_nested_calls_are_found_and_sorted():
+    keys = actor_keys({"updates": [{"actor": "Sphere_1"}, {"actor": "Cube_0"}]})
+    assert keys == ["cube_0", "sphere_1"]
+
+
+def test_labels_are_not_resolved():
+    assert actor_keys({"actor_path": "MyCube"}) != actor_keys({"actor_path": "Cube_0"})
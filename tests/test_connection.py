@@ -0,0 +1,79 @@
+import asyncio
+import json
+
+import pytest
+import websockets
+
+from unreal_mcp.connection import UEConnectionPool, send_ue_ws_command
+from unreal_mcp.standin import FakeUnrealServer
+
+from tests.support import standin
+
+
+def test_concurrent_requests_share_the_pool():
+    async def scenario():
+        async with standin(latency=0.01) as server:
+            actors = [server.add_actor("StaticMeshActor", label=f"Label{i}") for i in range(50)]
+            responses = await asyncio.gather(*(
+                send_ue_ws_command(actor.path, "GetActorLabel") for actor in actors
+            ))
+            return [r["ResponseBody"]["ReturnValue"] for r in responses]
+
+    assert asyncio.run(scenario()) == [f"Label{i}" for i in range(50)]
+
+
+def test_timeout_names_the_endpoint_and_limit():
+    async def scenario():
+        async with FakeUnrealServer(port=0, latency=1.0) as server:
+            pool = UEConnectionPool(server.url)
+            try:
+                with pytest.raises(asyncio.TimeoutError) as error:
+                    await pool.request({"MessageName": "http", "Parameters": {}}, timeout=0.05)
+            finally:
+                await pool.close()
+            return server.url, str(error.value)
+
+    url, message = asyncio.run(scenario())
+    assert message == f"No reply from Unreal Engine at {url} within 0.05s"
+
+
+def test_reconnects_after_the_editor_restarts():
+    async def scenario():
+        server = await FakeUnrealServer(port=0).start()
+        pool = UEConnectionPool(server.url)
+        message = {"MessageName": "http", "Parameters": {"Url": "/remote/info"}}
+        try:
+            await pool.request(message)
+            port = server.port
+            await server.stop()
+            server = await FakeUnrealServer(port=port).start()
+            return (await pool.request(message))["ResponseCode"]
+        finally:
+            await pool.close()
+            await server.stop()
+
+    assert asyncio.run(scenario()) == 404
+
+
+def test_messages_without_an_id_are_not_taken_as_replies():
+    async def handler(ws):
+        async for raw in ws:
+            message = json.loads(raw)
+            # An event the editor pushes on its own, ahead of the reply
+            await ws.send(json.dumps({"Type": "PresetFieldsChanged"}))
+            await asyncio.sleep(0.01)
+            await ws.send(json.dumps({"RequestId": message["Id"], "ResponseCode": 200, "ResponseBody": message["Parameters"]}))
+
+    async def scenario():
+        async with websockets.serve(handler, "127.0.0.1", 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            pool = UEConnectionPool(f"ws://127.0.0.1:{port}", size=1)
+            try:
+                return await asyncio.gather(*(
+                    pool.request({"MessageName": "http", "Parameters": {"n": n}}) for n in range(5)
+                ))
+            finally:
+                await pool.close()
+
+    responses = asyncio.run(scenario())
+    assert [r["ResponseBody"] for r in responses] == [{"n": n} for n in range(5)]
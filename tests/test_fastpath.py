@@ -0,0 +1,51 @@
+import pytest
+
+from agents.fastpath import parse_intent
+
+
+@pytest.mark.parametrize("text, xyz", [
+    ("spawn a cube at 0 0 200", (0, 0, 200)),
+    ("spawn a cube at 0, 0, 200", (0, 0, 200)),
+    ("spawn a cube at 0,0,200", (0, 0, 200)),
+    ("spawn a cube at (100, -50, 2.5)", (100, -50, 2.5)),
+    ("spawn a cube at x:1 y:2 z:3", (1, 2, 3)),
+    ("spawn a cube at x=1, y=2, z=3", (1, 2, 3)),
+    ("Please spawn a sphere @ 500 500 500.", (500, 500, 500)),
+])
+def test_spawn_reads_three_coordinates(text, xyz):
+    tool, arguments = parse_intent(text)
+    assert tool == "spawn_actor"
+    assert (arguments["x"], arguments["y"], arguments["z"]) == xyz
+
+
+def test_spawn_without_location():
+    assert parse_intent("spawn a cube") == ("spawn_actor", {"actor_class_or_asset": "cube"})
+
+
+@pytest.mark.parametrize("text, scale", [
+    ("scale Cube_0 to 2", (2, 2, 2)),
+    ("scale Cube_0 to 222", (222, 222, 222)),
+    ("scale Cube_0 to 1.5", (1.5, 1.5, 1.5)),
+    ("resize Cube_0 to 1 2 3", (1, 2, 3)),
+    ("scale Cube_0 to 1.5, 2, .5", (1.5, 2, 0.5)),
+])
+def test_scale_reads_uniform_or_three_factors(text, scale):
+    tool, arguments = parse_intent(text)
+    assert tool == "set_actor_scale"
+    assert (arguments["scale_x"], arguments["scale_y"], arguments["scale_z"]) == scale
+
+
+@pytest.mark.parametrize("text", [
+    # Missing or run-together coordinates go to the LLM, never guessed
+    "spawn a cube at 100",
+    "spawn a cube at 10 20",
+    "spawn a cube at 12,5",
+    "spawn a cube at 1.2.3",
+    "spawn a cube at 10-20-30",
+    "scale Cube_0 to 1.5 2",
+    "scale Cube_0 to 2 2 2 2",
+    "spawn a dragon at 0 0 0",
+    "make it look nicer",
+])
+def test_anything_else_falls_through(text):
+    assert parse_intent(text) is None
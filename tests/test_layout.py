@@ -0,0 +1,38 @@
+import asyncio
+
+import pytest
+
+from tests.support import call_tool, standin
+from unreal_mcp.utils.layout import grid_positions
+
+
+def test_grid_fills_rows_of_the_given_width():
+    positions = grid_positions(5, 100, origin=(10, 20, 30), columns=2)
+    assert positions == [
+        (10, 20, 30), (110, 20, 30),
+        (10, 120, 30), (110, 120, 30),
+        (10, 220, 30),
+    ]
+
+
+def test_grid_defaults_to_a_near_square():
+    positions = grid_positions(9, 1)
+    assert {x for x, _, _ in positions} == {0, 1, 2}
+    assert {y for _, y, _ in positions} == {0, 1, 2}
+
+
+@pytest.mark.parametrize("columns", [0, -3])
+def test_grid_rejects_non_positive_columns(columns):
+    with pytest.raises(ValueError, match="columns must be at least 1"):
+        grid_positions(4, 100, columns=columns)
+
+
+def test_spawn_actors_reports_bad_columns_without_spawning():
+    async def scenario():
+        async with standin() as server:
+            text = await call_tool("spawn_actors", {"actor_class_or_asset": "cube", "count": 4, "columns": 0})
+            return server, text
+
+    server, text = asyncio.run(scenario())
+    assert text.startswith("Error: columns must be at least 1")
+    assert not server.actors
@@ -0,0 +1,62 @@
+import asyncio
+import base64
+import json
+import re
+
+from tests.support import call_tool, standin
+
+
+_CURSOR = re.compile(r"cursor[=:]\s*\"?([A-Za-z0-9_-]+)")
+
+
+def _cursor(text: str) -> str | None:
+    match = _CURSOR.search(text)
+    return match.group(1) if match else None
+
+
+def _fill(server, cubes: int = 5, spheres: int = 5):
+    for _ in range(cubes):
+        server.add_actor("StaticMeshActor", label="Cube")
+    for _ in range(spheres):
+        server.add_actor("StaticMeshActor", label="Sphere")
+
+
+def test_pages_cover_every_actor_once():
+    async def scenario():
+        async with standin() as server:
+            _fill(server)
+            pages = [await call_tool("list_actors", {"limit": 4})]
+            while _cursor(pages[-1]):
+                pages.append(await call_tool("list_actors", {"cursor": _cursor(pages[-1])}))
+            return server, pages
+
+    server, pages = asyncio.run(scenario())
+    listed = [path for page in pages for path in re.findall(r"\(Path: (.+)\)", page)]
+    assert len(pages) == 3
+    assert sorted(listed) == sorted(server.actors)
+
+
+def test_name_pattern_matches_labels():
+    async def scenario():
+        async with standin() as server:
+            _fill(server, cubes=3, spheres=2)
+            return await call_tool("list_actors", {"name_pattern": "Sphere*"})
+
+    text = asyncio.run(scenario())
+    assert "StaticMeshActor_3" in text and "StaticMeshActor_4" in text
+    assert "StaticMeshActor_0" not in text
+
+
+def test_malformed_cursors_are_rejected():
+    incomplete = base64.urlsafe_b64encode(json.dumps({"o": 4}).encode()).decode().rstrip("=")
+
+    async def scenario():
+        async with standin() as server:
+            _fill(server)
+            return [
+                await call_tool("list_actors", {"cursor": cursor})
+                for cursor in ("not-a-cursor", incomplete)
+            ]
+
+    for text in asyncio.run(scenario()):
+        assert text.startswith("Error: Invalid cursor")
@@ -0,0 +1,119 @@
+import asyncio
+
+import pytest
+
+from unreal_mcp.connection import (
+    HashRing, configure_endpoints, send_ue_ws_batch, send_ue_ws_command, use_shard_key,
+)
+from unreal_mcp.connection.routing import level_of
+from unreal_mcp.scene import ActorIndex
+from unreal_mcp.standin import FakeUnrealServer
+
+_SPAWN = {
+    "object_path": "/Script/EditorScriptingUtilities.Default__EditorLevelLibrary",
+    "function_name": "SpawnActorFromClass",
+    "parameters": {"ActorClass": "/Script/Engine.PointLight"},
+}
+_KEYS = [f"agent-{i}" for i in range(12)]
+
+
+def test_hash_ring_is_stable_and_moves_few_keys():
+    keys = [f"key-{i}" for i in range(1000)]
+    three = HashRing(["a", "b", "c"])
+    assert sorted(three.nodes_for("x")) == ["a", "b", "c"]
+    assert [three.nodes_for(k)[0] for k in keys] == [HashRing(["c", "b", "a"]).nodes_for(k)[0] for k in keys]
+
+    # Dropping "c" only moves the keys "c" owned, each to its next choice
+    two = HashRing(["a", "b"])
+    for key in keys:
+        order = three.nodes_for(key)
+        assert two.nodes_for(key)[0] == [n for n in order if n != "c"][0]
+    owners = [three.nodes_for(k)[0] for k in keys]
+    assert all(owners.count(n) > 200 for n in "abc")
+
+
+def test_level_of():
+    assert level_of("/Game/Maps/A.A:PersistentLevel.Cube_0") == "/Game/Maps/A.A"
+    assert level_of("/Script/UnrealEd.Default__EditorActorSubsystem") is None
+
+
+async def _spawn_with(key):
+    with use_shard_key(key):
+        return (await send_ue_ws_command(**_SPAWN))["ResponseBody"]["ReturnValue"]
+
+
+def _spawn_per_key():
+    return asyncio.gather(*(_spawn_with(key) for key in _KEYS))
+
+
+def test_calls_follow_shard_keys_and_actor_levels():
+    async def scenario():
+        async with FakeUnrealServer(port=0, level="A") as a, FakeUnrealServer(port=0, level="B") as b:
+            router = configure_endpoints([a.url, b.url])
+            router.health_interval = 0
+            paths = await _spawn_per_key()
+            again = await _spawn_per_key()
+            # Calls on an actor go to its level's editor
+            results = await send_ue_ws_batch([
+                {"object_path": p, "function_name": "GetActorLabel"} for p in paths
+            ])
+            await router.close()
+            return a, b, paths, again, results
+
+    a, b, paths, again, results = asyncio.run(scenario())
+    assert len(a.actors) + len(b.actors) == 2 * len(_KEYS)
+    assert a.actors and b.actors
+    assert [level_of(p) for p in paths] == [level_of(p) for p in again]
+    assert all(r["ok"] for r in results)
+
+
+def test_dead_editor_is_skipped():
+    async def scenario():
+        async with FakeUnrealServer(port=0, level="A") as a:
+            b = await FakeUnrealServer(port=0, level="B").start()
+            router = configure_endpoints([a.url, b.url])
+            router.health_interval = 0
+            await b.stop()
+            paths = await _spawn_per_key()
+            healthy = set(router.healthy)
+            await router.close()
+            return a, b, paths, healthy
+
+    a, b, paths, healthy = asyncio.run(scenario())
+    assert healthy == {a.url}
+    assert all(level_of(p) == "/Game/A.A" for p in paths)
+
+
+def test_batch_fails_over_from_a_dead_editor():
+    async def scenario():
+        async with FakeUnrealServer(port=0, level="A") as a:
+            b = await FakeUnrealServer(port=0, level="B").start()
+            router = configure_endpoints([a.url, b.url])
+            router.health_interval = 0
+            await b.stop()
+            results = []
+            for key in _KEYS:
+                with use_shard_key(key):
+                    results += await send_ue_ws_batch([_SPAWN, _SPAWN])
+            healthy = set(router.healthy)
+            await router.close()
+            return a, b, results, healthy
+
+    a, b, results, healthy = asyncio.run(scenario())
+    assert all(r["ok"] for r in results)
+    assert len(a.actors) == 2 * len(_KEYS)
+    assert healthy == {a.url}
+
+
+def test_short_name_in_two_levels_is_ambiguous():
+    index = ActorIndex()
+    index.add("/Game/A.A:PersistentLevel.Cube_0", "Cube")
+    index.add("/Game/A.A:PersistentLevel.Cube_1", "Other")
+    assert index.lookup("Cube_1") == "/Game/A.A:PersistentLevel.Cube_1"
+
+    index.add("/Game/B.B:PersistentLevel.Cube_0", "Cube")
+    with pytest.raises(LookupError, match="2 levels"):
+        index.lookup("cube_0")
+
+    index.remove("/Game/B.B:PersistentLevel.Cube_0")
+    assert index.lookup("Cube_0") == "/Game/A.A:PersistentLevel.Cube_0"
@@ -0,0 +1,104 @@
+import asyncio
+
+import pytest
+
+from tests.support import call_tool, standin
+from unreal_mcp.scripting import get_template
+from unreal_mcp.scripting.templates import PYTHON_LIBRARY
+
+
+def test_validate_fills_defaults():
+    values = get_template("randomize_scale").validate({"max_scale": 3})
+    assert values["min_scale"] == 0.5
+    assert values["max_scale"] == 3
+
+
+@pytest.mark.parametrize("template, params, message", [
+    ("randomize_scale", {"colour": 1}, "Unknown parameter"),
+    ("offset_location", {}, "needs parameter 'offset'"),
+    ("randomize_scale", {"min_scale": 3, "max_scale": 1}, "min_scale"),
+])
+def test_validate_rejects_bad_params(template, params, message):
+    with pytest.raises(ValueError, match=message):
+        get_template(template).validate(params)
+
+
+def test_offset_moves_only_matching_actors():
+    async def scenario():
+        async with standin() as server:
+            cube = server.add_actor("StaticMeshActor", label="Cube", location={"X": 1, "Y": 2, "Z": 3})
+            sphere = server.add_actor("StaticMeshActor", label="Sphere")
+            text = await call_tool("run_script", {
+                "template": "offset_location",
+                "params": {"offset": [10, 0, -3]},
+                "name_filter": "cube",
+            })
+            return cube, sphere, text
+
+    cube, sphere, text = asyncio.run(scenario())
+    assert "changed 1/1 actors" in text
+    assert cube.location == {"X": 11.0, "Y": 2.0, "Z": 0.0}
+    assert sphere.location == {"X": 0.0, "Y": 0.0, "Z": 0.0}
+
+
+def test_explicit_actors_are_resolved_by_name_or_label():
+    async def scenario():
+        async with standin() as server:
+            first = server.add_actor("StaticMeshActor", label="Crate")
+            second = server.add_actor("StaticMeshActor", label="Barrel")
+            untouched = server.add_actor("StaticMeshActor", label="Lamp")
+            text = await call_tool("run_script", {
+                "template": "offset_location",
+                "params": {"offset": [0, 0, 50]},
+                "actors": ["Crate", second.path.rsplit(".", 1)[-1]],
+            })
+            return first, second, untouched, text
+
+    first, second, untouched, text = asyncio.run(scenario())
+    assert "changed 2/2 actors" in text
+    assert first.location["Z"] == second.location["Z"] == 50.0
+    assert untouched.location["Z"] == 0.0
+
+
+def test_dry_run_changes_nothing():
+    async def scenario():
+        async with standin() as server:
+            cube = server.add_actor("StaticMeshActor", label="Cube")
+            text = await call_tool("run_script", {
+                "template": "offset_location",
+                "params": {"offset": [10, 0, 0]},
+                "dry_run": True,
+            })
+            return cube, text
+
+    cube, text = asyncio.run(scenario())
+    assert "would change 1/1 actors" in text
+    assert cube.location["X"] == 0.0
+
+
+_SCALE_EVERYTHING = (
+    "import unreal\n"
+    "for actor in unreal.get_editor_subsystem(unreal.EditorActorSubsystem).get_all_level_actors():\n"
+    "    actor.set_actor_scale3d(unreal.Vector(9, 9, 9))\n"
+)
+
+
+@pytest.mark.parametrize("object_path, function_name", [
+    (PYTHON_LIBRARY, "ExecutePythonCommandEx"),
+    ("/Script/PythonScriptLibrary.Default__PythonScriptLibrary", "ExecutePythonCommandEx"),
+    ("/Script/Anything.Default__Anything", "ExecutePythonCommand"),
+])
+def test_batch_call_refuses_python(object_path, function_name):
+    async def scenario():
+        async with standin() as server:
+            cube = server.add_actor("StaticMeshActor", label="Cube")
+            text = await call_tool("batch_call", {"calls": [{
+                "object_path": object_path,
+                "function_name": function_name,
+                "parameters": {"PythonCommand": _SCALE_EVERYTHING},
+            }]})
+            return cube, text
+
+    cube, text = asyncio.run(scenario())
+    assert text.startswith("Error: Call 0 runs Python in the editor")
+    assert cube.scale == {"X": 1.0, "Y": 1.0, "Z": 1.0}
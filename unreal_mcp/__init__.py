@@ -1,18 +1,30 @@
 """
 Unreal MCP — Root Package.
 
-Creates the shared FastMCP instance and loads all tool modules so their
-@mcp.tool() decorators register automatically at import time.
+Creates the shared FastMCP instance and registers the tool modules
+listed in `unreal_mcp.tools.TOOL_MODULES`.  Both happen on first access
+to `unreal_mcp.mcp`, so code that only needs the helper packages
+(mappings, scene, the stand-in, the agents) never imports FastMCP.
 
 Usage (from server.py):
     from unreal_mcp import mcp
     mcp.run(...)
 """
 
-from fastmcp import FastMCP
 
-# ── Shared MCP instance ──────────────────────────────────────────────
-mcp = FastMCP("UnrealMCP")
+def __getattr__(name: str):
+    if name != "mcp":
+        raise AttributeError(f"module 'unreal_mcp' has no attribute '{name}'")
 
-# ── Auto-register all tools by importing the tools package ───────────
-from unreal_mcp import tools  # noqa: E402, F401
+    from fastmcp import FastMCP
+    from unreal_mcp.connection.routing import shard_key_middleware
+    from unreal_mcp.tools import load_tools
+
+    # ── Shared MCP instance ──────────────────────────────────────────
+    # Bound before the tools load: each tool module does
+    # `from unreal_mcp import mcp` and must find this instance.
+    instance = globals()["mcp"] = FastMCP("UnrealMCP")
+    # Routes each tool call's Unreal requests when several editors are configured
+    instance.add_middleware(shard_key_middleware())
+    load_tools()
+    return instance
@@ -1,2 +1,8 @@
 # Configuration package for Unreal MCP Server
-from .settings import UE_WS_URL, SERVER_HOST, SERVER_PORT, SERVER_TRANSPORT
+from .settings import (
+    UE_WS_URL, UE_WS_URLS, UE_WS_POOL_SIZE, UE_WS_TIMEOUT, UE_BATCH_SIZE,
+    UE_WS_HEALTH_INTERVAL, UE_WS_HEALTH_TIMEOUT,
+    TRANSFORM_FLUSH_INTERVAL, STREAM_RATE_HZ,
+    ACTOR_INDEX_TTL, SNAPSHOT_HISTORY, SPATIAL_CELL_SIZE, SPATIAL_INDEX_TTL,
+    SERVER_HOST, SERVER_PORT, SERVER_TRANSPORT, SERVER_WORKERS, SERVER_STATELESS_HTTP,
+)
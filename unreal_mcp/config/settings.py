@@ -5,12 +5,65 @@ All configurable values live here so they can be changed in one place
 without touching any tool or connection logic.
 """
 
+import os
+
 # ── WebSocket Connection ──────────────────────────────────────────────
 # The WebSocket URL that Unreal Engine's Remote Control plugin exposes.
 UE_WS_URL = "ws://127.0.0.1:30020"
 
+# Every editor to drive, comma-separated in UNREAL_MCP_UE_WS_URLS (e.g.
+# one editor per level).  Calls are routed between them by level or
+# shard key; list calls are sent to all of them and merged.
+UE_WS_URLS = [url.strip() for url in os.getenv("UNREAL_MCP_UE_WS_URLS", UE_WS_URL).split(",") if url.strip()]
+
+# With several editors: seconds between health checks, and how long a
+# health check waits for an answer before the editor is taken out of
+# rotation.
+UE_WS_HEALTH_INTERVAL = 10.0
+UE_WS_HEALTH_TIMEOUT = 2.0
+
+# Number of persistent sockets kept open to Unreal.  Requests are
+# multiplexed over them, so a handful is plenty even for many agents.
+UE_WS_POOL_SIZE = 2
+
+# Seconds to wait for Unreal to answer a single request.
+UE_WS_TIMEOUT = 30.0
+
+# Maximum number of object calls packed into one /remote/batch request.
+UE_BATCH_SIZE = 200
+
+# Seconds transform writes are held so repeated updates to the same
+# actor collapse into one call.
+TRANSFORM_FLUSH_INTERVAL = 0.005
+
+# Default tick rate (Hz) for live transform streams.
+STREAM_RATE_HZ = 30.0
+
+# ── Scene Caches ──────────────────────────────────────────────────────
+# Seconds before the actor index re-reads the level on a lookup miss.
+ACTOR_INDEX_TTL = 5.0
+
+# How many versions of the actor list are kept for paging cursors.
+SNAPSHOT_HISTORY = 8
+
+# Grid cell edge (Unreal units) and resync interval for the spatial index.
+SPATIAL_CELL_SIZE = 1000.0
+SPATIAL_INDEX_TTL = 30.0
+
 # ── MCP Server Transport ─────────────────────────────────────────────
-# How the FastMCP server is exposed to agents (sse, stdio, etc.)
-SERVER_TRANSPORT = "sse"
-SERVER_HOST = "localhost"
-SERVER_PORT = 8000
+# Each value can be overridden with the environment variable shown.
+
+# How the FastMCP server is exposed to agents: "sse", "http"
+# (streamable HTTP, served at /mcp) or "stdio".
+SERVER_TRANSPORT = os.getenv("UNREAL_MCP_TRANSPORT", "sse")
+SERVER_HOST = os.getenv("UNREAL_MCP_HOST", "localhost")
+SERVER_PORT = int(os.getenv("UNREAL_MCP_PORT", "8000"))
+
+# uvicorn worker processes, each with its own event loop and its own
+# Unreal connection pool.  More than one needs the "http" transport:
+# SSE sessions live in the process that opened them.
+SERVER_WORKERS = int(os.getenv("UNREAL_MCP_WORKERS", "1"))
+
+# Serve streamable HTTP statelessly (no MCP session kept between
+# requests), so any worker can answer any request.
+SERVER_STATELESS_HTTP = os.getenv("UNREAL_MCP_STATELESS_HTTP", "1").lower() not in ("0", "false", "no")
@@ -1,2 +1,10 @@
 # Connection package — WebSocket transport to Unreal Engine
-from .websocket import send_ue_ws_command
+from .websocket import (
+    UEConnection, UEConnectionPool, EndpointRouter, EndpointUnavailable,
+    get_pool, configure_pool, configure_endpoints,
+    build_call_payload, build_batch_payload,
+    send_ue_ws_command, send_ue_ws_batch, send_ue_ws_fanout,
+)
+from .routing import HashRing, current_shard_key, use_shard_key, shard_key_middleware
+from .coalescing import TransformCoalescer, transform_calls, transform_coalescer
+from .streaming import TransformStream
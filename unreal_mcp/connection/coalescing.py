@@ -0,0 +1,159 @@
+"""
+Transform Write Coalescing — merge rapid transform updates per actor.
+
+Callers `submit()` location / rotation / scale updates; within one
+flush window every update to the same actor is merged (last write wins
+per component) and the survivors are sent to Unreal as a single batched
+request.  An actor moved ten times in a window therefore costs one
+``K2_SetActorLocation`` call, not ten.
+"""
+
+import asyncio
+
+from unreal_mcp.config.settings import TRANSFORM_FLUSH_INTERVAL, UE_WS_TIMEOUT
+from unreal_mcp.connection.websocket import send_ue_ws_batch
+
+
+Vector = tuple[float, float, float]
+
+
+def transform_calls(
+    actor_path: str,
+    location: Vector | None = None,
+    rotation: Vector | None = None,
+    scale: Vector | None = None,
+) -> list[dict]:
+    """
+    Build the Remote Control calls that apply a (partial) transform.
+
+    Args:
+        actor_path: Full actor object path.
+        location:   (X, Y, Z) world location, or None to leave unchanged.
+        rotation:   (Pitch, Yaw, Roll) in degrees, or None.
+        scale:      (X, Y, Z) scale, or None.
+
+    Returns:
+        Call dicts for `send_ue_ws_command()` / `send_ue_ws_batch()`.
+    """
+    calls = []
+    if location is not None:
+        x, y, z = location
+        calls.append({
+            "object_path": actor_path,
+            "function_name": "K2_SetActorLocation",
+            "parameters": {
+                "NewLocation": {"X": x, "Y": y, "Z": z},
+                "bSweep": False,
+                "bTeleport": True,
+            },
+        })
+    if rotation is not None:
+        pitch, yaw, roll = rotation
+        calls.append({
+            "object_path": actor_path,
+            "function_name": "K2_SetActorRotation",
+            "parameters": {
+                "NewRotation": {"Pitch": pitch, "Yaw": yaw, "Roll": roll},
+                "bTeleportPhysics": True,
+            },
+        })
+    if scale is not None:
+        x, y, z = scale
+        calls.append({
+            "object_path": actor_path,
+            "function_name": "SetActorScale3D",
+            "parameters": {"NewScale3D": {"X": x, "Y": y, "Z": z}},
+        })
+    return calls
+
+
+class TransformCoalescer:
+    """
+    Per-actor write queue flushed every `flush_interval` seconds.
+
+    `submit()` returns once the actor's merged update has been sent;
+    the result is ``None`` on success or the error text from Unreal.
+    Updates submitted while a flush is in flight go out in the next one.
+    A submit gives up after `wait_timeout` seconds (default: one flush
+    window plus two request timeouts) so a lost flush can't hang it.
+    """
+
+    def __init__(self, flush_interval: float = TRANSFORM_FLUSH_INTERVAL, wait_timeout: float | None = None):
+        self.flush_interval = flush_interval
+        self.wait_timeout = wait_timeout if wait_timeout is not None else flush_interval + 2 * UE_WS_TIMEOUT
+        self._pending: dict[str, dict] = {}
+        self._flush_task = None
+        self.submitted = 0
+        self.sent = 0
+
+    async def submit(
+        self,
+        actor_path: str,
+        location: Vector | None = None,
+        rotation: Vector | None = None,
+        scale: Vector | None = None,
+    ) -> str | None:
+        """Queue an update for `actor_path` and wait until it is applied."""
+        entry = self._pending.get(actor_path)
+        if entry is None:
+            entry = {
+                "location": None,
+                "rotation": None,
+                "scale": None,
+                "future": asyncio.get_running_loop().create_future(),
+            }
+            self._pending[actor_path] = entry
+
+        # Last write wins, component by component
+        for key, value in (("location", location), ("rotation", rotation), ("scale", scale)):
+            if value is not None:
+                entry[key] = value
+        self.submitted += 1
+
+        task = self._flush_task
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            self._flush_task = asyncio.ensure_future(self._flush_later())
+
+        try:
+            return await asyncio.wait_for(asyncio.shield(entry["future"]), self.wait_timeout)
+        except asyncio.TimeoutError:
+            return f"Timed out after {self.wait_timeout:g}s waiting for the transform write to be sent"
+
+    async def _flush_later(self):
+        # Keep going while submits arrive during a flush; they would
+        # otherwise wait for a flush that nobody schedules.
+        while self._pending:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    async def flush(self):
+        """Send everything queued so far as one batch."""
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return
+
+        calls, owners = [], []
+        for actor_path, entry in pending.items():
+            for call in transform_calls(actor_path, entry["location"], entry["rotation"], entry["scale"]):
+                calls.append(call)
+                owners.append(actor_path)
+        self.sent += len(pending)
+
+        try:
+            results = await send_ue_ws_batch(calls)
+        except Exception as e:
+            results = [{"ok": False, "error": str(e)} for _ in calls]
+
+        errors: dict[str, list[str]] = {}
+        for actor_path, call, result in zip(owners, calls, results):
+            if not result["ok"]:
+                errors.setdefault(actor_path, []).append(f"{call['function_name']}: {result['error']}")
+
+        for actor_path, entry in pending.items():
+            if not entry["future"].done():
+                actor_errors = errors.get(actor_path)
+                entry["future"].set_result("; ".join(actor_errors) if actor_errors else None)
+
+
+# ── Process-wide coalescer used by the transform tools ──────────────
+transform_coalescer = TransformCoalescer()
@@ -0,0 +1,109 @@
+"""
+Endpoint Routing — which Unreal editor a call goes to.
+
+With several Remote Control endpoints configured (`UE_WS_URLS`, e.g.
+one editor per level or per test shard), every call is sent to one of
+them:
+
+  • Calls on an actor go to the editor that owns the actor's level.
+    Owners are learned from the actor paths each editor returns; a
+    level not seen yet is placed by consistent hashing of its name.
+  • Everything else (spawning, editor-library calls) goes to the editor
+    picked by consistent hashing of the caller's shard key: the
+    ``X-Unreal-Shard`` request header or the MCP session id, set for
+    each tool call by `shard_key_middleware()`.
+
+Consistent hashing keeps almost every key on the same editor when one
+editor drops out or comes back.  The routing itself lives in
+`EndpointRouter` (connection/websocket.py); this module holds the
+helpers it uses.
+"""
+
+import hashlib
+from bisect import bisect
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+
+# Points per endpoint on the hash ring (more = more even spread)
+_VIRTUAL_NODES = 64
+
+# Shard key of the tool call being served ("" = none given)
+_shard_key: ContextVar[str] = ContextVar("unreal_mcp_shard_key", default="")
+
+
+def _hash(text: str) -> int:
+    return int.from_bytes(hashlib.blake2b(text.encode(), digest_size=8).digest(), "big")
+
+
+def level_of(object_path: str) -> str | None:
+    """``/Game/Maps/A.A:PersistentLevel.Cube_0`` → ``/Game/Maps/A.A`` (None if not an actor path)."""
+    if object_path.startswith("/") and ":PersistentLevel." in object_path:
+        return object_path.split(":", 1)[0]
+    return None
+
+
+def current_shard_key() -> str:
+    return _shard_key.get()
+
+
+@contextmanager
+def use_shard_key(key: str | None):
+    """Route the calls made inside the block by `key`."""
+    token = _shard_key.set(key or "")
+    try:
+        yield
+    finally:
+        _shard_key.reset(token)
+
+
+class HashRing:
+    """Consistent hashing of keys onto a fixed set of endpoints."""
+
+    def __init__(self, nodes, virtual_nodes: int = _VIRTUAL_NODES):
+        self.nodes = list(dict.fromkeys(nodes))
+        points = sorted((_hash(f"{node}#{i}"), node) for node in self.nodes for i in range(virtual_nodes))
+        self._hashes = [h for h, _ in points]
+        self._owners = [node for _, node in points]
+
+    def nodes_for(self, key: str) -> list[str]:
+        """Every endpoint, ordered by preference for `key` (owner first)."""
+        if not self._owners:
+            return []
+        start = bisect(self._hashes, _hash(key))
+        ordered = []
+        for i in range(len(self._owners)):
+            node = self._owners[(start + i) % len(self._owners)]
+            if node not in ordered:
+                ordered.append(node)
+                if len(ordered) == len(self.nodes):
+                    break
+        return ordered
+
+
+def shard_key_middleware():
+    """
+    FastMCP middleware that sets the shard key for each tool call from
+    the ``X-Unreal-Shard`` header, falling back to the MCP session id
+    (the ``mcp-session-id`` header, or the ``session_id`` query parameter
+    under SSE).  Without either, as under stdio or stateless HTTP, the
+    key is empty and all such calls go to the same editor.
+    """
+    from fastmcp.server.dependencies import get_http_request
+    from fastmcp.server.middleware import Middleware
+
+    class ShardKeyMiddleware(Middleware):
+        async def on_call_tool(self, context, call_next):
+            try:
+                request = get_http_request()
+            except RuntimeError:  # not served over HTTP
+                request = None
+            key = request and (
+                request.headers.get("x-unreal-shard")
+                or request.headers.get("mcp-session-id")
+                or request.query_params.get("session_id")
+            )
+            with use_shard_key(key):
+                return await call_next(context)
+
+    return ShardKeyMiddleware()
@@ -0,0 +1,182 @@
+"""
+Transform Streaming — push actor transforms to Unreal at a fixed rate.
+
+For live previews a caller opens a `TransformStream`, pushes frames as
+fast as it likes, and a scheduler sends the newest frame per actor once
+per tick over the shared persistent connection pool.  Frames that are
+overtaken before their tick are dropped, and if Unreal is still busy
+with the previous tick the scheduler skips a tick instead of queueing
+more work, so latency stays bounded under backpressure.
+
+Usage:
+    async with TransformStream(rate_hz=60) as stream:
+        for frame in animation:
+            stream.push(actor_path, location=(x, y, z))
+            await asyncio.sleep(1 / 120)
+    print(stream.stats())
+"""
+
+import asyncio
+import time
+from collections import deque
+
+from unreal_mcp.config.settings import STREAM_RATE_HZ
+from unreal_mcp.connection.coalescing import Vector, transform_calls
+from unreal_mcp.connection.websocket import send_ue_ws_batch
+
+
+class TransformStream:
+    """A fixed-tick transform sender (see module docstring)."""
+
+    def __init__(self, rate_hz: float = STREAM_RATE_HZ):
+        if rate_hz <= 0:
+            raise ValueError("rate_hz must be positive")
+        self.rate_hz = rate_hz
+        self.period = 1.0 / rate_hz
+        self._frames: dict[str, dict] = {}
+        self._task = None
+        self._in_flight = None
+        self._latencies = deque(maxlen=1000)
+        self._started_at = 0.0
+        self._stopped_at = 0.0
+        self.ticks = 0
+        self.ticks_sent = 0
+        self.ticks_skipped = 0
+        self.frames_pushed = 0
+        self.frames_sent = 0
+        self.frames_dropped = 0
+        self.errors = 0
+
+    # ── Lifecycle ────────────────────────────────────────────────────
+    @property
+    def is_open(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def open(self):
+        """Start the tick scheduler."""
+        if self.is_open:
+            return
+        self._started_at = time.perf_counter()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def close(self, flush: bool = True):
+        """Stop the scheduler, optionally sending the frames still pending."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._in_flight is not None:
+            await self._in_flight
+        if flush and self._frames:
+            await self._send(self._take_frames())
+        self._stopped_at = time.perf_counter()
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    # ── Producer side ────────────────────────────────────────────────
+    def push(
+        self,
+        actor_path: str,
+        location: Vector | None = None,
+        rotation: Vector | None = None,
+        scale: Vector | None = None,
+    ):
+        """
+        Queue a frame for `actor_path`; it replaces any frame for the
+        same actor that has not been sent yet.
+        """
+        frame = self._frames.get(actor_path)
+        if frame is None:
+            frame = self._frames[actor_path] = {"location": None, "rotation": None, "scale": None}
+        else:
+            self.frames_dropped += 1
+
+        for key, value in (("location", location), ("rotation", rotation), ("scale", scale)):
+            if value is not None:
+                frame[key] = value
+        self.frames_pushed += 1
+
+    # ── Scheduler ────────────────────────────────────────────────────
+    def _take_frames(self) -> dict[str, dict]:
+        frames, self._frames = self._frames, {}
+        return frames
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+        while True:
+            next_tick += self.period
+            await asyncio.sleep(max(0.0, next_tick - loop.time()))
+            self.ticks += 1
+
+            if self._in_flight is not None and not self._in_flight.done():
+                # Unreal has not answered the last tick yet — skip this one
+                # and let newer frames overwrite the pending ones.
+                self.ticks_skipped += 1
+                continue
+            if not self._frames:
+                continue
+
+            self._in_flight = loop.create_task(self._send(self._take_frames()))
+
+            # Fell far behind (e.g. the loop was blocked): realign
+            # rather than firing a burst of catch-up ticks.
+            if loop.time() - next_tick > self.period:
+                next_tick = loop.time()
+
+    async def _send(self, frames: dict[str, dict]):
+        calls = []
+        for actor_path, frame in frames.items():
+            calls.extend(transform_calls(actor_path, frame["location"], frame["rotation"], frame["scale"]))
+
+        started = time.perf_counter()
+        try:
+            results = await send_ue_ws_batch(calls)
+            self.errors += sum(1 for r in results if not r["ok"])
+        except Exception:
+            self.errors += len(calls)
+        self._latencies.append(time.perf_counter() - started)
+        self.ticks_sent += 1
+        self.frames_sent += len(frames)
+
+    # ── Reporting ────────────────────────────────────────────────────
+    def stats(self) -> dict:
+        """
+        Achieved rate and latency so far.
+
+        Returns:
+            A dict with target, scheduler and achieved send rate (Hz), tick counters,
+            frame counters and send latency (ms) mean / p50 / p99.
+        """
+        end = self._stopped_at if not self.is_open and self._stopped_at else time.perf_counter()
+        elapsed = max(end - self._started_at, 1e-9) if self._started_at else 0.0
+        latencies = sorted(self._latencies)
+
+        def pct(p: float) -> float:
+            if not latencies:
+                return 0.0
+            return latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000
+
+        return {
+            "target_hz": self.rate_hz,
+            "tick_hz": self.ticks / elapsed if elapsed else 0.0,
+            "achieved_hz": self.ticks_sent / elapsed if elapsed else 0.0,
+            "ticks": self.ticks,
+            "ticks_sent": self.ticks_sent,
+            "ticks_skipped": self.ticks_skipped,
+            "frames_pushed": self.frames_pushed,
+            "frames_sent": self.frames_sent,
+            "frames_dropped": self.frames_dropped,
+            "errors": self.errors,
+            "latency_ms_mean": sum(latencies) / len(latencies) * 1000 if latencies else 0.0,
+            "latency_ms_p50": pct(0.50),
+            "latency_ms_p99": pct(0.99),
+        }
@@ -4,12 +4,474 @@ WebSocket Transport Layer for Unreal Engine Remote Control.
 This module is the *only* place that opens WebSocket connections to
 Unreal Engine.  Every MCP tool calls `send_ue_ws_command()` instead
 of managing sockets directly.
+
+Connections are long-lived: a small pool of sockets stays open to the
+Remote Control server, every request is tagged with an ``Id`` and the
+matching response (Unreal echoes it back as ``RequestId``) is routed to
+the caller that is waiting for it.  Many tool calls can therefore share
+one socket concurrently, and a restarted editor is picked up again on
+the next call without the tools noticing.
+
+Several editors can be driven at once (`UE_WS_URLS`): `EndpointRouter`
+keeps one pool per editor, routes each call by level or shard key (see
+connection/routing.py), health-checks the editors and fans listing
+calls out to all of them.
 """
 
+import asyncio
+import itertools
 import json
+import logging
+import time
+
 import websockets
 
-from unreal_mcp.config.settings import UE_WS_URL
+from unreal_mcp.config.settings import (
+    UE_WS_URL, UE_WS_URLS, UE_WS_POOL_SIZE, UE_WS_TIMEOUT, UE_BATCH_SIZE,
+    UE_WS_HEALTH_INTERVAL, UE_WS_HEALTH_TIMEOUT,
+)
+from unreal_mcp.connection.routing import HashRing, current_shard_key, level_of
+from unreal_mcp.utils.metrics import metrics
+
+
+logger = logging.getLogger(__name__)
+
+
+# ── Request ids shared by every connection in the process ────────────
+_request_ids = itertools.count(1)
+
+
+class EndpointUnavailable(ConnectionError):
+    """The editor could not be reached, so the request was never sent."""
+
+
+class UEConnection:
+    """
+    One persistent WebSocket to the Remote Control server.
+
+    A background reader task owns `recv()` and resolves the future of
+    whichever request a response belongs to, so any number of callers
+    can have requests in flight on the same socket.
+    """
+
+    def __init__(self, url: str = UE_WS_URL):
+        self.url = url
+        self._ws = None
+        self._loop = None
+        self._reader = None
+        self._pending: dict[int, asyncio.Future] = {}
+        self._connect_lock = None
+        self._in_flight = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently using this connection."""
+        return self._in_flight
+
+    @property
+    def is_open(self) -> bool:
+        return self._ws is not None and self._reader is not None and not self._reader.done()
+
+    async def _ensure_open(self):
+        """Open the socket (or re-open it after a drop / loop change)."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # A socket bound to another event loop cannot be reused —
+            # forget it without awaiting anything on the old loop.
+            self._ws = None
+            self._reader = None
+            self._pending = {}
+            self._connect_lock = asyncio.Lock()
+            self._loop = loop
+
+        if self.is_open:
+            return
+
+        async with self._connect_lock:
+            if self.is_open:
+                return
+            started = time.perf_counter()
+            try:
+                self._ws = await websockets.connect(self.url, max_size=None)
+            except Exception:
+                metrics.inc("unreal_mcp_ws_connect_errors_total")
+                raise
+            metrics.inc("unreal_mcp_ws_connects_total")
+            metrics.observe("unreal_mcp_ws_connect_seconds", time.perf_counter() - started)
+            self._reader = loop.create_task(self._read_loop(self._ws))
+
+    async def _read_loop(self, ws):
+        """Route every incoming message to the future waiting for it."""
+        error = ConnectionError("Connection to Unreal Engine closed")
+        try:
+            async for raw in ws:
+                metrics.inc("unreal_mcp_ws_messages_received_total")
+                metrics.inc("unreal_mcp_ws_received_bytes_total", len(raw))
+                message = json.loads(raw)
+                request_id = message.get("RequestId", message.get("Id"))
+                if request_id is None:
+                    # Every request carries an Id, so this is an event
+                    # (e.g. a preset notification), not anyone's reply.
+                    logger.debug("Dropping Unreal message without a request id: %.200s", raw)
+                    metrics.inc("unreal_mcp_ws_unsolicited_messages_total")
+                    continue
+                future = self._pending.pop(request_id, None)
+                if future is not None and not future.done():
+                    future.set_result(message)
+        except Exception as e:
+            error = ConnectionError(f"Connection to Unreal Engine lost: {e}")
+        finally:
+            # Only the reader of the *current* socket may fail requests;
+            # after `_drop()` the pending map already belongs to the next one.
+            if self._ws is ws:
+                self._ws = None
+                self._fail_pending(error)
+
+    def _fail_pending(self, error: Exception):
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(error)
+
+    async def request(self, message: dict, timeout: float = UE_WS_TIMEOUT) -> dict:
+        """
+        Send one message and wait for its matching response.
+
+        The message is copied and tagged with a fresh ``Id``.  If the
+        socket turns out to be dead at send time it is reopened once
+        before giving up, which covers an editor restart between calls.
+        """
+        request_id = next(_request_ids)
+        tagged = {**message, "Id": request_id}
+        data = json.dumps(tagged)
+
+        self._in_flight += 1
+        started = time.perf_counter()
+        try:
+            response = await self._send_and_wait(request_id, data, timeout)
+        except Exception:
+            metrics.inc("unreal_mcp_ws_request_errors_total")
+            raise
+        finally:
+            self._in_flight -= 1
+        metrics.observe("unreal_mcp_ws_request_seconds", time.perf_counter() - started)
+        return response
+
+    async def _send_and_wait(self, request_id: int, data: str, timeout: float) -> dict:
+        for attempt in range(2):
+            try:
+                await self._ensure_open()
+            except Exception as e:
+                reason = str(e) or type(e).__name__  # e.g. an empty TimeoutError
+                raise EndpointUnavailable(f"Could not reach Unreal Engine at {self.url}: {reason}") from e
+            ws = self._ws
+            future = self._loop.create_future()
+            self._pending[request_id] = future
+            try:
+                await ws.send(data)
+                metrics.inc("unreal_mcp_ws_messages_sent_total")
+                metrics.inc("unreal_mcp_ws_sent_bytes_total", len(data))
+                break
+            except (websockets.ConnectionClosed, OSError):
+                self._pending.pop(request_id, None)
+                await self._drop()
+                if attempt:
+                    raise EndpointUnavailable(f"Could not reach Unreal Engine at {self.url}")
+
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            # str() of a bare TimeoutError is empty; say what timed out
+            raise asyncio.TimeoutError(f"No reply from Unreal Engine at {self.url} within {timeout:g}s") from None
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def _drop(self):
+        """Forget the current socket so the next request reconnects."""
+        ws, self._ws = self._ws, None
+        self._fail_pending(ConnectionError("Connection to Unreal Engine reset"))
+        if self._reader is not None:
+            self._reader.cancel()
+            self._reader = None
+        if ws is not None:
+            try:
+                await ws.close()
+            except Exception:
+                pass
+
+    async def close(self):
+        """Close the socket and fail anything still waiting on it."""
+        if self._loop is asyncio.get_running_loop():
+            await self._drop()
+
+
+class UEConnectionPool:
+    """
+    A fixed-size set of `UEConnection`s to one Remote Control endpoint.
+
+    Each request goes to the connection with the fewest requests in
+    flight, so a single slow call in Unreal does not stall the others.
+    Connections are opened lazily on first use.
+    """
+
+    def __init__(self, url: str = UE_WS_URL, size: int = UE_WS_POOL_SIZE):
+        self.url = url
+        self.connections = [UEConnection(url) for _ in range(max(1, size))]
+
+    async def request(self, message: dict, timeout: float = UE_WS_TIMEOUT) -> dict:
+        connection = min(self.connections, key=lambda c: c.in_flight)
+        return await connection.request(message, timeout)
+
+    async def close(self):
+        for connection in self.connections:
+            await connection.close()
+
+
+# Health probe: any reply at all means the editor is up
+_PING = {"MessageName": "http", "Parameters": {"Url": "/remote/info", "Verb": "GET"}}
+
+
+class EndpointRouter:
+    """
+    One `UEConnectionPool` per editor, with calls routed between them.
+
+    Calls on an actor go to the editor owning the actor's level; other
+    calls follow the current shard key on a consistent-hash ring.  A
+    background task pings every editor each `health_interval` seconds
+    and keeps dead ones out of rotation until they answer again; a call
+    whose editor cannot be reached moves on to the next one on the ring.
+    With a single endpoint calls go straight to its pool.
+    """
+
+    def __init__(
+        self,
+        urls: list[str],
+        size: int = UE_WS_POOL_SIZE,
+        health_interval: float = UE_WS_HEALTH_INTERVAL,
+    ):
+        self.pools = {url: UEConnectionPool(url, size) for url in dict.fromkeys(urls)}
+        self.ring = HashRing(self.pools)
+        self.healthy = set(self.pools)
+        self.health_interval = health_interval
+        self._levels: dict[str, str] = {}   # level → url of the editor that has it
+        self._health_task = None
+
+    @property
+    def urls(self) -> list[str]:
+        return list(self.pools)
+
+    # ── Routing ──────────────────────────────────────────────────────
+    def candidates(self, object_path: str | None = None) -> list[str]:
+        """Editors a call may go to, in order of preference."""
+        level = level_of(object_path) if object_path else None
+        if level in self._levels:
+            # Only that editor has the actor; no point trying others
+            return [self._levels[level]]
+        order = self.ring.nodes_for(level or current_shard_key())
+        return [url for url in order if url in self.healthy] or order
+
+    def learn(self, url: str, response: dict):
+        """Note which editor owns the levels of actor paths in a response."""
+        body = response.get("ResponseBody")
+        if not isinstance(body, dict):
+            return
+        values = [body.get("ReturnValue")]
+        values += [
+            item.get("ResponseBody", {}).get("ReturnValue")
+            for item in body.get("Responses", [])
+            if isinstance(item.get("ResponseBody"), dict)
+        ]
+        for value in values:
+            for path in value if isinstance(value, list) else [value]:
+                level = level_of(path) if isinstance(path, str) else None
+                if level is not None:
+                    self._levels[level] = url
+
+    async def request(self, message: dict, timeout: float = UE_WS_TIMEOUT, object_path: str | None = None) -> dict:
+        """Send `message` to the editor for `object_path` (or the shard key)."""
+        if len(self.pools) == 1:
+            return await next(iter(self.pools.values())).request(message, timeout)
+        return await self.request_any(self.candidates(object_path), message, timeout)
+
+    async def request_any(self, candidates: list[str], message: dict, timeout: float = UE_WS_TIMEOUT) -> dict:
+        """Send `message` to the first of `candidates` that can be reached."""
+        for i, url in enumerate(candidates):
+            try:
+                return await self.request_to(url, message, timeout)
+            except EndpointUnavailable:
+                if i == len(candidates) - 1:
+                    raise
+                metrics.inc("unreal_mcp_ws_failovers_total")
+
+    async def request_to(self, url: str, message: dict, timeout: float = UE_WS_TIMEOUT) -> dict:
+        """Send `message` to one particular editor."""
+        self._ensure_health_checks()
+        try:
+            response = await self.pools[url].request(message, timeout)
+        except EndpointUnavailable:
+            self._mark_down(url)
+            raise
+        if len(self.pools) > 1:
+            self.learn(url, response)
+        return response
+
+    async def fan_out(self, message: dict, timeout: float = UE_WS_TIMEOUT) -> list[tuple[str, dict | Exception]]:
+        """Send `message` to every live editor; ``(url, response or error)`` each."""
+        urls = [url for url in self.pools if url in self.healthy] or self.urls
+        results = await asyncio.gather(
+            *(self.request_to(url, message, timeout) for url in urls),
+            return_exceptions=True,
+        )
+        return list(zip(urls, results))
+
+    # ── Health ───────────────────────────────────────────────────────
+    def _mark_down(self, url: str):
+        if url in self.healthy and len(self.pools) > 1:
+            self.healthy.discard(url)
+            metrics.inc("unreal_mcp_ws_endpoint_down_total", endpoint=url)
+
+    def _ensure_health_checks(self):
+        if len(self.pools) == 1 or self.health_interval <= 0:
+            return
+        loop = asyncio.get_running_loop()
+        if self._health_task is None or self._health_task.done() or self._health_task.get_loop() is not loop:
+            self._health_task = loop.create_task(self._health_loop())
+
+    async def _health_loop(self):
+        while True:
+            await asyncio.sleep(self.health_interval)
+            await self.check_health()
+
+    async def check_health(self) -> dict[str, bool]:
+        """Ping every editor now; returns url → up."""
+        results = await asyncio.gather(
+            *(pool.request(_PING, UE_WS_HEALTH_TIMEOUT) for pool in self.pools.values()),
+            return_exceptions=True,
+        )
+        status = {}
+        for url, result in zip(self.pools, results):
+            status[url] = not isinstance(result, Exception)
+            if status[url]:
+                self.healthy.add(url)
+            else:
+                self._mark_down(url)
+        return status
+
+    async def close(self):
+        if self._health_task is not None:
+            self._health_task.cancel()
+            self._health_task = None
+        for pool in self.pools.values():
+            await pool.close()
+
+
+# ── Process-wide router used by all tools ────────────────────────────
+_router = EndpointRouter(UE_WS_URLS)
+
+
+def get_pool() -> EndpointRouter:
+    """Return the shared router (one connection pool per editor)."""
+    return _router
+
+
+def configure_pool(url: str = UE_WS_URL, size: int = UE_WS_POOL_SIZE) -> UEConnectionPool:
+    """
+    Point the shared connections at a single endpoint (e.g. a local stand-in).
+
+    Sockets of the previous pool are not closed here; call its `close()`
+    first if it was in use on the running event loop.
+    """
+    return configure_endpoints([url], size).pools[url]
+
+
+def configure_endpoints(urls: list[str], size: int = UE_WS_POOL_SIZE) -> EndpointRouter:
+    """Point the shared connections at several editors (see `EndpointRouter`)."""
+    global _router
+    _router = EndpointRouter(urls, size)
+    return _router
+
+
+def _call_body(object_path: str, function_name: str, parameters: dict = None) -> dict:
+    """Build the ``/remote/object/call`` request body."""
+    body = {
+        "objectPath": object_path,
+        "functionName": function_name,
+    }
+
+    # Inject parameters into the Body if they exist
+    if parameters:
+        body["parameters"] = parameters
+
+    return body
+
+
+def _error_message(body) -> str | None:
+    """Return Unreal's error text from a response body, if any."""
+    if not isinstance(body, dict):
+        return None
+    return body.get("ErrorMessage") or body.get("errorMessage")
+
+
+def build_call_payload(
+    object_path: str,
+    function_name: str,
+    parameters: dict = None,
+) -> dict:
+    """
+    Build the Remote Control ``/remote/object/call`` message.
+
+    Args:
+        object_path:   The UObject path to call the function on.
+        function_name: The name of the UFunction to invoke.
+        parameters:    Optional dict of function parameters.
+
+    Returns:
+        The ``{"MessageName": "http", ...}`` dict Unreal's WebSocket
+        server expects.
+    """
+    return {
+        "MessageName": "http",
+        "Parameters": {
+            "Url": "/remote/object/call",
+            "Verb": "PUT",
+            "Body": _call_body(object_path, function_name, parameters),
+        },
+    }
+
+
+def build_batch_payload(calls: list[dict]) -> dict:
+    """
+    Build one Remote Control ``/remote/batch`` message for many calls.
+
+    Args:
+        calls: Dicts with ``object_path``, ``function_name`` and an
+               optional ``parameters`` key (same as `send_ue_ws_command`).
+
+    Returns:
+        The WebSocket message; each sub-request's ``RequestId`` is its
+        index in `calls`.
+    """
+    requests = [
+        {
+            "RequestId": i,
+            "URL": "/remote/object/call",
+            "Verb": "PUT",
+            "Body": _call_body(
+                call["object_path"],
+                call["function_name"],
+                call.get("parameters"),
+            ),
+        }
+        for i, call in enumerate(calls)
+    ]
+    return {
+        "MessageName": "http",
+        "Parameters": {
+            "Url": "/remote/batch",
+            "Verb": "PUT",
+            "Body": {"Requests": requests},
+        },
+    }
 
 
 async def send_ue_ws_command(
@@ -21,8 +483,8 @@ async def send_ue_ws_command(
     Send a remote-control command to Unreal Engine via WebSocket.
 
     Wraps the standard Remote Control HTTP payload into the format
-    Unreal's WebSocket server expects, opens a transient connection,
-    and returns the parsed JSON response.
+    Unreal's WebSocket server expects, sends it over the shared
+    persistent connection pool, and returns the parsed JSON response.
 
     Args:
         object_path:   The UObject path to call the function on.
@@ -35,36 +497,126 @@ async def send_ue_ws_command(
     Raises:
         Exception: On connection failure or if Unreal reports an error.
     """
-    payload = {
-        "MessageName": "http",
-        "Parameters": {
-            "Url": "/remote/object/call",
-            "Verb": "PUT",
-            "Body": {
-                "objectPath": object_path,
-                "functionName": function_name,
-            },
-        },
-    }
-
-    # Inject parameters into the Body if they exist
-    if parameters:
-        payload["Parameters"]["Body"]["parameters"] = parameters
+    payload = build_call_payload(object_path, function_name, parameters)
 
     try:
-        async with websockets.connect(UE_WS_URL) as ws:
-            await ws.send(json.dumps(payload))
+        response_data = await _router.request(payload, object_path=object_path)
 
-            # Wait for Unreal's real-time response
-            response_str = await ws.recv()
-            response_data = json.loads(response_str)
+        # Check if Unreal threw an internal error
+        error_msg = _error_message(response_data.get("ResponseBody", {}))
+        if error_msg:
+            raise Exception(error_msg)
 
-            # Check if Unreal threw an internal error
-            error_msg = response_data.get("ResponseBody", {}).get("ErrorMessage")
-            if error_msg:
-                raise Exception(error_msg)
-
-            return response_data
+        return response_data
 
     except Exception as e:
         raise Exception(f"WebSocket Error: {str(e)}")
+
+
+async def send_ue_ws_fanout(
+    object_path: str,
+    function_name: str,
+    parameters: dict = None,
+) -> list[dict]:
+    """
+    Call a function on every live editor (e.g. to list actors across
+    all shards).
+
+    Returns:
+        The parsed response of each editor that answered.  Editors that
+        fail are skipped unless all of them do.
+
+    Raises:
+        Exception: If no editor answered without an error.
+    """
+    payload = build_call_payload(object_path, function_name, parameters)
+    responses, errors = [], []
+    for url, result in await _router.fan_out(payload):
+        if not isinstance(result, Exception):
+            result_error = _error_message(result.get("ResponseBody", {}))
+            result = Exception(result_error) if result_error else result
+        if isinstance(result, Exception):
+            errors.append(f"{url}: {result}" if len(_router.pools) > 1 else str(result))
+        else:
+            responses.append(result)
+    if not responses:
+        raise Exception(f"WebSocket Error: {'; '.join(errors)}")
+    return responses
+
+
+async def _send_batch_chunk(calls: list[dict], candidates: list[str]) -> list[dict]:
+    """Send one ``/remote/batch`` request and split its responses per call."""
+    try:
+        response_data = await _router.request_any(candidates, build_batch_payload(calls))
+        body = response_data.get("ResponseBody", {})
+        error_msg = _error_message(body)
+        if error_msg:
+            raise Exception(error_msg)
+    except Exception as e:
+        error = f"WebSocket Error: {str(e)}"
+        return [{"ok": False, "error": error} for _ in calls]
+
+    by_id = {item.get("RequestId"): item for item in body.get("Responses", [])}
+    results = []
+    for i in range(len(calls)):
+        item = by_id.get(i)
+        if item is None:
+            results.append({"ok": False, "error": "No response from Unreal for this call"})
+            continue
+        error_msg = _error_message(item.get("ResponseBody"))
+        if error_msg or item.get("ResponseCode", 200) >= 400:
+            error = error_msg or f"Unreal returned HTTP {item.get('ResponseCode')}"
+            results.append({"ok": False, "error": error})
+        else:
+            results.append({"ok": True, "response": item})
+    return results
+
+
+async def send_ue_ws_batch(
+    calls: list[dict],
+    chunk_size: int = UE_BATCH_SIZE,
+) -> list[dict]:
+    """
+    Send many remote-control calls to Unreal Engine in batched requests.
+
+    Calls are grouped by the editors they route to and packed into
+    ``/remote/batch`` requests of at most `chunk_size` items; the chunks
+    are sent concurrently over the shared connection pools, and a chunk
+    whose editor cannot be reached moves on to the next one.  A failing
+    call does not affect the others.
+
+    Args:
+        calls:      Dicts with ``object_path``, ``function_name`` and an
+                    optional ``parameters`` key.
+        chunk_size: Maximum number of calls per batch request.
+
+    Returns:
+        One result per call, in the same order:
+            {"ok": True,  "response": {"ResponseCode": ..., "ResponseBody": ...}}
+            {"ok": False, "error": "<message>"}
+        The ``response`` dict can be passed to `extract_return_value()`.
+    """
+    if not calls:
+        return []
+
+    # Calls with the same candidate editors share chunks, so a chunk can
+    # fail over to the next editor just like a single call.
+    groups: dict[tuple[str, ...], list[int]] = {}
+    for i, call in enumerate(calls):
+        groups.setdefault(tuple(_router.candidates(call["object_path"])), []).append(i)
+
+    chunk_size = max(1, chunk_size)
+    chunks = [
+        (candidates, indices[i:i + chunk_size])
+        for candidates, indices in groups.items()
+        for i in range(0, len(indices), chunk_size)
+    ]
+    chunk_results = await asyncio.gather(*(
+        _send_batch_chunk([calls[i] for i in indices], list(candidates)) for candidates, indices in chunks
+    ))
+
+    results = [None] * len(calls)
+    for (_, indices), chunk in zip(chunks, chunk_results):
+        for i, result in zip(indices, chunk):
+            results[i] = result
+    return results
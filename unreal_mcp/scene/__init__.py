@@ -0,0 +1,4 @@
+# Scene package — server-side view of the Unreal level (actor index, snapshots, …)
+from .index import ActorIndex, actor_index, actor_class_name, short_name, is_object_path
+from .snapshots import Snapshot, SnapshotStore, snapshot_store
+from .spatial import SpatialIndex, spatial_index
@@ -0,0 +1,225 @@
+"""
+Actor Index — server-side lookup table for actors in the level.
+
+Maps short names (``StaticMeshActor_0``), editor labels (``Cube``) and
+full object paths to each other so tools can accept whichever the
+agent has at hand without an extra `list_actors` round trip.
+
+The index is filled from ``GetAllLevelActors`` and refreshed at most
+once per `ACTOR_INDEX_TTL` seconds on a lookup miss.  Labels cost one
+call per actor, so they are only fetched when a name does not match any
+path or short name, and only for actors whose label is not known yet.
+Spawn tools add their actors directly, so a fresh spawn resolves
+without any refresh at all.
+
+With several editors configured the level listing is fanned out to all
+of them and merged, so the index covers every shard.
+"""
+
+import asyncio
+import re
+import time
+
+from unreal_mcp.config.settings import ACTOR_INDEX_TTL
+from unreal_mcp.connection import send_ue_ws_batch, send_ue_ws_fanout
+from unreal_mcp.utils import extract_return_value
+
+
+# ── Editor subsystem used to enumerate actors ────────────────────────
+ACTOR_SUBSYSTEM = "/Script/UnrealEd.Default__EditorActorSubsystem"
+
+
+def short_name(actor_path: str) -> str:
+    """``/Game/Map.Map:PersistentLevel.StaticMeshActor_0`` → ``StaticMeshActor_0``."""
+    return actor_path.split(".")[-1]
+
+
+def actor_class_name(actor_path: str) -> str:
+    """
+    Best-effort class of an actor from its object name.
+
+    Unreal names new actors ``<Class>_<N>``, so ``PointLight_3`` →
+    ``PointLight``.  Renamed actors simply report their own name.
+    """
+    return re.sub(r"_\d+$", "", short_name(actor_path))
+
+
+def is_object_path(name: str) -> bool:
+    """True if `name` already looks like a full Unreal object path."""
+    return name.startswith("/") and ":" in name
+
+
+class ActorIndex:
+    """
+    O(1) name → path resolution for actors in the current level.
+
+    Short names and labels are matched case-insensitively.  Labels are
+    not unique in Unreal; when two actors share one, the label resolves
+    to the first actor seen with it.  Short names are unique within a
+    level, but with several editors the same name can exist in more
+    than one level; such a name is ambiguous and must be given as a
+    full path.
+    """
+
+    def __init__(self, ttl: float = ACTOR_INDEX_TTL):
+        self.ttl = ttl
+        self._labels: dict[str, str | None] = {}   # path  → label
+        self._by_name: dict[str, list[str]] = {}   # short → paths (one per level)
+        self._by_label: dict[str, str] = {}        # label → path
+        self._refreshed_at = 0.0
+        self._lock = None
+
+    # ── Queries ──────────────────────────────────────────────────────
+    @property
+    def paths(self) -> list[str]:
+        """Every indexed actor path."""
+        return list(self._labels)
+
+    @property
+    def is_stale(self) -> bool:
+        return time.monotonic() - self._refreshed_at > self.ttl
+
+    def label_of(self, actor_path: str) -> str | None:
+        return self._labels.get(actor_path)
+
+    def lookup(self, name: str) -> str | None:
+        """
+        Resolve a path, short name or label from the index only.
+
+        Raises:
+            LookupError: If `name` is a short name found in several levels.
+        """
+        if name in self._labels:
+            return name
+        key = name.lower()
+        paths = self._by_name.get(key)
+        if paths and len(paths) > 1:
+            raise LookupError(
+                f"'{name}' matches actors in {len(paths)} levels ({', '.join(sorted(paths))}); "
+                f"use the full path of the one you mean"
+            )
+        return paths[0] if paths else self._by_label.get(key)
+
+    async def resolve(self, name: str) -> str:
+        """
+        Resolve a path, short name or label to a full actor path.
+
+        Full object paths pass straight through.  On a miss the index is
+        refreshed (if it is older than the TTL) and missing labels are
+        fetched before giving up.
+
+        Raises:
+            LookupError: If no actor matches `name`, or a short name
+                matches actors in several levels.
+        """
+        name = name.strip()
+        if is_object_path(name):
+            return name
+
+        path = self.lookup(name)
+        if path is None and self.is_stale:
+            await self.refresh()
+            path = self.lookup(name)
+        if path is None and await self.load_labels():
+            path = self.lookup(name)
+        if path is None:
+            raise LookupError(f"No actor named '{name}' in the level")
+        return path
+
+    async def resolve_many(self, names: list[str]) -> list[str]:
+        """
+        `resolve` each of `names`, in order.
+
+        Resolved one after another rather than concurrently: the first
+        miss refreshes the index and the rest are then found in it.
+
+        Raises:
+            LookupError: For the first name that cannot be resolved.
+        """
+        return [await self.resolve(name) for name in names]
+
+    # ── Updates ──────────────────────────────────────────────────────
+    def add(self, actor_path: str, label: str | None = None):
+        """Record an actor (e.g. one a tool just spawned)."""
+        if not isinstance(actor_path, str) or not actor_path:
+            return
+        if label is None:
+            label = self._labels.get(actor_path)
+        self._labels[actor_path] = label
+        paths = self._by_name.setdefault(short_name(actor_path).lower(), [])
+        if actor_path not in paths:
+            paths.append(actor_path)
+        if label:
+            self._by_label.setdefault(label.lower(), actor_path)
+
+    def remove(self, actor_path: str):
+        """Forget an actor (e.g. one a tool just deleted)."""
+        label = self._labels.pop(actor_path, None)
+        name = short_name(actor_path).lower()
+        paths = self._by_name.get(name, [])
+        if actor_path in paths:
+            paths.remove(actor_path)
+            if not paths:
+                del self._by_name[name]
+        if label and self._by_label.get(label.lower()) == actor_path:
+            del self._by_label[label.lower()]
+
+    def invalidate(self):
+        """Force the next resolve miss to refresh from Unreal."""
+        self._refreshed_at = 0.0
+
+    async def refresh(self) -> list[str]:
+        """
+        Re-read the level, dropping actors that are gone and adding new
+        ones (without labels; see `load_labels`).
+
+        Returns:
+            The actor paths exactly as ``GetAllLevelActors`` returned
+            them, editor after editor.
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            responses = await send_ue_ws_fanout(
+                object_path=ACTOR_SUBSYSTEM,
+                function_name="GetAllLevelActors",
+            )
+            # Editors that share a level report its actors once
+            actors = list(dict.fromkeys(
+                path for response in responses for path in (extract_return_value(response) or [])
+            ))
+
+            current = set(actors)
+            for path in [p for p in self._labels if p not in current]:
+                self.remove(path)
+            for path in actors:
+                self.add(path)
+
+            self._refreshed_at = time.monotonic()
+            return actors
+
+    async def load_labels(self) -> int:
+        """
+        Fetch editor labels for every actor whose label is still unknown.
+
+        Returns:
+            How many actors were asked for (0 means nothing to do).
+        """
+        unlabeled = [p for p, label in self._labels.items() if label is None]
+        if not unlabeled:
+            return 0
+
+        results = await send_ue_ws_batch([
+            {"object_path": path, "function_name": "GetActorLabel"}
+            for path in unlabeled
+        ])
+        for path, result in zip(unlabeled, results):
+            label = extract_return_value(result["response"]) if result["ok"] else None
+            # "" marks "fetched, no label" so it is not asked for again
+            self.add(path, label if isinstance(label, str) else "")
+        return len(unlabeled)
+
+
+# ── Process-wide index shared by all tools ───────────────────────────
+actor_index = ActorIndex()
@@ -0,0 +1,109 @@
+"""
+Scene Snapshots — versioned copies of the level's actor list.
+
+Each ``GetAllLevelActors`` result is stored as an immutable `Snapshot`
+with a version number.  Paging tools hand out cursors that point at a
+snapshot version, so following pages are served from memory instead of
+querying Unreal again.  Delta tools diff two versions so agents only
+see what was added or removed.  Only the last `SNAPSHOT_HISTORY`
+versions are kept.
+
+Every server worker process has its own store.  With several workers
+the version numbers of each start at a random base, so a version handed
+out by one worker is reported as unknown by another instead of silently
+naming a different snapshot there.
+"""
+
+import hashlib
+import random
+import time
+from dataclasses import dataclass, field
+
+from unreal_mcp.config.settings import SERVER_WORKERS, SNAPSHOT_HISTORY
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """One version of the actor list, in the order Unreal returned it."""
+
+    version: int
+    actors: tuple[str, ...]
+    digest: str
+    taken_at: float = field(default_factory=time.time)
+
+
+def _digest(actors) -> str:
+    """Order-independent hash of an actor list."""
+    h = hashlib.blake2b(digest_size=16)
+    for path in sorted(actors):
+        h.update(path.encode())
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+class SnapshotStore:
+    """Bounded history of actor-list snapshots, keyed by version."""
+
+    def __init__(self, history: int = SNAPSHOT_HISTORY, first_version: int = 1):
+        self.history = max(1, history)
+        self._snapshots: dict[int, Snapshot] = {}
+        self._version = first_version - 1
+
+    @property
+    def latest(self) -> Snapshot | None:
+        return self._snapshots.get(self._version)
+
+    def get(self, version: int) -> Snapshot | None:
+        return self._snapshots.get(version)
+
+    def record(self, actors: list[str]) -> Snapshot:
+        """
+        Store a new actor list and return its snapshot.
+
+        If nothing changed since the latest snapshot, that snapshot is
+        returned as is and no new version is created.
+        """
+        digest = _digest(actors)
+        latest = self.latest
+        if latest is not None and latest.digest == digest:
+            return latest
+
+        self._version += 1
+        snapshot = Snapshot(self._version, tuple(actors), digest)
+        self._snapshots[snapshot.version] = snapshot
+
+        # Drop the oldest versions beyond the history limit
+        while len(self._snapshots) > self.history:
+            del self._snapshots[min(self._snapshots)]
+
+        return snapshot
+
+    def diff(self, since_version: int, snapshot: Snapshot) -> tuple[list[str], list[str]] | None:
+        """
+        Actors added to and removed from the level between two versions.
+
+        Version 0 means "an empty level", so everything counts as added.
+
+        Returns:
+            ``(added, removed)`` in `snapshot` order, or None if
+            `since_version` is no longer (or never was) in the history.
+        """
+        if since_version == 0:
+            return list(snapshot.actors), []
+
+        base = self.get(since_version)
+        if base is None:
+            return None
+        if base.digest == snapshot.digest:
+            return [], []
+
+        before, after = set(base.actors), set(snapshot.actors)
+        added = [a for a in snapshot.actors if a not in before]
+        removed = [a for a in base.actors if a not in after]
+        return added, removed
+
+
+# ── Process-wide store shared by all tools ───────────────────────────
+snapshot_store = SnapshotStore(
+    first_version=random.randrange(1, 1000) * 1_000_000 + 1 if SERVER_WORKERS > 1 else 1,
+)
@@ -0,0 +1,181 @@
+"""
+Spatial Index — answer "what is near X, Y, Z" without asking Unreal.
+
+Actor locations are bulk-fetched once (one batched ``K2_GetActorLocation``
+request) into flat coordinate arrays, bucketed by a uniform grid of
+`SPATIAL_CELL_SIZE` cubes.  Queries only visit the cells that overlap
+the search volume, so neighbourhood lookups stay well under a
+millisecond even on large levels.
+
+Spawn and transform tools push their changes in through `update()`;
+`sync()` picks up actors added or removed elsewhere, and a full
+`sync(reload=True)` re-reads every location (e.g. after hand edits in
+the editor).
+"""
+
+import math
+import time
+from array import array
+
+from unreal_mcp.config.settings import SPATIAL_CELL_SIZE, SPATIAL_INDEX_TTL
+from unreal_mcp.connection import send_ue_ws_batch
+from unreal_mcp.utils import extract_return_value
+
+
+Cell = tuple[int, int, int]
+
+
+class SpatialIndex:
+    """Uniform-grid index over actor locations."""
+
+    def __init__(self, cell_size: float = SPATIAL_CELL_SIZE, ttl: float = SPATIAL_INDEX_TTL):
+        self.cell_size = cell_size
+        self.ttl = ttl
+        # Slot-based storage: coordinates live in flat float arrays and
+        # freed slots are reused, so the index stays compact.
+        self._xs = array("d")
+        self._ys = array("d")
+        self._zs = array("d")
+        self._paths: list[str | None] = []
+        self._free: list[int] = []
+        self._slots: dict[str, int] = {}
+        self._cells: dict[Cell, set[int]] = {}
+        self._synced_at = 0.0
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    @property
+    def is_stale(self) -> bool:
+        return time.monotonic() - self._synced_at > self.ttl
+
+    def _cell(self, x: float, y: float, z: float) -> Cell:
+        size = self.cell_size
+        return (math.floor(x / size), math.floor(y / size), math.floor(z / size))
+
+    # ── Updates ──────────────────────────────────────────────────────
+    def update(self, actor_path: str, x: float, y: float, z: float):
+        """Insert an actor or move it to a new location."""
+        if not isinstance(actor_path, str) or not actor_path:
+            return
+        slot = self._slots.get(actor_path)
+        if slot is None:
+            if self._free:
+                slot = self._free.pop()
+                self._paths[slot] = actor_path
+                self._xs[slot], self._ys[slot], self._zs[slot] = x, y, z
+            else:
+                slot = len(self._paths)
+                self._paths.append(actor_path)
+                self._xs.append(x)
+                self._ys.append(y)
+                self._zs.append(z)
+            self._slots[actor_path] = slot
+        else:
+            old_cell = self._cell(self._xs[slot], self._ys[slot], self._zs[slot])
+            self._cells[old_cell].discard(slot)
+            self._xs[slot], self._ys[slot], self._zs[slot] = x, y, z
+
+        self._cells.setdefault(self._cell(x, y, z), set()).add(slot)
+
+    def remove(self, actor_path: str):
+        slot = self._slots.pop(actor_path, None)
+        if slot is None:
+            return
+        self._cells[self._cell(self._xs[slot], self._ys[slot], self._zs[slot])].discard(slot)
+        self._paths[slot] = None
+        self._free.append(slot)
+
+    def location_of(self, actor_path: str) -> tuple[float, float, float] | None:
+        slot = self._slots.get(actor_path)
+        if slot is None:
+            return None
+        return (self._xs[slot], self._ys[slot], self._zs[slot])
+
+    # ── Queries ──────────────────────────────────────────────────────
+    def _slots_in_cells(self, lo: Cell, hi: Cell):
+        cells = self._cells
+        span = (hi[0] - lo[0] + 1) * (hi[1] - lo[1] + 1) * (hi[2] - lo[2] + 1)
+        if span > len(cells):
+            # Huge query volume: scanning occupied cells is cheaper.
+            for (cx, cy, cz), slots in cells.items():
+                if lo[0] <= cx <= hi[0] and lo[1] <= cy <= hi[1] and lo[2] <= cz <= hi[2]:
+                    yield from slots
+            return
+        for cx in range(lo[0], hi[0] + 1):
+            for cy in range(lo[1], hi[1] + 1):
+                for cz in range(lo[2], hi[2] + 1):
+                    slots = cells.get((cx, cy, cz))
+                    if slots:
+                        yield from slots
+
+    def near(self, x: float, y: float, z: float, radius: float, limit: int = 0) -> list[tuple[str, float]]:
+        """
+        Actors within `radius` of a point, nearest first.
+
+        Returns:
+            ``(actor_path, distance)`` pairs, at most `limit` (0 = all).
+        """
+        lo = self._cell(x - radius, y - radius, z - radius)
+        hi = self._cell(x + radius, y + radius, z + radius)
+        xs, ys, zs, r2 = self._xs, self._ys, self._zs, radius * radius
+
+        hits = []
+        for slot in self._slots_in_cells(lo, hi):
+            d2 = (xs[slot] - x) ** 2 + (ys[slot] - y) ** 2 + (zs[slot] - z) ** 2
+            if d2 <= r2:
+                hits.append((d2, slot))
+
+        hits.sort()
+        if limit:
+            hits = hits[:limit]
+        return [(self._paths[slot], math.sqrt(d2)) for d2, slot in hits]
+
+    def in_box(self, lo_xyz: tuple[float, float, float], hi_xyz: tuple[float, float, float], limit: int = 0) -> list[str]:
+        """Actors inside an axis-aligned box (inclusive), at most `limit` (0 = all)."""
+        (x0, y0, z0), (x1, y1, z1) = lo_xyz, hi_xyz
+        xs, ys, zs = self._xs, self._ys, self._zs
+
+        found = []
+        for slot in self._slots_in_cells(self._cell(x0, y0, z0), self._cell(x1, y1, z1)):
+            if x0 <= xs[slot] <= x1 and y0 <= ys[slot] <= y1 and z0 <= zs[slot] <= z1:
+                found.append(self._paths[slot])
+                if limit and len(found) >= limit:
+                    break
+        return found
+
+    # ── Loading from Unreal ──────────────────────────────────────────
+    async def sync(self, actors: list[str], reload: bool = False) -> int:
+        """
+        Bring the index in line with the level's actor list.
+
+        Actors no longer present are dropped; locations are fetched in
+        one batch for actors not indexed yet (or for all of them when
+        `reload` is set).
+
+        Returns:
+            How many locations were fetched from Unreal.
+        """
+        current = set(actors)
+        for path in [p for p in self._slots if p not in current]:
+            self.remove(path)
+
+        missing = actors if reload else [p for p in actors if p not in self._slots]
+        if missing:
+            results = await send_ue_ws_batch([
+                {"object_path": path, "function_name": "K2_GetActorLocation"}
+                for path in missing
+            ])
+            for path, result in zip(missing, results):
+                if not result["ok"]:
+                    continue
+                loc = extract_return_value(result["response"])
+                if isinstance(loc, dict):
+                    self.update(path, loc.get("X", 0.0), loc.get("Y", 0.0), loc.get("Z", 0.0))
+
+        self._synced_at = time.monotonic()
+        return len(missing)
+
+
+# ── Process-wide index shared by all tools ───────────────────────────
+spatial_index = SpatialIndex()
@@ -0,0 +1,5 @@
+# Scripting package — vetted editor-Python templates for bulk edits
+from .templates import (
+    ScriptParam, ScriptTemplate, SCRIPT_TEMPLATES, register_template, get_template,
+    build_script, build_script_payload, parse_script_output,
+)
@@ -0,0 +1,376 @@
+"""
+Script Templates — vetted bulk edits that run inside the editor.
+
+Operations such as "randomize the scale of every cube" would otherwise
+cost one Remote Control call per actor.  A `ScriptTemplate` is a
+server-side snippet of editor Python that applies one operation to one
+actor; `build_script()` wraps it in a loop over the selected actors and
+the whole thing runs in a single ``ExecutePythonCommandEx`` call.
+
+The agent only picks a registered template and passes parameters.
+Parameters are validated against the template's `ScriptParam`s and
+reach the script as JSON data, never as code, so nothing the agent
+sends is executed.
+
+To add a template, define its `apply(actor, index, count, rng)` body
+(it sees ``PARAMS``, ``DRY_RUN``, ``vec()``, ``unreal``, ``math`` and
+``random``; it must not change anything when ``DRY_RUN`` is set and
+returns a dict of per-actor results) and `register_template()` it.
+"""
+
+import json
+import math
+from dataclasses import dataclass, field
+
+
+# ── Where scripts run ────────────────────────────────────────────────
+PYTHON_LIBRARY = "/Script/PythonScriptPlugin.Default__PythonScriptLibrary"
+
+# Prefix of the log line carrying the per-actor results
+RESULT_MARKER = "UNREAL_MCP_RESULTS:"
+
+
+@dataclass(frozen=True)
+class ScriptParam:
+    """
+    One template parameter.
+
+    Args:
+        name:     Key in the agent's ``params`` dict.
+        kind:     "number", "integer", "boolean" or "vector" ([x, y, z]).
+        default:  Value when omitted; `required` params have none.
+        minimum, maximum: Inclusive bounds for numbers and integers.
+        optional: None is accepted (and is the default).
+    """
+
+    name: str
+    kind: str
+    doc: str = ""
+    default: object = None
+    required: bool = False
+    optional: bool = False
+    minimum: float | None = None
+    maximum: float | None = None
+
+    def validate(self, value):
+        """
+        Check and normalise one value (vectors become ``[x, y, z]``).
+
+        Raises:
+            ValueError: If the value has the wrong type or is out of range.
+        """
+        if value is None:
+            if self.optional:
+                return None
+            raise ValueError(f"'{self.name}' must not be empty")
+
+        if self.kind == "boolean":
+            if not isinstance(value, bool):
+                raise ValueError(f"'{self.name}' must be true or false, got {value!r}")
+            return value
+        if self.kind == "vector":
+            if isinstance(value, dict):
+                value = [value.get(k, value.get(k.lower())) for k in ("X", "Y", "Z")]
+            if not (isinstance(value, (list, tuple)) and len(value) == 3 and all(_is_number(v) for v in value)):
+                raise ValueError(f"'{self.name}' must be 3 numbers [x, y, z], got {value!r}")
+            return [float(v) for v in value]
+
+        if not _is_number(value) or (self.kind == "integer" and float(value) != int(value)):
+            raise ValueError(f"'{self.name}' must be {'an integer' if self.kind == 'integer' else 'a number'}, got {value!r}")
+        value = int(value) if self.kind == "integer" else float(value)
+        if self.minimum is not None and value < self.minimum:
+            raise ValueError(f"'{self.name}' must be at least {self.minimum}, got {value}")
+        if self.maximum is not None and value > self.maximum:
+            raise ValueError(f"'{self.name}' must be at most {self.maximum}, got {value}")
+        return value
+
+    def describe(self) -> str:
+        """``spacing (number ≥ 1.0, default 500.0) — Distance between …``"""
+        bounds = []
+        if self.minimum is not None:
+            bounds.append(f"≥ {self.minimum}")
+        if self.maximum is not None:
+            bounds.append(f"≤ {self.maximum}")
+        spec = " ".join([self.kind] + bounds)
+        spec += ", required" if self.required else f", default {self.default}"
+        return f"{self.name} ({spec})" + (f" — {self.doc}" if self.doc else "")
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and math.isfinite(value)
+
+
+@dataclass(frozen=True)
+class ScriptTemplate:
+    """
+    A named, parameterised editor operation.
+
+    Args:
+        name:        What the agent passes as ``template``.
+        description: One line for `list_script_templates`.
+        apply:       Editor Python defining ``apply(actor, index, count, rng)``.
+        params:      The parameters the template accepts.
+        check:       Optional cross-parameter check: returns an error
+                     message for invalid combinations, else None.
+    """
+
+    name: str
+    description: str
+    apply: str
+    params: tuple[ScriptParam, ...] = field(default_factory=tuple)
+    check: object = None
+
+    def validate(self, params: dict | None) -> dict:
+        """
+        Validate the agent's parameters and fill in defaults.
+
+        Raises:
+            ValueError: On unknown, missing or invalid parameters.
+        """
+        params = dict(params or {})
+        known = {p.name: p for p in self.params}
+        unknown = sorted(set(params) - set(known))
+        if unknown:
+            raise ValueError(
+                f"Unknown parameter(s) for '{self.name}': {', '.join(unknown)} "
+                f"(accepted: {', '.join(known) or 'none'})"
+            )
+
+        values = {}
+        for name, param in known.items():
+            if name not in params:
+                if param.required:
+                    raise ValueError(f"'{self.name}' needs parameter '{name}'")
+                values[name] = param.default
+            else:
+                values[name] = param.validate(params[name])
+
+        problem = self.check(values) if self.check else None
+        if problem:
+            raise ValueError(problem)
+        return values
+
+
+# ── Registry ─────────────────────────────────────────────────────────
+SCRIPT_TEMPLATES: dict[str, ScriptTemplate] = {}
+
+
+def register_template(template: ScriptTemplate) -> ScriptTemplate:
+    """Make `template` available to the `run_script` tool."""
+    SCRIPT_TEMPLATES[template.name] = template
+    return template
+
+
+def get_template(name: str) -> ScriptTemplate:
+    """
+    Look up a registered template by name (case-insensitive).
+
+    Raises:
+        ValueError: If no template has that name.
+    """
+    template = SCRIPT_TEMPLATES.get(name.strip().lower())
+    if template is None:
+        raise ValueError(f"Unknown script template '{name}' (available: {', '.join(sorted(SCRIPT_TEMPLATES))})")
+    return template
+
+
+# ── Script assembly ──────────────────────────────────────────────────
+_PRELUDE = '''\
+import contextlib
+import json
+import math
+import random
+
+import unreal
+
+PARAMS = json.loads({params!r})
+SELECT = json.loads({select!r})
+DRY_RUN = {dry_run!r}
+
+
+def vec(v):
+    return [round(v.x, 3), round(v.y, 3), round(v.z, 3)]
+
+
+def select_actors():
+    wanted = set(SELECT["actors"]) if SELECT["actors"] is not None else None
+    class_filter = SELECT["class_filter"].lower()
+    name_filter = SELECT["name_filter"].lower()
+    picked = []
+    for actor in unreal.get_editor_subsystem(unreal.EditorActorSubsystem).get_all_level_actors():
+        path = actor.get_path_name()
+        if wanted is not None and path not in wanted:
+            continue
+        if class_filter not in actor.get_class().get_name().lower():
+            continue
+        if name_filter and name_filter not in (path.rsplit(".", 1)[-1] + " " + actor.get_actor_label()).lower():
+            continue
+        picked.append(actor)
+    return sorted(picked, key=lambda a: a.get_path_name())
+
+'''
+
+_LOOP = '''
+
+actors = select_actors()
+rng = random.Random(PARAMS.get("seed"))
+results = []
+with unreal.ScopedEditorTransaction({title!r}) if not DRY_RUN and actors else contextlib.nullcontext():
+    for index, actor in enumerate(actors):
+        entry = {{"actor": actor.get_path_name()}}
+        try:
+            entry.update(apply(actor, index, len(actors), rng) or {{}})
+            entry["ok"] = True
+        except Exception as error:
+            entry.update(ok=False, error=str(error))
+        results.append(entry)
+print({marker!r} + json.dumps(results))
+'''
+
+
+def build_script(
+    template: ScriptTemplate,
+    params: dict,
+    class_filter: str = "",
+    name_filter: str = "",
+    actors: list[str] | None = None,
+    dry_run: bool = False,
+) -> str:
+    """
+    The editor Python for one run of `template` over the selected actors.
+
+    `params` must already be validated; they and the selection are
+    embedded as JSON string literals.  Actors are picked by class and
+    name/label substring (case-insensitive) and, when `actors` is given,
+    only among those paths.  The edits form one undo transaction.
+    """
+    select = {"class_filter": class_filter, "name_filter": name_filter, "actors": actors}
+    return (
+        _PRELUDE.format(params=json.dumps(params), select=json.dumps(select), dry_run=dry_run)
+        + template.apply.strip("\n")
+        + _LOOP.format(title=f"MCP: {template.name}", marker=RESULT_MARKER)
+    )
+
+
+def build_script_payload(script: str) -> dict:
+    """`send_ue_ws_command` arguments that run `script` in the editor."""
+    return {
+        "object_path": PYTHON_LIBRARY,
+        "function_name": "ExecutePythonCommandEx",
+        "parameters": {
+            "PythonCommand": script,
+            "ExecutionMode": "ExecuteFile",
+            "FileExecutionScope": "Private",
+        },
+    }
+
+
+def parse_script_output(response: dict) -> list[dict]:
+    """
+    Per-actor results from an ``ExecutePythonCommandEx`` response.
+
+    Raises:
+        Exception: If the script failed or printed no results.
+    """
+    body = response.get("ResponseBody", {})
+    for entry in body.get("LogOutput") or []:
+        output = entry.get("Output", "")
+        if output.startswith(RESULT_MARKER):
+            return json.loads(output[len(RESULT_MARKER):])
+    if body.get("ReturnValue") is False:
+        trace = (body.get("CommandResult") or "").strip().splitlines()
+        raise Exception(f"Script failed in Unreal: {trace[-1] if trace else 'no details'}")
+    raise Exception("Script produced no results")
+
+
+# ── Built-in templates ───────────────────────────────────────────────
+_SEED = ScriptParam("seed", "integer", "Random seed, for repeatable results", optional=True)
+
+
+def _check_scale_range(values: dict) -> str | None:
+    if values["min_scale"] > values["max_scale"]:
+        return "'min_scale' must not be greater than 'max_scale'"
+    return None
+
+
+register_template(ScriptTemplate(
+    name="randomize_scale",
+    description="Give each actor a random scale between min_scale and max_scale.",
+    params=(
+        ScriptParam("min_scale", "number", "Smallest scale factor", default=0.5, minimum=0.001, maximum=1000),
+        ScriptParam("max_scale", "number", "Largest scale factor", default=2.0, minimum=0.001, maximum=1000),
+        ScriptParam("uniform", "boolean", "Same factor on all three axes", default=True),
+        _SEED,
+    ),
+    check=_check_scale_range,
+    apply='''
+def apply(actor, index, count, rng):
+    low, high = PARAMS["min_scale"], PARAMS["max_scale"]
+    if PARAMS["uniform"]:
+        factor = rng.uniform(low, high)
+        scale = unreal.Vector(factor, factor, factor)
+    else:
+        scale = unreal.Vector(rng.uniform(low, high), rng.uniform(low, high), rng.uniform(low, high))
+    if not DRY_RUN:
+        actor.set_actor_scale3d(scale)
+    return {"scale": vec(scale)}
+''',
+))
+
+register_template(ScriptTemplate(
+    name="randomize_yaw",
+    description="Turn each actor to a random yaw within ±max_degrees, keeping pitch and roll.",
+    params=(
+        ScriptParam("max_degrees", "number", "Largest turn either way", default=180.0, minimum=0, maximum=180),
+        _SEED,
+    ),
+    apply='''
+def apply(actor, index, count, rng):
+    current = actor.get_actor_rotation()
+    limit = PARAMS["max_degrees"]
+    rotation = unreal.Rotator(roll=current.roll, pitch=current.pitch, yaw=rng.uniform(-limit, limit))
+    if not DRY_RUN:
+        actor.set_actor_rotation(rotation, False)
+    return {"rotation": [round(rotation.pitch, 3), round(rotation.yaw, 3), round(rotation.roll, 3)]}
+''',
+))
+
+register_template(ScriptTemplate(
+    name="align_to_grid",
+    description="Lay the actors out on a grid (in path order), row by row from origin.",
+    params=(
+        ScriptParam("spacing", "number", "Distance between neighbours", default=500.0, minimum=1, maximum=1_000_000),
+        ScriptParam("columns", "integer", "Actors per row (default: square grid)", optional=True, minimum=1, maximum=10_000),
+        ScriptParam("origin", "vector", "Location of the first actor", default=[0.0, 0.0, 0.0]),
+        ScriptParam("keep_z", "boolean", "Keep each actor's height instead of origin's Z", default=True),
+    ),
+    apply='''
+def apply(actor, index, count, rng):
+    columns = PARAMS["columns"] or max(1, math.ceil(math.sqrt(count)))
+    x, y, z = PARAMS["origin"]
+    if PARAMS["keep_z"]:
+        z = actor.get_actor_location().z
+    spacing = PARAMS["spacing"]
+    location = unreal.Vector(x + (index % columns) * spacing, y + (index // columns) * spacing, z)
+    if not DRY_RUN:
+        actor.set_actor_location(location, False, True)
+    return {"location": vec(location)}
+''',
+))
+
+register_template(ScriptTemplate(
+    name="offset_location",
+    description="Move every actor by the same offset.",
+    params=(
+        ScriptParam("offset", "vector", "Distance to move along X, Y and Z", required=True),
+    ),
+    apply='''
+def apply(actor, index, count, rng):
+    current = actor.get_actor_location()
+    dx, dy, dz = PARAMS["offset"]
+    location = unreal.Vector(current.x + dx, current.y + dy, current.z + dz)
+    if not DRY_RUN:
+        actor.set_actor_location(location, False, True)
+    return {"location": vec(location)}
+''',
+))
@@ -0,0 +1,2 @@
+# Stand-in package — local fake of Unreal's Remote Control WebSocket server
+from .server import FakeActor, FakeUnrealServer, serve_forever
@@ -0,0 +1,29 @@
+"""
+Run the Unreal Remote Control stand-in.
+
+    python -m unreal_mcp.standin
+    python -m unreal_mcp.standin --port 30021 --latency-ms 5
+    python -m unreal_mcp.standin --port 30022 --level Arena   ← a second "editor"
+"""
+
+import argparse
+import asyncio
+
+from unreal_mcp.standin.server import serve_forever
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Local stand-in for Unreal's Remote Control server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=30020)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Delay added to every response")
+    parser.add_argument("--level", default="StandIn", help="Name of the level the actors live in")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    try:
+        asyncio.run(serve_forever(args.host, args.port, args.latency_ms / 1000, args.level))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,111 @@
+"""
+Editor Python for the stand-in — just enough of the ``unreal`` module.
+
+Runs the scripts built by `unreal_mcp.scripting` against the stand-in's
+in-memory level, so script templates can be tried without an editor.
+Only what the templates use is provided: the actor subsystem, actor
+transforms, `Vector`, `Rotator` and `ScopedEditorTransaction`.
+"""
+
+import contextlib
+import io
+import sys
+import traceback
+import types
+
+
+class Vector:
+    def __init__(self, x: float = 0.0, y: float = 0.0, z: float = 0.0):
+        self.x, self.y, self.z = float(x), float(y), float(z)
+
+
+class Rotator:
+    def __init__(self, roll: float = 0.0, pitch: float = 0.0, yaw: float = 0.0):
+        self.roll, self.pitch, self.yaw = float(roll), float(pitch), float(yaw)
+
+
+class _Class:
+    def __init__(self, name: str):
+        self._name = name
+
+    def get_name(self) -> str:
+        return self._name
+
+
+class _Actor:
+    """Wraps a `FakeActor` with the ``unreal.Actor`` methods templates use."""
+
+    def __init__(self, actor):
+        self._actor = actor
+
+    def get_path_name(self) -> str:
+        return self._actor.path
+
+    def get_class(self) -> _Class:
+        return _Class(self._actor.actor_class)
+
+    def get_actor_label(self) -> str:
+        return self._actor.label
+
+    def get_actor_location(self) -> Vector:
+        loc = self._actor.location
+        return Vector(loc["X"], loc["Y"], loc["Z"])
+
+    def set_actor_location(self, location: Vector, sweep: bool, teleport: bool):
+        self._actor.location = {"X": location.x, "Y": location.y, "Z": location.z}
+
+    def get_actor_rotation(self) -> Rotator:
+        rot = self._actor.rotation
+        return Rotator(roll=rot["Roll"], pitch=rot["Pitch"], yaw=rot["Yaw"])
+
+    def set_actor_rotation(self, rotation: Rotator, teleport_physics: bool):
+        self._actor.rotation = {"Pitch": rotation.pitch, "Yaw": rotation.yaw, "Roll": rotation.roll}
+
+    def get_actor_scale3d(self) -> Vector:
+        scale = self._actor.scale
+        return Vector(scale["X"], scale["Y"], scale["Z"])
+
+    def set_actor_scale3d(self, scale: Vector):
+        self._actor.scale = {"X": scale.x, "Y": scale.y, "Z": scale.z}
+
+
+def _unreal_module(actors: dict) -> types.ModuleType:
+    module = types.ModuleType("unreal")
+
+    class EditorActorSubsystem:
+        def get_all_level_actors(self):
+            return [_Actor(actor) for actor in actors.values()]
+
+    module.Vector = Vector
+    module.Rotator = Rotator
+    module.EditorActorSubsystem = EditorActorSubsystem
+    module.ScopedEditorTransaction = lambda description: contextlib.nullcontext()
+    module.get_editor_subsystem = lambda cls: cls()
+    return module
+
+
+def run_python(script: str, actors: dict) -> dict:
+    """
+    Run `script` against `actors` (path → `FakeActor`).
+
+    Returns:
+        The ``ExecutePythonCommandEx`` outputs: ReturnValue,
+        CommandResult and LogOutput (one entry per printed line).
+    """
+    stdout = io.StringIO()
+    previous = sys.modules.get("unreal")
+    sys.modules["unreal"] = _unreal_module(actors)
+    try:
+        with contextlib.redirect_stdout(stdout):
+            exec(compile(script, "<editor script>", "exec"), {"__name__": "__main__"})
+        ok, result = True, ""
+    except Exception:
+        ok, result = False, traceback.format_exc()
+    finally:
+        if previous is None:
+            sys.modules.pop("unreal", None)
+        else:
+            sys.modules["unreal"] = previous
+
+    log = [{"Type": "Info", "Output": line} for line in stdout.getvalue().splitlines()]
+    return {"ReturnValue": ok, "CommandResult": result, "LogOutput": log}
@@ -0,0 +1,224 @@
+"""
+Unreal Remote Control Stand-in — a local fake of the editor's WebSocket server.
+
+Speaks the same ``{"MessageName": "http", ...}`` protocol that
+`send_ue_ws_command()` sends (single ``/remote/object/call`` requests
+and ``/remote/batch``), keeps an in-memory level, and can add a fixed
+latency to every message.  Lets the tools, the agents and the
+benchmarks run without a real editor.
+
+Supported functions:
+    GetAllLevelActors, SpawnActorFromObject, SpawnActorFromClass,
+    SetActorScale3D, K2_SetActorLocation, K2_SetActorRotation,
+    K2_GetActorLocation, GetActorLabel, AddComponentByClass,
+    SetStaticMesh, AddInstances, ExecutePythonCommandEx (see python.py)
+"""
+
+import asyncio
+import json
+from dataclasses import dataclass, field
+
+import websockets
+
+from unreal_mcp.standin.python import run_python
+
+
+def level_prefix(level: str = "StandIn") -> str:
+    """Actor path prefix of the stand-in level called `level`."""
+    return f"/Game/{level}.{level}:PersistentLevel."
+
+
+LEVEL_PREFIX = level_prefix()
+
+
+@dataclass
+class FakeActor:
+    """One actor in the stand-in level."""
+
+    path: str
+    actor_class: str
+    label: str
+    location: dict = field(default_factory=lambda: {"X": 0.0, "Y": 0.0, "Z": 0.0})
+    rotation: dict = field(default_factory=lambda: {"Pitch": 0.0, "Yaw": 0.0, "Roll": 0.0})
+    scale: dict = field(default_factory=lambda: {"X": 1.0, "Y": 1.0, "Z": 1.0})
+    instances: int = 0
+
+
+class FakeUnrealServer:
+    """
+    In-memory Remote Control server.
+
+    Args:
+        host, port: Where to listen (the real editor uses 30020).
+        latency:    Seconds added before every response.
+        level:      Name of the level the actors live in; run stand-ins
+                    with different levels to try multi-editor routing.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 30020, latency: float = 0.0, level: str = "StandIn"):
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.level_prefix = level_prefix(level)
+        self.actors: dict[str, FakeActor] = {}
+        self.messages = 0
+        self.calls = 0
+        self._counters: dict[str, int] = {}
+        self._server = None
+
+    # ── Lifecycle ────────────────────────────────────────────────────
+    @property
+    def url(self) -> str:
+        return f"ws://{self.host}:{self.port}"
+
+    async def start(self):
+        self._server = await websockets.serve(self._handle, self.host, self.port, max_size=None)
+        # Port 0 means "pick one" — report the real port back
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc):
+        await self.stop()
+
+    # ── Level helpers ────────────────────────────────────────────────
+    def add_actor(self, actor_class: str, label: str | None = None, location: dict | None = None) -> FakeActor:
+        """Create an actor named ``<Class>_<N>`` like the editor does."""
+        n = self._counters.get(actor_class, 0)
+        self._counters[actor_class] = n + 1
+        actor = FakeActor(
+            path=f"{self.level_prefix}{actor_class}_{n}",
+            actor_class=actor_class,
+            label=label or actor_class,
+        )
+        if location:
+            actor.location = {k: float(location.get(k, 0.0)) for k in ("X", "Y", "Z")}
+        self.actors[actor.path] = actor
+        return actor
+
+    def clear(self):
+        """Empty the level and restart actor numbering."""
+        self.actors.clear()
+        self._counters.clear()
+
+    # ── Protocol ─────────────────────────────────────────────────────
+    async def _handle(self, ws):
+        async for raw in ws:
+            # Each message is answered independently, like the real
+            # server answering requests as their results come in.
+            asyncio.ensure_future(self._respond(ws, raw))
+
+    async def _respond(self, ws, raw):
+        self.messages += 1
+        message = json.loads(raw)
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        params = message.get("Parameters", {})
+        code, body = self._route(params.get("Url"), params.get("Body", {}))
+        reply = {"RequestId": message.get("Id"), "ResponseCode": code, "ResponseBody": body}
+        try:
+            await ws.send(json.dumps(reply))
+        except websockets.ConnectionClosed:
+            pass
+
+    def _route(self, url: str, body: dict) -> tuple[int, dict]:
+        if url == "/remote/object/call":
+            return self._call(body)
+        if url == "/remote/batch":
+            responses = []
+            for request in body.get("Requests", []):
+                code, sub_body = self._route(request.get("URL"), request.get("Body", {}))
+                responses.append({
+                    "RequestId": request.get("RequestId"),
+                    "ResponseCode": code,
+                    "ResponseBody": sub_body,
+                })
+            return 200, {"Responses": responses}
+        return 404, {"errorMessage": f"Unknown route {url}"}
+
+    def _call(self, body: dict) -> tuple[int, dict]:
+        self.calls += 1
+        path = body.get("objectPath", "")
+        function = body.get("functionName", "")
+        params = body.get("parameters", {}) or {}
+
+        handler = getattr(self, f"_fn_{function}", None)
+        if handler is None:
+            return 400, {"errorMessage": f"Function {function} not found on {path}"}
+        try:
+            if function == "ExecutePythonCommandEx":
+                # Out parameters come back next to the ReturnValue
+                return 200, handler(path, params)
+            return 200, {"ReturnValue": handler(path, params)}
+        except LookupError:
+            return 400, {"errorMessage": f"Object {path} not found"}
+
+    def _actor(self, path: str) -> FakeActor:
+        actor = self.actors.get(path)
+        if actor is None:
+            raise LookupError(path)
+        return actor
+
+    # ── Remote-callable functions ────────────────────────────────────
+    def _fn_GetAllLevelActors(self, path, params):
+        return list(self.actors)
+
+    def _fn_SpawnActorFromObject(self, path, params):
+        asset = params.get("ObjectToUse", "")
+        shape = asset.rsplit(".", 1)[-1] or "Mesh"
+        return self.add_actor("StaticMeshActor", label=shape, location=params.get("Location")).path
+
+    def _fn_SpawnActorFromClass(self, path, params):
+        actor_class = params.get("ActorClass", "").rsplit(".", 1)[-1] or "Actor"
+        return self.add_actor(actor_class, location=params.get("Location")).path
+
+    def _fn_SetActorScale3D(self, path, params):
+        self._actor(path).scale = dict(params.get("NewScale3D", {}))
+
+    def _fn_K2_SetActorLocation(self, path, params):
+        self._actor(path).location = dict(params.get("NewLocation", {}))
+        return True
+
+    def _fn_K2_SetActorRotation(self, path, params):
+        self._actor(path).rotation = dict(params.get("NewRotation", {}))
+        return True
+
+    def _fn_K2_GetActorLocation(self, path, params):
+        return dict(self._actor(path).location)
+
+    def _fn_GetActorLabel(self, path, params):
+        return self._actor(path).label
+
+    def _fn_AddComponentByClass(self, path, params):
+        self._actor(path)
+        component_class = params.get("Class", "").rsplit(".", 1)[-1] or "Component"
+        return f"{path}.{component_class}_0"
+
+    def _fn_SetStaticMesh(self, path, params):
+        self._actor(path.rsplit(".", 1)[0])
+        return True
+
+    def _fn_ExecutePythonCommandEx(self, path, params):
+        return run_python(params.get("PythonCommand", ""), self.actors)
+
+    def _fn_AddInstances(self, path, params):
+        actor = self._actor(path.rsplit(".", 1)[0])
+        added = len(params.get("InstanceTransforms", []))
+        actor.instances += added
+        return list(range(actor.instances - added, actor.instances)) if params.get("bShouldReturnIndices") else []
+
+
+async def serve_forever(host: str = "127.0.0.1", port: int = 30020, latency: float = 0.0, level: str = "StandIn"):
+    """Run a stand-in until cancelled (used by ``python -m unreal_mcp.standin``)."""
+    async with FakeUnrealServer(host, port, latency, level) as server:
+        print(f"🧪 Unreal stand-in listening on {server.url} (level {level}, latency {latency * 1000:.1f} ms)")
+        await asyncio.Future()
@@ -1,18 +1,27 @@
 """
 Tools package — MCP tool registration.
 
-Importing this package triggers all tool modules to load, which
-registers their @mcp.tool() decorated functions with the FastMCP
-instance.
+`TOOL_MODULES` lists the tool modules.  Nothing is imported up front:
+`load_tools()` (called when `unreal_mcp.mcp` is first used) imports
+them all, and their @mcp.tool() decorated functions register with the
+FastMCP instance.  The server must list every tool, so all modules load
+together; what stays cheap is importing `unreal_mcp` without `mcp`.
 
 To add a new tool:
   1. Create a new .py file in this folder
-  2. Import `mcp` from `unreal_mcp` and decorate your function
-  3. Add an import line below so the module loads at startup
+  2. Import `mcp` from `unreal_mcp` and decorate your function with
+     `@mcp.tool()` followed by `@instrumented` (metrics)
+  3. Add the module to `TOOL_MODULES` below
 """
 
-# Each import causes the @mcp.tool() decorators inside to fire,
-# registering the tools on the shared `mcp` instance.
-from . import spawning   # noqa: F401  – spawn_actor
-from . import actors     # noqa: F401  – list_actors
-from . import transform  # noqa: F401  – set_actor_scale
+import importlib
+
+
+TOOL_MODULES = ("spawning", "actors", "transform", "batch", "scripts")
+
+
+def load_tools() -> list[str]:
+    """Import every tool module, registering its tools.  Returns the modules."""
+    for module in TOOL_MODULES:
+        importlib.import_module(f"{__name__}.{module}")
+    return list(TOOL_MODULES)
@@ -1,30 +1,229 @@
 """
-Actors Tool — list all actors in the current Unreal level.
+Actors Tool — list actors in the current Unreal level.
 
-Uses the connection layer to query Unreal and the utils layer
-to parse and format the response.
+Queries Unreal through the scene actor index (which keeps its name
+lookups up to date as a side effect), stores the result as a versioned
+snapshot, and serves filtered pages from that snapshot.  Follow-up
+pages use an opaque cursor and never re-query Unreal.
+`list_actor_changes` diffs the current level against an earlier
+snapshot version so agents can confirm their edits cheaply.
+`find_actors_near` / `find_actors_in_box` answer proximity queries
+from the in-memory spatial index.
 """
 
+import base64
+import fnmatch
+import json
+import re
+
 from unreal_mcp import mcp
-from unreal_mcp.connection import send_ue_ws_command
-from unreal_mcp.utils import extract_return_value, format_actor_list, format_error
+from unreal_mcp.scene import (
+    actor_index, actor_class_name, short_name, snapshot_store, spatial_index,
+)
+from unreal_mcp.utils import (
+    format_actor_changes, format_actor_list, format_actor_page,
+    format_error, format_nearby_actors,
+)
+from unreal_mcp.utils.metrics import instrumented
+
+
+# ── Page size bounds ─────────────────────────────────────────────────
+_DEFAULT_LIMIT = 100
+_MAX_LIMIT = 1000
+
+
+def _encode_cursor(state: dict) -> str:
+    raw = json.dumps(state, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+# Cursor fields and their types ("d", the snapshot digest, is optional)
+_CURSOR_FIELDS = {"v": int, "o": int, "l": int, "c": str, "p": str, "r": bool}
+
+
+def _decode_cursor(cursor: str) -> dict:
+    """
+    Decode a cursor from `_encode_cursor`.
+
+    Raises:
+        ValueError: If it is not one of ours (bad encoding or fields).
+    """
+    padded = cursor + "=" * (-len(cursor) % 4)
+    state = json.loads(base64.urlsafe_b64decode(padded))
+    if not isinstance(state, dict) or not isinstance(state.get("d", ""), str):
+        raise ValueError("Invalid cursor")
+    for key, kind in _CURSOR_FIELDS.items():
+        if not isinstance(state.get(key), kind) or (kind is int and isinstance(state[key], bool)):
+            raise ValueError("Invalid cursor")
+    return state
+
+
+def _build_matcher(class_filter: str, name_pattern: str, use_regex: bool):
+    """Return a predicate over actor paths for the given filters."""
+    class_filter = class_filter.lower()
+    if not name_pattern:
+        name_re = None
+    elif use_regex:
+        name_re = re.compile(name_pattern, re.IGNORECASE)
+    else:
+        name_re = re.compile(fnmatch.translate(name_pattern), re.IGNORECASE)
+
+    def matches(path: str) -> bool:
+        if class_filter and class_filter not in actor_class_name(path).lower():
+            return False
+        if name_re is not None:
+            label = actor_index.label_of(path) or ""
+            if not (name_re.match(short_name(path)) or (label and name_re.match(label))):
+                return False
+        return True
+
+    return matches
+
+
+@mcp.tool(annotations={"readOnlyHint": True})
+@instrumented
+async def list_actors(
+    class_filter: str = "",
+    name_pattern: str = "",
+    use_regex: bool = False,
+    limit: int = _DEFAULT_LIMIT,
+    cursor: str = "",
+) -> str:
+    """
+    List actors in the level with names and paths, one page at a time.
+    class_filter: part of the class name (e.g. "light"). name_pattern:
+    glob on name/label (e.g. "Cube*"), or a regex if use_regex.
+    Pass the returned cursor to get the next page.
+    """
+    try:
+        if cursor:
+            # ── Next page: filters and snapshot come from the cursor ─
+            try:
+                state = _decode_cursor(cursor)
+            except Exception:
+                return format_error(ValueError("Invalid cursor"), "Call list_actors without a cursor.")
+            snapshot = snapshot_store.get(state["v"])
+            if snapshot is None or ("d" in state and not snapshot.digest.startswith(state["d"])):
+                # Another server worker handed out this cursor: carry on
+                # if the level still matches the snapshot it points at.
+                snapshot = snapshot_store.record(await actor_index.refresh())
+                if not snapshot.digest.startswith(state.get("d", "-")):
+                    snapshot = None
+            if snapshot is None:
+                return format_error(
+                    ValueError("Cursor has expired"),
+                    "Call list_actors without a cursor to start over.",
+                )
+            class_filter, name_pattern, use_regex = state["c"], state["p"], state["r"]
+            offset, limit = state["o"], state["l"]
+        else:
+            snapshot = None
+            offset = 0
+
+        try:
+            matches = _build_matcher(class_filter, name_pattern, use_regex)
+        except re.error as e:
+            return format_error(e, "Fix the regular expression or set use_regex=false.")
+
+        if snapshot is None:
+            # ── First page: fresh snapshot from Unreal ───────────────
+            snapshot = snapshot_store.record(await actor_index.refresh())
 
+        limit = max(1, min(limit, _MAX_LIMIT))
 
-# ── Editor subsystem used to enumerate actors ────────────────────────
-_ACTOR_SUBSYSTEM = "/Script/UnrealEd.Default__EditorActorSubsystem"
+        if name_pattern:
+            # Labels are fetched lazily; the pattern also matches them
+            await actor_index.load_labels()
+        if class_filter or name_pattern:
+            selected = [a for a in snapshot.actors if matches(a)]
+        else:
+            selected = snapshot.actors
 
+        page = list(selected[offset:offset + limit])
+        next_cursor = None
+        if offset + limit < len(selected):
+            next_cursor = _encode_cursor({
+                "v": snapshot.version, "d": snapshot.digest[:12], "o": offset + limit, "l": limit,
+                "c": class_filter, "p": name_pattern, "r": use_regex,
+            })
 
-@mcp.tool()
-async def list_actors() -> str:
-    """List all actors in the level with names and paths."""
+        return format_actor_page(page, offset, len(selected), snapshot.version, next_cursor)
+
+    except Exception as e:
+        return format_error(e, "Is the Editor Actor Subsystem accessible?")
+
+
+@mcp.tool(annotations={"readOnlyHint": True})
+@instrumented
+async def list_actor_changes(since_version: int) -> str:
+    """
+    List only actors added or removed since a snapshot version (the
+    "snapshot vN" shown by list_actors). Returns the new version to use next.
+    """
     try:
-        response = await send_ue_ws_command(
-            object_path=_ACTOR_SUBSYSTEM,
-            function_name="GetAllLevelActors",
-        )
+        snapshot = snapshot_store.record(await actor_index.refresh())
+        changes = snapshot_store.diff(since_version, snapshot)
+        if changes is None:
+            return format_error(
+                ValueError(f"Snapshot v{since_version} is no longer available (now v{snapshot.version})"),
+                f"Use since_version={snapshot.version} from now on, or list_actors for a full view.",
+            )
+
+        added, removed = changes
+        return format_actor_changes(added, removed, since_version, snapshot.version)
+
+    except Exception as e:
+        return format_error(e, "Is the Editor Actor Subsystem accessible?")
+
 
-        actors = extract_return_value(response)
-        return format_actor_list(actors)
+async def _sync_spatial_index(refresh: bool):
+    """Bring the spatial index up to date if it is stale or a reload is asked for."""
+    if refresh or spatial_index.is_stale:
+        await spatial_index.sync(await actor_index.refresh(), reload=refresh)
+
+
+@mcp.tool(annotations={"readOnlyHint": True})
+@instrumented
+async def find_actors_near(
+    x: float,
+    y: float,
+    z: float,
+    radius: float = 1000,
+    limit: int = 50,
+    refresh: bool = False,
+) -> str:
+    """
+    Find actors within radius of X, Y, Z, nearest first. Set refresh
+    to re-read every actor location from Unreal (after manual edits).
+    """
+    try:
+        await _sync_spatial_index(refresh)
+        hits = spatial_index.near(x, y, z, radius, max(1, min(limit, _MAX_LIMIT)))
+        return format_nearby_actors(hits, x, y, z)
+
+    except Exception as e:
+        return format_error(e, "Is the Editor Actor Subsystem accessible?")
+
+
+@mcp.tool(annotations={"readOnlyHint": True})
+@instrumented
+async def find_actors_in_box(
+    min_x: float,
+    min_y: float,
+    min_z: float,
+    max_x: float,
+    max_y: float,
+    max_z: float,
+    limit: int = 100,
+    refresh: bool = False,
+) -> str:
+    """Find actors inside the box from (min_x, min_y, min_z) to (max_x, max_y, max_z)."""
+    try:
+        await _sync_spatial_index(refresh)
+        lo = (min(min_x, max_x), min(min_y, max_y), min(min_z, max_z))
+        hi = (max(min_x, max_x), max(min_y, max_y), max(min_z, max_z))
+        found = spatial_index.in_box(lo, hi, max(1, min(limit, _MAX_LIMIT)))
+        return format_actor_list(found)
 
     except Exception as e:
         return format_error(e, "Is the Editor Actor Subsystem accessible?")
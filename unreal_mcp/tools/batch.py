@@ -0,0 +1,49 @@
+"""
+Batch Tool — run many Remote Control calls in one tool call.
+
+Lets an agent send a whole plan (spawns, transforms, queries) to Unreal
+as a single batched request instead of one tool call per operation.
+Calls into the editor's Python plugin are refused: code only runs
+through the templates of `run_script`.
+"""
+
+from unreal_mcp import mcp
+from unreal_mcp.connection import send_ue_ws_batch
+from unreal_mcp.utils import format_batch_results, format_error
+from unreal_mcp.utils.metrics import instrumented
+
+
+def _runs_python(call: dict) -> bool:
+    """Whether `call` would execute Python in the editor."""
+    return (
+        "pythonscriptlibrary" in str(call["object_path"]).lower()
+        or str(call["function_name"]).lower().startswith("executepython")
+    )
+
+
+@mcp.tool(annotations={"readOnlyHint": False})
+@instrumented
+async def batch_call(calls: list[dict]) -> str:
+    """
+    Run several Unreal function calls at once. Each item needs
+    object_path and function_name, plus optional parameters (dict).
+    Results are reported per call, in order.
+    """
+    for i, call in enumerate(calls):
+        if not call.get("object_path") or not call.get("function_name"):
+            return format_error(
+                ValueError(f"Call {i} is missing object_path or function_name"),
+                "Every call needs object_path and function_name.",
+            )
+        if _runs_python(call):
+            return format_error(
+                ValueError(f"Call {i} runs Python in the editor, which batch_call does not allow"),
+                "Use run_script with one of the templates from list_script_templates.",
+            )
+
+    try:
+        results = await send_ue_ws_batch(calls)
+        return format_batch_results(calls, results)
+
+    except Exception as e:
+        return format_error(e, "Check the object paths and function names.")
@@ -0,0 +1,73 @@
+"""
+Scripts Tool — bulk edits as one in-editor loop.
+
+`run_script` runs a registered script template (see
+`unreal_mcp.scripting`) over every matching actor inside the editor
+through ``PythonScriptLibrary.ExecutePythonCommandEx``: one Remote
+Control call instead of one per actor, with per-actor results.  Only
+server-side templates can run; the agent supplies validated parameters,
+never code.  Needs the Python Editor Script Plugin enabled in Unreal.
+"""
+
+from unreal_mcp import mcp
+from unreal_mcp.connection import send_ue_ws_fanout
+from unreal_mcp.scene import actor_index, spatial_index
+from unreal_mcp.scripting import (
+    SCRIPT_TEMPLATES, build_script, build_script_payload, get_template, parse_script_output,
+)
+from unreal_mcp.utils import format_error, format_script_results
+from unreal_mcp.utils.metrics import instrumented
+
+
+@mcp.tool(annotations={"readOnlyHint": True})
+@instrumented
+async def list_script_templates() -> str:
+    """List the bulk-edit templates run_script accepts, with their parameters."""
+    lines = []
+    for name, template in sorted(SCRIPT_TEMPLATES.items()):
+        lines.append(f"{name}: {template.description}")
+        lines += [f"  - {param.describe()}" for param in template.params]
+    return "Script templates:\n" + "\n".join(lines)
+
+
+@mcp.tool(annotations={"readOnlyHint": False})
+@instrumented
+async def run_script(
+    template: str,
+    params: dict | None = None,
+    class_filter: str = "",
+    name_filter: str = "",
+    actors: list[str] | None = None,
+    dry_run: bool = False,
+) -> str:
+    """
+    Apply a bulk-edit template (see list_script_templates) to many actors
+    in one editor call, e.g. template="randomize_scale", name_filter="cube".
+    Actors are picked by class_filter / name_filter (substring of the
+    class, name or label) and, if given, only among `actors`.
+    dry_run reports the results without changing anything.
+    """
+    try:
+        chosen = get_template(template)
+        values = chosen.validate(params)
+    except ValueError as e:
+        return format_error(e, "Call list_script_templates for templates and their parameters.")
+
+    try:
+        paths = await actor_index.resolve_many(actors) if actors is not None else None
+    except Exception as e:
+        return format_error(e, "Use names, labels or full paths from list_actors.")
+
+    script = build_script(chosen, values, class_filter, name_filter, paths, dry_run)
+    try:
+        # Every editor runs the loop over its own actors
+        responses = await send_ue_ws_fanout(**build_script_payload(script))
+        results = [result for response in responses for result in parse_script_output(response)]
+    except Exception as e:
+        return format_error(e, "Make sure the Python Editor Script Plugin is enabled in Unreal.")
+
+    if not dry_run:
+        for result in results:
+            if result.get("ok") and "location" in result:
+                spatial_index.update(result["actor"], *result["location"])
+    return format_script_results(chosen.name, results, dry_run)
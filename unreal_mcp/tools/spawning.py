@@ -2,20 +2,69 @@
 Spawning Tool — spawn actors and shapes in the Unreal level.
 
 Uses the mappings layer to resolve friendly names and the connection
-layer to talk to Unreal Engine.
+layer to talk to Unreal Engine.  `spawn_actors` places many actors in
+one tool call by generating a layout and sending batched requests;
+`spawn_instanced_mesh` puts the whole layout into a single actor's
+InstancedStaticMeshComponent for very large counts.
 """
 
+import time
+
 from unreal_mcp import mcp
-from unreal_mcp.connection import send_ue_ws_command
+from unreal_mcp.connection import send_ue_ws_command, send_ue_ws_batch
 from unreal_mcp.mappings import get_asset_path, get_class_path
-from unreal_mcp.utils import format_error
+from unreal_mcp.scene import actor_index, spatial_index
+from unreal_mcp.utils import extract_return_value, format_error
+from unreal_mcp.utils.layout import generate_positions
+from unreal_mcp.utils.metrics import instrumented
 
 
 # ── Editor Library path used for all spawn calls ─────────────────────
 _EDITOR_LIB = "/Script/EditorScriptingUtilities.Default__EditorLevelLibrary"
 
+# ── Classes used by the instanced spawning mode ──────────────────────
+_ACTOR_CLASS = "/Script/Engine.Actor"
+_ISM_COMPONENT_CLASS = "/Script/Engine.InstancedStaticMeshComponent"
+
+# ── Upper bounds for a single bulk spawn ─────────────────────────────
+_MAX_BULK_SPAWN = 50_000
+_MAX_INSTANCES = 1_000_000
+
+# ── AddInstances chunks packed into one batch request (keeps each
+#    WebSocket message well under a megabyte with the default chunk size) ─
+_INSTANCE_CHUNKS_PER_BATCH = 4
+
+
+def _spawn_call(actor_class_or_asset: str, x: float, y: float, z: float) -> tuple[dict, str]:
+    """
+    Build the spawn call for a shape or actor class.
+
+    Returns:
+        ``(call, name)`` — the call dict for `send_ue_ws_command()` /
+        `send_ue_ws_batch()` and the resolved asset or class path.
+    """
+    location = {"X": x, "Y": y, "Z": z}
+    asset_path = get_asset_path(actor_class_or_asset)
 
-@mcp.tool()
+    if asset_path:
+        # ── Spawn from Asset (basic shapes) ──────────────────────
+        return {
+            "object_path": _EDITOR_LIB,
+            "function_name": "SpawnActorFromObject",
+            "parameters": {"ObjectToUse": asset_path, "Location": location},
+        }, asset_path
+
+    # ── Spawn from Class (lights, custom actors) ─────────────────
+    resolved_class = get_class_path(actor_class_or_asset)
+    return {
+        "object_path": _EDITOR_LIB,
+        "function_name": "SpawnActorFromClass",
+        "parameters": {"ActorClass": resolved_class, "Location": location},
+    }, resolved_class
+
+
+@mcp.tool(annotations={"readOnlyHint": False})
+@instrumented
 async def spawn_actor(
     actor_class_or_asset: str,
     x: float = 0,
@@ -23,34 +72,192 @@ async def spawn_actor(
     z: float = 0,
 ) -> str:
     """Spawn an actor. Use: cube, sphere, cone, cylinder, plane, pointlight, spotlight."""
-    asset_path = get_asset_path(actor_class_or_asset)
+    call, name = _spawn_call(actor_class_or_asset, x, y, z)
 
     try:
-        if asset_path:
-            # ── Spawn from Asset (basic shapes) ──────────────────
-            response = await send_ue_ws_command(
-                object_path=_EDITOR_LIB,
-                function_name="SpawnActorFromObject",
-                parameters={
-                    "ObjectToUse": asset_path,
-                    "Location": {"X": x, "Y": y, "Z": z},
-                },
-            )
-            name = asset_path
-        else:
-            # ── Spawn from Class (lights, custom actors) ─────────
-            resolved_class = get_class_path(actor_class_or_asset)
-            response = await send_ue_ws_command(
-                object_path=_EDITOR_LIB,
-                function_name="SpawnActorFromClass",
-                parameters={
-                    "ActorClass": resolved_class,
-                    "Location": {"X": x, "Y": y, "Z": z},
-                },
-            )
-            name = resolved_class
-
+        response = await send_ue_ws_command(**call)
+        actor_path = extract_return_value(response)
+        actor_index.add(actor_path)
+        spatial_index.update(actor_path, x, y, z)
         return f"Successfully spawned {name} at {x}, {y}, {z}"
 
     except Exception as e:
         return format_error(e, "Check parameter names.")
+
+
+@mcp.tool(annotations={"readOnlyHint": False})
+@instrumented
+async def spawn_actors(
+    actor_class_or_asset: str,
+    layout: str = "grid",
+    count: int = 10,
+    x: float = 0,
+    y: float = 0,
+    z: float = 0,
+    spacing: float = 200,
+    columns: int | None = None,
+    radius: float = 1000,
+    extent_x: float = 1000,
+    extent_y: float = 1000,
+    extent_z: float = 0,
+    seed: int = 0,
+) -> str:
+    """
+    Spawn many actors at once in a layout: grid (spacing, columns),
+    line (spacing), ring (radius) or scatter (extent_x/y/z box, seed).
+    x, y, z is the origin. Same names as spawn_actor.
+    """
+    if not 0 < count <= _MAX_BULK_SPAWN:
+        return format_error(
+            ValueError(f"count must be between 1 and {_MAX_BULK_SPAWN}"),
+            "Split very large scenes into several calls.",
+        )
+
+    try:
+        positions = generate_positions(
+            layout, count, (x, y, z), spacing, columns, radius,
+            (extent_x, extent_y, extent_z), seed,
+        )
+    except ValueError as e:
+        return format_error(e, "Pick one of the supported layouts and check its parameters.")
+
+    calls = []
+    for px, py, pz in positions:
+        call, name = _spawn_call(actor_class_or_asset, px, py, pz)
+        calls.append(call)
+
+    try:
+        results = await send_ue_ws_batch(calls)
+    except Exception as e:
+        return format_error(e, "Check parameter names.")
+
+    for (px, py, pz), result in zip(positions, results):
+        if result["ok"]:
+            actor_path = extract_return_value(result["response"])
+            actor_index.add(actor_path)
+            spatial_index.update(actor_path, px, py, pz)
+
+    failed = [r["error"] for r in results if not r["ok"]]
+    summary = f"Spawned {count - len(failed)}/{count} {name} in a {layout} layout around {x}, {y}, {z}"
+    if failed:
+        summary += f". {len(failed)} failed, first error: {failed[0]}"
+    return summary
+
+
+def _instance_transform(x: float, y: float, z: float, scale: float) -> dict:
+    """An FTransform with no rotation, as Remote Control expects it."""
+    return {
+        "Translation": {"X": x, "Y": y, "Z": z},
+        "Rotation": {"X": 0, "Y": 0, "Z": 0, "W": 1},
+        "Scale3D": {"X": scale, "Y": scale, "Z": scale},
+    }
+
+
+@mcp.tool(annotations={"readOnlyHint": False})
+@instrumented
+async def spawn_instanced_mesh(
+    shape: str,
+    layout: str = "grid",
+    count: int = 1000,
+    x: float = 0,
+    y: float = 0,
+    z: float = 0,
+    spacing: float = 200,
+    columns: int | None = None,
+    radius: float = 1000,
+    extent_x: float = 1000,
+    extent_y: float = 1000,
+    extent_z: float = 0,
+    seed: int = 0,
+    scale: float = 1.0,
+    chunk_size: int = 1000,
+) -> str:
+    """
+    Spawn one actor holding `count` instances of a shape (cube, sphere,
+    ...) for very large counts. Same layouts as spawn_actors.
+    """
+    mesh_path = get_asset_path(shape) or (shape if shape.startswith("/") else None)
+    if not mesh_path:
+        return format_error(
+            ValueError(f"'{shape}' is not a known mesh"),
+            "Use a shape name like cube or sphere, or a full mesh path.",
+        )
+    if not 0 < count <= _MAX_INSTANCES:
+        return format_error(
+            ValueError(f"count must be between 1 and {_MAX_INSTANCES}"),
+            "Split very large scenes into several calls.",
+        )
+
+    try:
+        positions = generate_positions(
+            layout, count, (x, y, z), spacing, columns, radius,
+            (extent_x, extent_y, extent_z), seed,
+        )
+    except ValueError as e:
+        return format_error(e, "Pick one of the supported layouts and check its parameters.")
+
+    started = time.perf_counter()
+    try:
+        # ── 1. Empty actor that will own the instances ───────────
+        response = await send_ue_ws_command(
+            object_path=_EDITOR_LIB,
+            function_name="SpawnActorFromClass",
+            parameters={"ActorClass": _ACTOR_CLASS, "Location": {"X": x, "Y": y, "Z": z}},
+        )
+        actor_path = extract_return_value(response)
+        actor_index.add(actor_path)
+        spatial_index.update(actor_path, x, y, z)
+
+        # ── 2. Instanced mesh component as its root ──────────────
+        response = await send_ue_ws_command(
+            object_path=actor_path,
+            function_name="AddComponentByClass",
+            parameters={
+                "Class": _ISM_COMPONENT_CLASS,
+                "bManualAttachment": False,
+                "RelativeTransform": _instance_transform(0, 0, 0, 1.0),
+                "bDeferredFinish": False,
+            },
+        )
+        component_path = extract_return_value(response)
+
+        await send_ue_ws_command(
+            object_path=component_path,
+            function_name="SetStaticMesh",
+            parameters={"NewMesh": mesh_path},
+        )
+
+        # ── 3. Instances, in chunks packed into batch requests ───
+        transforms = [_instance_transform(px, py, pz, scale) for px, py, pz in positions]
+        chunk_size = max(1, chunk_size)
+        calls = [
+            {
+                "object_path": component_path,
+                "function_name": "AddInstances",
+                "parameters": {
+                    "InstanceTransforms": transforms[i:i + chunk_size],
+                    "bShouldReturnIndices": False,
+                    "bWorldSpace": True,
+                },
+            }
+            for i in range(0, len(transforms), chunk_size)
+        ]
+        results = await send_ue_ws_batch(calls, chunk_size=_INSTANCE_CHUNKS_PER_BATCH)
+
+    except Exception as e:
+        return format_error(e, "Is the Editor Scripting Utilities plugin enabled?")
+
+    elapsed = time.perf_counter() - started
+    added = sum(
+        len(call["parameters"]["InstanceTransforms"])
+        for call, result in zip(calls, results)
+        if result["ok"]
+    )
+    summary = (
+        f"Spawned {added}/{count} instances of {mesh_path} on "
+        f"{actor_path.split('.')[-1]} (Path: {actor_path}) in {elapsed:.2f}s"
+    )
+    failed = [r["error"] for r in results if not r["ok"]]
+    if failed:
+        summary += f". {len(failed)} chunk(s) failed, first error: {failed[0]}"
+    return summary
@@ -1,24 +1,57 @@
 """
 Transform Tool — modify actor transforms (scale, position, rotation).
 
-Currently implements scaling; extend this module for future movement
-and rotation tools.
+`set_actor_scale` changes one actor; `set_actor_transforms` applies many
+partial updates at once through the connection layer's write
+coalescer, so repeated updates to the same actor inside one flush
+window reach Unreal only once.
 """
 
+import asyncio
+
 from unreal_mcp import mcp
-from unreal_mcp.connection import send_ue_ws_command
+from unreal_mcp.connection import send_ue_ws_command, transform_coalescer
+from unreal_mcp.scene import actor_index, short_name, spatial_index
 from unreal_mcp.utils import format_error
+from unreal_mcp.utils.metrics import instrumented
+
+
+# ── Upper bound for a single set_actor_transforms call ───────────────
+_MAX_UPDATES = 10_000
+
+
+def _vector(value, keys: tuple[str, str, str], uniform: bool = False) -> tuple[float, float, float] | None:
+    """
+    Normalise a vector argument from an update dict.
 
+    Accepts ``[x, y, z]``, ``{"X": .., "Y": .., "Z": ..}`` (or the given
+    `keys`), None, or — when `uniform` — a single number.
 
-@mcp.tool()
+    Raises:
+        ValueError: If the value has the wrong shape.
+    """
+    if value is None:
+        return None
+    if uniform and isinstance(value, (int, float)):
+        return (float(value),) * 3
+    if isinstance(value, dict):
+        value = [value.get(k, value.get(k.lower())) for k in keys]
+    if isinstance(value, (list, tuple)) and len(value) == 3 and None not in value:
+        return tuple(float(v) for v in value)
+    raise ValueError(f"Expected 3 numbers ({', '.join(keys)}), got {value!r}")
+
+
+@mcp.tool(annotations={"readOnlyHint": False})
+@instrumented
 async def set_actor_scale(
     actor_path: str,
     scale_x: float,
     scale_y: float,
     scale_z: float,
 ) -> str:
-    """Scale an actor. Use the full actor_path from list_actors."""
+    """Scale an actor. actor_path may be the full path, the short name (StaticMeshActor_0) or the label."""
     try:
+        actor_path = await actor_index.resolve(actor_path)
         response = await send_ue_ws_command(
             object_path=actor_path,
             function_name="SetActorScale3D",
@@ -26,8 +59,63 @@ async def set_actor_scale(
                 "NewScale3D": {"X": scale_x, "Y": scale_y, "Z": scale_z}
             },
         )
-        short_name = actor_path.split(".")[-1]
-        return f"Successfully scaled {short_name} to ({scale_x}, {scale_y}, {scale_z})"
+        return f"Successfully scaled {short_name(actor_path)} to ({scale_x}, {scale_y}, {scale_z})"
+
+    except Exception as e:
+        return format_error(e, "Use a name, label or full path from list_actors.")
+
+
+@mcp.tool(annotations={"readOnlyHint": False})
+@instrumented
+async def set_actor_transforms(updates: list[dict]) -> str:
+    """
+    Move / rotate / scale many actors at once. Each update has "actor"
+    (name, label or path) and any of "location" [x, y, z],
+    "rotation" [pitch, yaw, roll], "scale" [x, y, z] or one number.
+    """
+    if not 0 < len(updates) <= _MAX_UPDATES:
+        return format_error(
+            ValueError(f"updates must contain 1 to {_MAX_UPDATES} items"),
+            "Split very large updates into several calls.",
+        )
+
+    try:
+        parsed = []
+        for i, update in enumerate(updates):
+            actor = update.get("actor") or update.get("actor_path")
+            if not actor:
+                raise ValueError(f"Update {i} has no actor")
+            location = _vector(update.get("location"), ("X", "Y", "Z"))
+            rotation = _vector(update.get("rotation"), ("Pitch", "Yaw", "Roll"))
+            scale = _vector(update.get("scale"), ("X", "Y", "Z"), uniform=True)
+            if location is None and rotation is None and scale is None:
+                raise ValueError(f"Update {i} ({actor}) has no location, rotation or scale")
+            parsed.append((actor, location, rotation, scale))
+    except ValueError as e:
+        return format_error(e, "Check the update format.")
 
+    try:
+        resolved = await actor_index.resolve_many([actor for actor, *_ in parsed])
     except Exception as e:
-        return format_error(e, "Ensure you used the exact full path.")
+        return format_error(e, "Use names, labels or full paths from list_actors.")
+
+    errors = await asyncio.gather(*(
+        transform_coalescer.submit(path, location, rotation, scale)
+        for path, (_, location, rotation, scale) in zip(resolved, parsed)
+    ))
+
+    # Duplicates share one merged write, so report per actor
+    outcome: dict[str, str | None] = {}
+    for path, (_, location, _, _), error in zip(resolved, parsed, errors):
+        outcome[path] = error
+        if not error and location is not None:
+            spatial_index.update(path, *location)
+
+    failed = [f"{short_name(path)}: {error}" for path, error in outcome.items() if error]
+    summary = (
+        f"Updated {len(outcome) - len(failed)}/{len(outcome)} actors "
+        f"({len(updates)} updates coalesced into {len(outcome)} actor writes)."
+    )
+    if failed:
+        summary += "\nErrors:\n" + "\n".join(failed[:20])
+    return summary
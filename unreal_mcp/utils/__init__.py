@@ -1,2 +1,11 @@
 # Utils package — shared response parsing & formatting helpers
-from .response import extract_return_value, format_actor_list, format_error
+from .response import (
+    extract_return_value,
+    format_actor_list,
+    format_actor_page,
+    format_actor_changes,
+    format_nearby_actors,
+    format_batch_results,
+    format_script_results,
+    format_error,
+)
@@ -0,0 +1,127 @@
+"""
+Layout Generators — positions for bulk spawning.
+
+Each generator returns a list of ``(x, y, z)`` tuples computed in a
+single pass, so tools can turn a layout description into one batched
+request instead of one tool call per actor.
+"""
+
+import math
+import random
+
+
+Position = tuple[float, float, float]
+
+LAYOUTS = ("grid", "line", "ring", "scatter")
+
+
+def grid_positions(
+    count: int,
+    spacing: float,
+    origin: Position = (0, 0, 0),
+    columns: int | None = None,
+) -> list[Position]:
+    """
+    Fill a grid row by row on the XY plane, starting at `origin`.
+
+    Args:
+        count:   Number of positions.
+        spacing: Distance between neighbours (Unreal units).
+        origin:  Position of the first cell.
+        columns: Cells per row; None picks a near-square grid.
+
+    Raises:
+        ValueError: If `columns` is given but not positive.
+    """
+    if columns is None:
+        columns = max(1, math.ceil(math.sqrt(count)))
+    elif columns <= 0:
+        raise ValueError(f"columns must be at least 1, got {columns}")
+    ox, oy, oz = origin
+    return [
+        (ox + (i % columns) * spacing, oy + (i // columns) * spacing, oz)
+        for i in range(count)
+    ]
+
+
+def line_positions(
+    count: int,
+    spacing: float,
+    origin: Position = (0, 0, 0),
+    direction: Position = (1, 0, 0),
+) -> list[Position]:
+    """Place `count` positions along `direction`, `spacing` units apart."""
+    length = math.sqrt(sum(d * d for d in direction)) or 1.0
+    dx, dy, dz = (d / length * spacing for d in direction)
+    ox, oy, oz = origin
+    return [(ox + i * dx, oy + i * dy, oz + i * dz) for i in range(count)]
+
+
+def ring_positions(
+    count: int,
+    radius: float,
+    origin: Position = (0, 0, 0),
+) -> list[Position]:
+    """Space `count` positions evenly on a horizontal circle around `origin`."""
+    ox, oy, oz = origin
+    step = 2 * math.pi / max(1, count)
+    return [
+        (ox + radius * math.cos(i * step), oy + radius * math.sin(i * step), oz)
+        for i in range(count)
+    ]
+
+
+def scatter_positions(
+    count: int,
+    extent: Position,
+    origin: Position = (0, 0, 0),
+    seed: int = 0,
+) -> list[Position]:
+    """
+    Scatter positions uniformly inside a box centred on `origin`.
+
+    The same `seed` always yields the same positions, so a scene can be
+    regenerated exactly.
+
+    Args:
+        extent: Half-size of the box along X, Y and Z.
+    """
+    rng = random.Random(seed)
+    ox, oy, oz = origin
+    ex, ey, ez = extent
+    return [
+        (
+            ox + rng.uniform(-ex, ex),
+            oy + rng.uniform(-ey, ey),
+            oz + rng.uniform(-ez, ez),
+        )
+        for _ in range(count)
+    ]
+
+
+def generate_positions(
+    layout: str,
+    count: int,
+    origin: Position = (0, 0, 0),
+    spacing: float = 200,
+    columns: int | None = None,
+    radius: float = 1000,
+    extent: Position = (1000, 1000, 0),
+    seed: int = 0,
+) -> list[Position]:
+    """
+    Dispatch to the generator for `layout` (one of `LAYOUTS`).
+
+    Raises:
+        ValueError: If the layout name is unknown or its parameters are invalid.
+    """
+    layout = layout.lower()
+    if layout == "grid":
+        return grid_positions(count, spacing, origin, columns)
+    if layout == "line":
+        return line_positions(count, spacing, origin)
+    if layout == "ring":
+        return ring_positions(count, radius, origin)
+    if layout == "scatter":
+        return scatter_positions(count, extent, origin, seed)
+    raise ValueError(f"Unknown layout '{layout}'. Use one of: {', '.join(LAYOUTS)}")
@@ -0,0 +1,171 @@
+"""
+Metrics — counters and latency histograms for tools and the transport.
+
+Recording is a dict lookup plus an integer/float add (histograms use a
+`bisect` into fixed buckets), so hooks can sit on every hot path; the
+Prometheus text is only built when someone scrapes ``/metrics``.
+
+Usage:
+    @mcp.tool()
+    @instrumented
+    async def my_tool(...) -> str: ...
+
+    metrics.inc("unreal_mcp_ws_messages_sent_total")
+    metrics.observe("unreal_mcp_ws_request_seconds", elapsed)
+"""
+
+import functools
+import time
+from bisect import bisect_left
+
+
+# ── Default histogram buckets ────────────────────────────────────────
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+SIZE_BUCKETS = (64, 256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+# ── Help text for the metrics this package records ──────────────────
+_HELP = {
+    "unreal_mcp_tool_calls_total": ("counter", "MCP tool invocations."),
+    "unreal_mcp_tool_errors_total": ("counter", "MCP tool invocations that returned or raised an error."),
+    "unreal_mcp_tool_duration_seconds": ("histogram", "Wall time spent inside MCP tools."),
+    "unreal_mcp_tool_response_bytes": ("histogram", "Size of MCP tool results."),
+    "unreal_mcp_ws_connects_total": ("counter", "WebSocket connections opened to Unreal."),
+    "unreal_mcp_ws_connect_errors_total": ("counter", "Failed WebSocket connection attempts."),
+    "unreal_mcp_ws_connect_seconds": ("histogram", "Time to open a WebSocket to Unreal."),
+    "unreal_mcp_ws_messages_sent_total": ("counter", "Messages sent to Unreal."),
+    "unreal_mcp_ws_messages_received_total": ("counter", "Messages received from Unreal."),
+    "unreal_mcp_ws_sent_bytes_total": ("counter", "Bytes sent to Unreal."),
+    "unreal_mcp_ws_received_bytes_total": ("counter", "Bytes received from Unreal."),
+    "unreal_mcp_ws_unsolicited_messages_total": ("counter", "Messages from Unreal that answered no request and were dropped."),
+    "unreal_mcp_ws_request_seconds": ("histogram", "Time from send to matching response."),
+    "unreal_mcp_ws_request_errors_total": ("counter", "Requests that failed or timed out."),
+    "unreal_mcp_ws_endpoint_down_total": ("counter", "Times an editor endpoint was taken out of rotation."),
+    "unreal_mcp_ws_failovers_total": ("counter", "Requests retried on another editor after theirs was unreachable."),
+}
+
+
+class _Histogram:
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: tuple):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class MetricsRegistry:
+    """In-process metric store with Prometheus text rendering."""
+
+    def __init__(self):
+        self._counters: dict[tuple[str, tuple], float] = {}
+        self._histograms: dict[tuple[str, tuple], _Histogram] = {}
+
+    def inc(self, name: str, value: float = 1, **labels):
+        key = (name, tuple(labels.items()))
+        self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, buckets: tuple = LATENCY_BUCKETS, **labels):
+        key = (name, tuple(labels.items()))
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            histogram = self._histograms[key] = _Histogram(buckets)
+        histogram.observe(value)
+
+    def value(self, name: str, **labels) -> float:
+        """Current value of a counter (0 if never incremented)."""
+        return self._counters.get((name, tuple(labels.items())), 0)
+
+    def sum(self, name: str, **labels) -> float:
+        """Total of a histogram's observations (0 if never observed)."""
+        histogram = self._histograms.get((name, tuple(labels.items())))
+        return histogram.sum if histogram else 0.0
+
+    def reset(self):
+        self._counters.clear()
+        self._histograms.clear()
+
+    def render(self) -> str:
+        """Everything recorded so far in the Prometheus text format."""
+        lines = []
+        described = set()
+
+        def describe(name: str):
+            if name in described:
+                return
+            described.add(name)
+            kind, text = _HELP.get(name, ("untyped", ""))
+            if text:
+                lines.append(f"# HELP {name} {text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        for (name, labels), value in sorted(self._counters.items()):
+            describe(name)
+            lines.append(f"{name}{_labels(labels)} {_number(value)}")
+
+        for (name, labels), histogram in sorted(self._histograms.items(), key=lambda kv: kv[0]):
+            describe(name)
+            cumulative = 0
+            for bound, count in zip(histogram.buckets, histogram.counts):
+                cumulative += count
+                lines.append(f"{name}_bucket{_labels(labels + (('le', _number(bound)),))} {cumulative}")
+            lines.append(f"{name}_bucket{_labels(labels + (('le', '+Inf'),))} {histogram.count}")
+            lines.append(f"{name}_sum{_labels(labels)} {_number(histogram.sum)}")
+            lines.append(f"{name}_count{_labels(labels)} {histogram.count}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels: tuple) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels) + "}"
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+# ── Process-wide registry ────────────────────────────────────────────
+metrics = MetricsRegistry()
+
+
+def instrumented(fn):
+    """
+    Record calls, errors, latency and result size for an async MCP tool.
+
+    Apply *below* ``@mcp.tool()`` so FastMCP registers the wrapper; the
+    signature and docstring are preserved via `functools.wraps`.  Tools
+    report failures as ``"Error: ..."`` strings, which count as errors.
+    """
+    tool = fn.__name__
+
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            result = await fn(*args, **kwargs)
+        except Exception:
+            metrics.inc("unreal_mcp_tool_calls_total", tool=tool)
+            metrics.inc("unreal_mcp_tool_errors_total", tool=tool)
+            metrics.observe("unreal_mcp_tool_duration_seconds", time.perf_counter() - started, tool=tool)
+            raise
+
+        metrics.inc("unreal_mcp_tool_calls_total", tool=tool)
+        metrics.observe("unreal_mcp_tool_duration_seconds", time.perf_counter() - started, tool=tool)
+        if isinstance(result, str):
+            metrics.observe("unreal_mcp_tool_response_bytes", len(result.encode()), SIZE_BUCKETS, tool=tool)
+            if result.startswith("Error:"):
+                metrics.inc("unreal_mcp_tool_errors_total", tool=tool)
+        return result
+
+    return wrapper
@@ -46,6 +46,140 @@ def format_actor_list(actors: list[str]) -> str:
     return "Actors in level:\n" + "\n".join(lines)
 
 
+def format_actor_page(
+    actors: list[str],
+    start: int,
+    total: int,
+    version: int,
+    next_cursor: str | None,
+) -> str:
+    """
+    Format one page of a (filtered) actor listing.
+
+    Args:
+        actors:      The actor paths on this page.
+        start:       Index of the first actor on this page.
+        total:       Number of actors matching the filters.
+        version:     Snapshot version the page was served from.
+        next_cursor: Cursor for the following page, or None if this is the last.
+
+    Returns:
+        `format_actor_list()` output followed by a paging footer.
+    """
+    if not actors:
+        return f"No matching actors (snapshot v{version}, {total} total)."
+
+    footer = f"Showing {start + 1}-{start + len(actors)} of {total} matching actors (snapshot v{version})."
+    if next_cursor:
+        footer += f" More available: call again with cursor=\"{next_cursor}\"."
+    return format_actor_list(actors) + "\n" + footer
+
+
+def format_actor_changes(
+    added: list[str],
+    removed: list[str],
+    since_version: int,
+    version: int,
+    max_lines: int = 200,
+) -> str:
+    """
+    Format the actors added / removed between two snapshot versions.
+
+    Args:
+        added:         Actor paths that appeared.
+        removed:       Actor paths that disappeared.
+        since_version: The version the caller already knew.
+        version:       The current version (the caller's next token).
+        max_lines:     Cap on listed actors; the counts are always exact.
+
+    Returns:
+        A summary line and one ``+``/``-`` line per changed actor.
+    """
+    header = f"Changes since v{since_version} -> now v{version}: +{len(added)} added, -{len(removed)} removed."
+    if not added and not removed:
+        return header
+
+    lines = [header]
+    lines += [f"+ {a.split('.')[-1]} (Path: {a})" for a in added[:max_lines]]
+    shown = len(lines) - 1
+    lines += [f"- {a.split('.')[-1]} (Path: {a})" for a in removed[:max(0, max_lines - shown)]]
+    hidden = len(added) + len(removed) - (len(lines) - 1)
+    if hidden > 0:
+        lines.append(f"... and {hidden} more (use list_actors with filters to inspect them).")
+    return "\n".join(lines)
+
+
+def format_nearby_actors(hits: list[tuple[str, float]], x: float, y: float, z: float) -> str:
+    """
+    Format ``(actor_path, distance)`` pairs from a proximity query.
+
+    Returns:
+        One line per actor, nearest first, or a "none found" message.
+    """
+    if not hits:
+        return f"No actors found near {x}, {y}, {z}."
+
+    lines = [f"{a.split('.')[-1]} (Path: {a}) at {d:.1f} units" for a, d in hits]
+    return f"Actors near {x}, {y}, {z}:\n" + "\n".join(lines)
+
+
+def format_batch_results(calls: list[dict], results: list[dict]) -> str:
+    """
+    Format per-call results from `send_ue_ws_batch()` into readable output.
+
+    Args:
+        calls:   The calls that were sent (for the function names).
+        results: The matching results, in the same order.
+
+    Returns:
+        A summary line followed by one line per call, e.g.
+            [0] SpawnActorFromObject OK -> /Game/...StaticMeshActor_3
+            [1] SetActorScale3D Error: Object not found
+    """
+    ok_count = sum(1 for r in results if r["ok"])
+    lines = [f"Batch: {ok_count}/{len(results)} calls succeeded."]
+
+    for i, (call, result) in enumerate(zip(calls, results)):
+        name = call.get("function_name", "?")
+        if result["ok"]:
+            value = extract_return_value(result["response"])
+            suffix = f" -> {value}" if value not in (None, [], {}, "") else ""
+            lines.append(f"[{i}] {name} OK{suffix}")
+        else:
+            lines.append(f"[{i}] {name} Error: {result['error']}")
+
+    return "\n".join(lines)
+
+
+def format_script_results(template: str, results: list[dict], dry_run: bool = False, max_lines: int = 50) -> str:
+    """
+    Format per-actor results of a script template run.
+
+    Returns:
+        A summary line followed by one line per actor (at most
+        `max_lines`), e.g.
+            Cube_0 OK scale=[1.42, 1.42, 1.42]
+            Cube_1 Error: Actor is locked
+    """
+    if not results:
+        return f"{template}: no actors matched."
+
+    ok_count = sum(1 for r in results if r.get("ok"))
+    verb = "would change" if dry_run else "changed"
+    lines = [f"{template}: {verb} {ok_count}/{len(results)} actors in one editor call."]
+    # Failures first so they survive the cut
+    for r in sorted(results, key=lambda r: bool(r.get("ok")))[:max_lines]:
+        name = r.get("actor", "?").split(".")[-1]
+        if r.get("ok"):
+            values = " ".join(f"{k}={v}" for k, v in r.items() if k not in ("actor", "ok"))
+            lines.append(f"{name} OK {values}".rstrip())
+        else:
+            lines.append(f"{name} Error: {r.get('error', 'unknown error')}")
+    if len(results) > max_lines:
+        lines.append(f"... and {len(results) - max_lines} more.")
+    return "\n".join(lines)
+
+
 def format_error(error: Exception, tip: str = "") -> str:
     """
     Build a standardised error message with an optional troubleshooting tip.
@@ -0,0 +1,51 @@
+"""
+Startup Timing — where a process's cold start goes.
+
+`StartupTimer` times the named phases of an entry point and records
+the modules each phase imported, grouped by top-level package: a
+coarse, always-available ``python -X importtime``.
+
+Usage:
+    timer = StartupTimer()
+    with timer.phase("import FastMCP + tools"):
+        from unreal_mcp import mcp
+    print(timer.report())
+
+`server.py` and `agent.py` print the report with ``--startup-report``.
+"""
+
+import sys
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+
+class StartupTimer:
+    """Wall time and new modules per startup phase."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases: list[tuple[str, float, list[str]]] = []
+
+    @contextmanager
+    def phase(self, name: str):
+        before = set(sys.modules)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            imported = [module for module in sys.modules if module not in before]
+            self.phases.append((name, time.perf_counter() - started, imported))
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def report(self, packages: int = 4) -> str:
+        """One line per phase: ms, modules imported and the biggest packages."""
+        lines = ["🚀 Startup:"]
+        for name, seconds, imported in self.phases:
+            by_package = Counter(module.split(".")[0] for module in imported)
+            top = ", ".join(f"{package}×{n}" for package, n in by_package.most_common(packages))
+            lines.append(f"   {seconds * 1000:8.1f} ms  {name:30s} +{len(imported):4d} modules  {top}")
+        lines.append(f"   {self.elapsed() * 1000:8.1f} ms  total")
+        return "\n".join(lines)